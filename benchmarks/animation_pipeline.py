@@ -0,0 +1,109 @@
+"""
+Time to first frame with and without pipelined planning.
+
+The stub streams an 8-frame animation plan over about one second, and each
+"image" takes 300 ms. Sequential waits for the complete plan before the first
+image; pipelined starts frame 1 as soon as the planner has closed it, then
+checks every generated frame against the final plan.
+
+Run with: python -m benchmarks.animation_pipeline
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncGenerator
+
+from src.LLM import OllamaModels, StructuredUpdate
+from src.LLM.constants import OLLAMA_HOSTS_ENV, RESPONSE_CACHE_MODE_ENV
+from src.minigames.animation_generator.plan_stream import StreamingPlan
+from src.minigames.animation_generator.prompt_builder import (
+    AnimationFramePlan,
+    AnimationPlanResponse,
+    stream_animation_plan,
+)
+
+from .stub_server import BackgroundStubServer, StubServerConfig
+
+FRAMES = 8
+PLAN_CHUNKS = 40
+CHUNK_DELAY = 0.025
+IMAGE_SECONDS = 0.3
+MODEL = OllamaModels.QWEN_3_5_9B
+
+
+def _plan_text() -> str:
+    return AnimationPlanResponse(
+        animation_summary="A seed sprouts and opens into a flower.",
+        combined_prompt="A single seed in dark soil, soft studio light, macro lens.",
+        continuity_rules=["Keep the camera locked."],
+        frames=[
+            AnimationFramePlan(
+                frame_number=index + 1,
+                motion_beat=f"Stage {index + 1}",
+                frame_prompt=f"The sprout at growth stage {index + 1}.",
+            )
+            for index in range(FRAMES)
+        ],
+    ).model_dump_json()
+
+
+def _stream() -> AsyncGenerator[StructuredUpdate | AnimationPlanResponse, None]:
+    return stream_animation_plan("a seed growing", None, FRAMES, MODEL)
+
+
+async def _generate_frames(plan: StreamingPlan, start: float) -> tuple[float, float, list[str]]:
+    first_frame = 0.0
+    generated: list[AnimationFramePlan] = []
+    async for frame in plan.frames_as_ready():
+        await asyncio.sleep(IMAGE_SECONDS)
+        generated.append(frame)
+        if len(generated) == 1:
+            first_frame = time.perf_counter() - start
+    return first_frame, time.perf_counter() - start, plan.consistency_problems(generated)
+
+
+async def _sequential() -> tuple[float, float, list[str]]:
+    start = time.perf_counter()
+    plan: AnimationPlanResponse | None = None
+    async for update in _stream():
+        if isinstance(update, AnimationPlanResponse):
+            plan = update
+    assert plan is not None
+    return await _generate_frames(StreamingPlan.completed(plan), start)
+
+
+async def _pipelined() -> tuple[float, float, list[str]]:
+    start = time.perf_counter()
+    plan = StreamingPlan(FRAMES)
+    planner = asyncio.create_task(plan.consume(_stream()))
+    await plan.wait_for_combined_prompt()
+    first_frame, total, _ = await _generate_frames(plan, start)
+    await planner
+    return first_frame, total, plan.consistency_problems(plan.frames)
+
+
+async def main() -> None:
+    config = StubServerConfig(
+        reply_text=_plan_text(),
+        split_reply=True,
+        stream_chunks=PLAN_CHUNKS,
+        chunk_delay=CHUNK_DELAY,
+    )
+    with BackgroundStubServer(config) as stub:
+        os.environ[OLLAMA_HOSTS_ENV] = stub.base_url
+        os.environ[RESPONSE_CACHE_MODE_ENV] = "off"
+
+        print(
+            f"{FRAMES} frames, plan streamed over {PLAN_CHUNKS * CHUNK_DELAY:.1f} s, "
+            f"{IMAGE_SECONDS * 1000:.0f} ms per image"
+        )
+        print(f"{'mode':>10} {'first frame s':>13} {'total s':>8}  final check")
+        for name, run in (("sequential", _sequential), ("pipelined", _pipelined)):
+            first_frame, total, problems = await run()
+            check = "; ".join(problems) if problems else "passed"
+            print(f"{name:>10} {first_frame:>13.2f} {total:>8.2f}  {check}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
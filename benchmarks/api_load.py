@@ -0,0 +1,176 @@
+"""
+Load test of the HTTP API (`main.py api`): one-shot /ask at rising
+concurrency, then streaming chat turns over server-sent events.
+
+The server runs in its own process against the stub, which takes 50 ms per
+answer. The API runs 8 requests at once, so throughput tops out below 160
+requests/s (about 120 here) and more concurrency only adds queueing. Beyond the API's
+request queue (8 running, 64 waiting)
+requests are turned away with a 503 instead of queueing without bound;
+they are counted as rejected and left out of the latencies. Pass --url to
+load an API that is already running (e.g. one backed by real models).
+
+Run with: python -m benchmarks.api_load [--url http://127.0.0.1:8765]
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+
+from src.constants import API_COMMAND
+from src.LLM.constants import OLLAMA_HOSTS_ENV, RESPONSE_CACHE_MODE_ENV
+from src.LLM.providers.scheduling import percentile
+
+from .stub_server import BackgroundStubServer, StubServerConfig
+
+RESPONSE_DELAY = 0.05
+ASK_REQUESTS = 200
+ASK_CONCURRENCY = (1, 8, 32, 128)
+CHAT_SESSIONS = 16
+CHAT_TURNS = 5
+MAIN = str(Path(__file__).resolve().parent.parent / "main.py")
+
+
+@dataclass
+class LoadResult:
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    # Seconds until the first streamed chunk, for SSE chat turns.
+    first_event: list[float] = field(default_factory=list)
+    rejected: int = 0
+    failed: int = 0
+
+    def format_row(self, name: str) -> str:
+        ms = [percentile(self.latencies, p) * 1000 for p in (0.5, 0.95, 0.99)]
+        rate = len(self.latencies) / self.elapsed if self.elapsed else 0.0
+        return (
+            f"{name:>14} {rate:>8.1f} {ms[0]:>8.1f} {ms[1]:>8.1f} {ms[2]:>8.1f} "
+            f"{self.rejected:>8} {self.failed:>6}"
+        )
+
+
+HEADER = (
+    f"{'':>14} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'rejected':>8} "
+    f"{'failed':>6}"
+)
+
+
+async def _run(
+    requests: int, concurrency: int, send: Callable[[int, LoadResult], Awaitable[None]]
+) -> LoadResult:
+    result = LoadResult()
+    indices = iter(range(requests))
+
+    async def worker() -> None:
+        for index in indices:
+            await send(index, result)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _record(result: LoadResult, status: int, start: float) -> None:
+    if status == 200:
+        result.latencies.append(time.perf_counter() - start)
+    elif status in (429, 503):
+        result.rejected += 1
+    else:
+        result.failed += 1
+
+
+async def _ask_load(client: httpx.AsyncClient, concurrency: int) -> LoadResult:
+    async def send(index: int, result: LoadResult) -> None:
+        start = time.perf_counter()
+        response = await client.post("/ask", json={"question": f"Question {index}?"})
+        _record(result, response.status_code, start)
+
+    return await _run(ASK_REQUESTS, concurrency, send)
+
+
+async def _chat_load(client: httpx.AsyncClient) -> LoadResult:
+    sessions = []
+    for _ in range(CHAT_SESSIONS):
+        response = await client.post("/sessions", json={"system": "Answer briefly."})
+        sessions.append(response.json()["session_id"])
+
+    async def send(index: int, result: LoadResult) -> None:
+        # Worker i always drives session i, so turns within a session never overlap.
+        session_id = sessions[index % CHAT_SESSIONS]
+        start = time.perf_counter()
+        first_delta = None
+        body = {"message": f"Turn {index // CHAT_SESSIONS}"}
+        async with client.stream("POST", f"/sessions/{session_id}/chat", json=body) as response:
+            status = response.status_code
+            async for line in response.aiter_lines():
+                if first_delta is None and line == "event: delta":
+                    first_delta = time.perf_counter() - start
+                elif line == "event: error":
+                    status = 500
+        if first_delta is not None:
+            result.first_event.append(first_delta)
+        _record(result, status, start)
+
+    result = await _run(CHAT_SESSIONS * CHAT_TURNS, CHAT_SESSIONS, send)
+    for session_id in sessions:
+        await client.delete(f"/sessions/{session_id}")
+    return result
+
+
+async def _load(base_url: str) -> None:
+    limits = httpx.Limits(max_connections=max(ASK_CONCURRENCY), max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        await client.post("/ask", json={"question": "warm up"})
+        print(f"POST /ask, {ASK_REQUESTS} requests per row")
+        print(HEADER)
+        for concurrency in ASK_CONCURRENCY:
+            result = await _ask_load(client, concurrency)
+            print(result.format_row(f"concurrency {concurrency}"))
+
+        print(f"\nPOST /sessions/<id>/chat (SSE), {CHAT_SESSIONS} sessions x {CHAT_TURNS} turns")
+        print(HEADER)
+        result = await _chat_load(client)
+        print(result.format_row("chat turns"))
+        first = [percentile(result.first_event, p) * 1000 for p in (0.5, 0.95, 0.99)]
+        print(f"{'first delta':>14} {'':>8} {first[0]:>8.1f} {first[1]:>8.1f} {first[2]:>8.1f}")
+
+
+@contextmanager
+def _local_api() -> Iterator[str]:
+    """The stub plus `main.py api` on a free port; yields the API's URL."""
+    with BackgroundStubServer(StubServerConfig(response_delay=RESPONSE_DELAY)) as stub:
+        env = {**os.environ, OLLAMA_HOSTS_ENV: stub.base_url, RESPONSE_CACHE_MODE_ENV: "off"}
+        server = subprocess.Popen(
+            [sys.executable, MAIN, API_COMMAND, "--port", "0"],
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            # "API listening on <url> (Ctrl+C to stop)"
+            banner = server.stdout.readline() if server.stdout else ""
+            yield banner.split()[3]
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def main() -> None:
+    if "--url" in sys.argv:
+        asyncio.run(_load(sys.argv[sys.argv.index("--url") + 1]))
+        return
+    with _local_api() as base_url:
+        asyncio.run(_load(base_url))
+
+
+if __name__ == "__main__":
+    main()
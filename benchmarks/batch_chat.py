@@ -0,0 +1,67 @@
+"""
+Throughput of 200 independent prompts: a hand-written loop versus chat_many.
+
+The stub "GPU" runs four requests at a time, 50 ms each. The loop waits for
+every answer before sending the next prompt. chat_many keeps up to 8 calls
+queued at batch priority, and the scheduler lets 3 of them run at once,
+keeping the fourth slot free for interactive calls.
+
+Run with: python -m benchmarks.batch_chat
+"""
+
+import asyncio
+import time
+
+from src.LLM import HumanMessage, chat_many, chat_non_stream_no_tool
+from src.LLM.providers.impl.ollama import OllamaProvider
+from src.LLM.providers.impl.ollama_client import OllamaClientConfig
+from src.LLM.providers.scheduling import SchedulerConfig
+from src.LLM.providers.usage import BatchProgress
+
+from .stub_server import STUB_MODEL, BackgroundStubServer, StubServerConfig
+
+PROMPTS = 200
+RESPONSE_DELAY = 0.05
+SERVER_PARALLELISM = 4
+CONCURRENCY = 8
+SCHEDULER = SchedulerConfig(
+    max_concurrent=SERVER_PARALLELISM,
+    max_concurrent_per_model=SERVER_PARALLELISM,
+    reserved_interactive_slots=1,
+)
+
+
+def _print_progress(progress: BatchProgress) -> None:
+    if progress.done % 50 == 0:
+        print(f"  {progress.done}/{progress.total} done after {progress.elapsed:.2f} s")
+
+
+async def main() -> None:
+    config = StubServerConfig(response_delay=RESPONSE_DELAY, max_parallel=SERVER_PARALLELISM)
+    with BackgroundStubServer(config) as stub:
+        provider = OllamaProvider(
+            STUB_MODEL, OllamaClientConfig(host=stub.base_url), scheduler_config=SCHEDULER
+        )
+        conversations = [
+            [HumanMessage(content=f"Enhance logo prompt {index}.")] for index in range(PROMPTS)
+        ]
+
+        start = time.perf_counter()
+        for messages in conversations:
+            await chat_non_stream_no_tool(provider, messages)
+        loop_seconds = time.perf_counter() - start
+        print(f"loop: {PROMPTS} prompts in {loop_seconds:.2f} s, {PROMPTS / loop_seconds:.1f} requests/s")
+
+        print(f"chat_many (concurrency {CONCURRENCY}):")
+        report = await chat_many(
+            provider, conversations, concurrency=CONCURRENCY, on_progress=_print_progress
+        )
+        print(report.format_report())
+        in_order = all(item.index == index for index, item in enumerate(report.items))
+        print(f"results in input order: {in_order}, speedup {loop_seconds / report.elapsed:.1f}x")
+
+        await provider.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,109 @@
+"""
+Request-preparation cost of a 20-iteration tool loop over long histories.
+
+The previous path re-serialized the whole history and rebuilt the tool schema on
+every iteration. The buffered path keeps a ConversationBuffer and a
+CompiledToolset, so each iteration only serializes the two messages it appends.
+
+Run with: python -m benchmarks.conversation_buffer
+"""
+
+import time
+from collections.abc import Callable, Sequence
+
+from src.InfoGather.info_book import InfoBook
+from src.InfoGather.tools.get_field_info import GetFieldInfoTool
+from src.InfoGather.tools.lint_book_state import LintBookStateTool
+from src.InfoGather.tools.view_book import ViewBookTool
+from src.InfoGather.tools.write_field import WriteFieldTool
+from src.LLM import (
+    AgentTool,
+    AssistantMessage,
+    BaseMessage,
+    CompiledToolset,
+    ConversationBuffer,
+    HumanMessage,
+    SystemMessage,
+    ToolCall,
+    ToolMessage,
+    agent_tools_to_tools_and_handlers,
+)
+from src.LLM.providers.base.utils import build_tools_for_chat_format, transform_messages
+
+HISTORY_SIZES = (50, 200, 1000)
+LOOP_ITERATIONS = 20
+REPEATS = 5
+
+LoopRunner = Callable[[list[BaseMessage], list[AgentTool]], None]
+
+
+def _build_tools() -> list[AgentTool]:
+    book = InfoBook(goal="benchmark")
+    return [
+        WriteFieldTool(info_book=book),
+        ViewBookTool(info_book=book),
+        GetFieldInfoTool(info_book=book),
+        LintBookStateTool(info_book=book),
+    ]
+
+
+def _tool_turn(agent_tools: Sequence[AgentTool], index: int) -> list[BaseMessage]:
+    tool = agent_tools[index % len(agent_tools)].to_tool()
+    call = ToolCall(id=f"call-{index}", tool=tool, arguments={"field_name": f"f{index}"})
+    return [
+        AssistantMessage(content="", tool_calls=[call]),
+        ToolMessage(content=f"result {index}", tool_call_id=call.id, tool_name=tool.name),
+    ]
+
+
+def _build_history(size: int, agent_tools: list[AgentTool]) -> list[BaseMessage]:
+    history: list[BaseMessage] = [SystemMessage(content="You gather information.")]
+    index = 0
+    while len(history) < size:
+        history.append(HumanMessage(content=f"message {index} " * 20))
+        history.extend(_tool_turn(agent_tools, index))
+        index += 1
+    return history[:size]
+
+
+def _legacy_loop(history: list[BaseMessage], agent_tools: list[AgentTool]) -> None:
+    current = list(history)
+    for iteration in range(LOOP_ITERATIONS):
+        tools, _ = agent_tools_to_tools_and_handlers(agent_tools)
+        transform_messages(current)
+        build_tools_for_chat_format(tools)
+        current.extend(_tool_turn(agent_tools, iteration))
+
+
+def _buffered_loop(history: list[BaseMessage], agent_tools: list[AgentTool]) -> None:
+    current = ConversationBuffer(history)
+    toolset = CompiledToolset.compile(agent_tools)
+    for iteration in range(LOOP_ITERATIONS):
+        transform_messages(current)
+        current.extend(_tool_turn(toolset.agent_tools, iteration))
+
+
+def _best_of(runner: LoopRunner, history: list[BaseMessage], agent_tools: list[AgentTool]) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        runner(history, agent_tools)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    agent_tools = _build_tools()
+    print(f"{LOOP_ITERATIONS}-iteration loop, best of {REPEATS} (ms)")
+    print(f"{'history':>8} {'legacy':>9} {'buffered':>9} {'speedup':>8}")
+    for size in HISTORY_SIZES:
+        history = _build_history(size, agent_tools)
+        legacy = _best_of(_legacy_loop, history, agent_tools)
+        buffered = _best_of(_buffered_loop, history, agent_tools)
+        print(
+            f"{size:>8} {legacy * 1000:>9.2f} {buffered * 1000:>9.2f} {legacy / buffered:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Embedding a repetitive workload: one request per text versus embed().
+
+Twenty info-gathering sessions each embed the same system prompt and the same
+20 field descriptions, plus 5 texts of their own. The stub takes 10 ms per
+embedding request. embed() sends each distinct text once, 64 per request;
+the second pass is served from the memory-mapped vector cache, and a new
+store opened on the same directory finds every vector again.
+
+Run with: python -m benchmarks.embedding_cache
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+
+from src.LLM.constants import RESPONSE_CACHE_MODE_ENV
+from src.LLM.embeddings import VectorStore, get_shared_embedding_cache
+from src.LLM.providers.impl.ollama import OllamaProvider
+from src.LLM.providers.impl.ollama_client import OllamaClientConfig
+
+from .stub_server import STUB_MODEL, BackgroundStubServer, StubServerConfig
+
+SESSIONS = 20
+FIELDS = 20
+OWN_TEXTS = 5
+EMBED_DELAY = 0.01
+
+
+def _workload() -> list[str]:
+    shared = ["You are filling in a character sheet; ask one question at a time."]
+    shared += [f"Field {index}: a short description of attribute {index}." for index in range(FIELDS)]
+    texts = []
+    for session in range(SESSIONS):
+        texts += shared
+        texts += [f"Session {session} answer {index}" for index in range(OWN_TEXTS)]
+    return texts
+
+
+async def main() -> None:
+    texts = _workload()
+    config = StubServerConfig(embed_delay=EMBED_DELAY)
+    with BackgroundStubServer(config) as stub, tempfile.TemporaryDirectory() as cache_dir:
+        provider = OllamaProvider(STUB_MODEL, OllamaClientConfig(host=stub.base_url))
+        provider.embedding_cache_dir = cache_dir
+        print(f"{len(texts)} texts, {len(set(texts))} distinct, {EMBED_DELAY * 1000:.0f} ms per request")
+        print(f"{'path':>16} {'seconds':>8} {'texts sent':>11}")
+
+        async def run(name: str, embed: Callable[[], Awaitable[object]]) -> None:
+            before = stub.server.embedded_inputs
+            start = time.perf_counter()
+            await embed()
+            elapsed = time.perf_counter() - start
+            print(f"{name:>16} {elapsed:>8.3f} {stub.server.embedded_inputs - before:>11}")
+
+        async def one_per_text() -> None:
+            os.environ[RESPONSE_CACHE_MODE_ENV] = "off"
+            for text in texts:
+                await provider.embed([text])
+            os.environ.pop(RESPONSE_CACHE_MODE_ENV)
+
+        await run("one per text", one_per_text)
+        await run("embed() cold", lambda: provider.embed(texts))
+        await run("embed() warm", lambda: provider.embed(texts))
+
+        cache = get_shared_embedding_cache(cache_dir)
+        stats = cache.stats
+        reopened = VectorStore(cache.store(provider.embedding_model).directory)
+        print(f"cache hit rate {stats.hit_rate:.0%}, {stats.batches} batches sent")
+        print(f"reopened store holds {len(reopened)} vectors of dim {reopened.dim}")
+        reopened.close()
+        cache.close()
+        await provider.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""
+Tail latency with and without hedged requests.
+
+Two stub hosts answer in 20 ms, but every 25th request on each one stalls
+for 500 ms (a cold model load or a stuck GPU). The hedged provider sends a
+duplicate to the other host once a call passes the p95 of recent latencies.
+
+Run with: python -m benchmarks.hedging
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from src.LLM import HumanMessage
+from src.LLM.providers import BaseProvider
+from src.LLM.providers.hedging import HedgedProvider, HedgePolicy
+from src.LLM.providers.impl.ollama import OllamaProvider
+from src.LLM.providers.impl.ollama_client import OllamaClientConfig
+from src.LLM.providers.scheduling import UNLIMITED_SCHEDULER_CONFIG, percentile
+
+from .stub_server import STUB_MODEL, BackgroundStubServer, StubServerConfig
+
+CALLS = 300
+RESPONSE_DELAY = 0.02
+SLOW_EVERY = 25
+SLOW_DELAY = 0.5
+POLICY = HedgePolicy(initial_delay=0.1, min_samples=20)
+
+
+def _provider(host: str) -> OllamaProvider:
+    return OllamaProvider(
+        STUB_MODEL,
+        OllamaClientConfig(host=host),
+        scheduler_config=UNLIMITED_SCHEDULER_CONFIG,
+    )
+
+
+def _chat_call(provider: BaseProvider) -> Callable[[], Awaitable[object]]:
+    messages = [HumanMessage(content="hi")]
+
+    async def call() -> object:
+        return await provider.chat(messages)
+
+    return call
+
+
+def _first_chunk_call(provider: BaseProvider) -> Callable[[], Awaitable[object]]:
+    messages = [HumanMessage(content="hi")]
+
+    async def call() -> object:
+        stream = provider.stream(messages)
+        try:
+            return await anext(stream)
+        finally:
+            await stream.aclose()
+
+    return call
+
+
+async def _measure(call: Callable[[], Awaitable[object]]) -> list[float]:
+    latencies = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _report(name: str, latencies: list[float], sent: int) -> None:
+    print(
+        f"{name:>20} {percentile(latencies, 0.5) * 1000:>7.1f} "
+        f"{percentile(latencies, 0.95) * 1000:>7.1f} {percentile(latencies, 0.99) * 1000:>7.1f} "
+        f"{sent / CALLS:>9.2f}"
+    )
+
+
+async def main() -> None:
+    configs = [
+        StubServerConfig(
+            response_delay=RESPONSE_DELAY, slow_every=SLOW_EVERY, slow_delay=SLOW_DELAY
+        )
+        for _ in range(2)
+    ]
+    with BackgroundStubServer(configs[0]) as first, BackgroundStubServer(configs[1]) as second:
+        stubs = (first, second)
+        primary = _provider(first.base_url)
+        backup = _provider(second.base_url)
+
+        print(f"{CALLS} sequential calls; every {SLOW_EVERY}th per host stalls {SLOW_DELAY * 1000:.0f} ms")
+        print(f"{'path':>20} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'sent/call':>9}")
+        for kind, make_call in (("chat", _chat_call), ("first chunk", _first_chunk_call)):
+            hedged = HedgedProvider(primary, backup, POLICY)
+            for name, provider in ((f"{kind}, single", primary), (f"{kind}, hedged", hedged)):
+                before = sum(stub.server.chat_request_count for stub in stubs)
+                latencies = await _measure(make_call(provider))
+                sent = sum(stub.server.chat_request_count for stub in stubs) - before
+                _report(name, latencies, sent)
+            print(f"{'':>20} {hedged.stats.format_report()}")
+
+        await primary.aclose()
+        await backup.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
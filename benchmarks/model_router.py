@@ -0,0 +1,93 @@
+"""
+Structured-extraction latency with a fixed model and with the model router.
+
+The stub serves the extraction candidates at different speeds: the most
+capable one takes 400 ms, the mid-size one 60 ms, and the smallest is not
+pulled (404). With a 150 ms budget the router measures the big model once,
+moves to the mid-size one, routes around the missing one, and re-checks the
+big model every 20 calls.
+
+Run with: python -m benchmarks.model_router
+"""
+
+import asyncio
+import os
+import time
+from collections import Counter
+
+from src.LLM import HumanMessage, OllamaModels
+from src.LLM.constants import OLLAMA_HOSTS_ENV
+from src.LLM.providers import BaseProvider
+from src.LLM.providers.impl.ollama import OllamaProvider
+from src.LLM.providers.impl.ollama_client import OllamaClientConfig
+from src.LLM.providers.scheduling import UNLIMITED_SCHEDULER_CONFIG, percentile
+from src.LLM.routing import CallType, ModelRouter, RoutedProvider, RoutingConfig
+
+from .stub_server import BackgroundStubServer, StubServerConfig
+
+CALLS = 100
+BUDGET = 0.15
+MODEL_DELAYS = {
+    OllamaModels.QWEN_3_5_4B.value: 0.4,
+    OllamaModels.GEMMA_4B.value: 0.06,
+}
+MISSING = [OllamaModels.GEMMA_1B.value]
+ROUTING = RoutingConfig(
+    candidates={
+        CallType.STRUCTURED_EXTRACTION: (
+            OllamaModels.QWEN_3_5_4B,
+            OllamaModels.GEMMA_1B,
+            OllamaModels.GEMMA_4B,
+        ),
+        CallType.FREE_CHAT: (OllamaModels.GEMMA_4B,),
+        CallType.PLANNING: (OllamaModels.GEMMA_4B,),
+        CallType.VISION: (OllamaModels.GEMMA_4B,),
+    },
+    explore_every=20,
+)
+
+
+async def _measure(provider: BaseProvider) -> list[float]:
+    messages = [HumanMessage(content="Which fields can be read off this conversation?")]
+    latencies = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        await provider.chat(messages)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    print(
+        f"{name:>8} {percentile(latencies, 0.5) * 1000:>7.1f} "
+        f"{percentile(latencies, 0.95) * 1000:>7.1f} {sum(latencies):>7.2f}"
+    )
+
+
+async def main() -> None:
+    config = StubServerConfig(model_delays=MODEL_DELAYS, missing_models=MISSING)
+    with BackgroundStubServer(config) as stub:
+        os.environ[OLLAMA_HOSTS_ENV] = stub.base_url
+        fixed = OllamaProvider(
+            OllamaModels.QWEN_3_5_4B,
+            OllamaClientConfig(host=stub.base_url),
+            scheduler_config=UNLIMITED_SCHEDULER_CONFIG,
+        )
+        router = ModelRouter(ROUTING)
+        routed = RoutedProvider(CallType.STRUCTURED_EXTRACTION, BUDGET, router)
+
+        print(f"{CALLS} extraction calls, budget {BUDGET * 1000:.0f} ms")
+        print(f"{'path':>8} {'p50 ms':>7} {'p95 ms':>7} {'total s':>7}")
+        _report("fixed", await _measure(fixed))
+        _report("routed", await _measure(routed))
+
+        mix = Counter({model.value: n for (_, model), n in router.decisions.items()})
+        print("routed to: " + ", ".join(f"{name} x{n}" for name, n in mix.most_common()))
+        print("unavailable: " + ", ".join(sorted(m.value for m in router.unavailable)))
+
+        await fixed.aclose()
+        await routed.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""
+Spread load over several stub Ollama hosts with BalancedOllamaProvider.
+
+Compares throughput against a single host, checks that a host without the
+model only starts taking requests once the loaded hosts are busy, then stops
+one host to show requests failing over without errors reaching the caller.
+
+Run with: python -m benchmarks.ollama_pool
+"""
+
+import asyncio
+import time
+from collections import Counter
+
+from src.LLM import HumanMessage
+from src.LLM.providers.impl.ollama import OllamaProvider
+from src.LLM.providers.impl.ollama_balanced import BalancedOllamaProvider
+from src.LLM.providers.impl.ollama_client import OllamaClientConfig
+from src.LLM.providers.impl.ollama_pool import OllamaPoolConfig
+from src.LLM.providers.scheduling import UNLIMITED_SCHEDULER_CONFIG
+
+from .stub_server import STUB_MODEL, BackgroundStubServer, StubServerConfig
+
+HOSTS = 3
+SERVER_PARALLELISM = 2
+RESPONSE_DELAY = 0.05
+CONCURRENCY = 12
+REQUESTS = 240
+PROBE_INTERVAL = 0.2
+
+
+async def _drive(provider: OllamaProvider, stream: bool) -> tuple[float, int]:
+    messages = [HumanMessage(content="hi")]
+    remaining = REQUESTS
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            try:
+                if stream:
+                    async for _ in provider.stream(messages):
+                        pass
+                else:
+                    await provider.chat(messages)
+            except Exception:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    return REQUESTS / (time.perf_counter() - start), errors
+
+
+async def main() -> None:
+    configs = [
+        StubServerConfig(response_delay=RESPONSE_DELAY, max_parallel=SERVER_PARALLELISM)
+        for _ in range(HOSTS)
+    ]
+    # The last host has nothing loaded, so it only takes overflow; once it has
+    # served the model it counts as loaded and shares the load evenly.
+    configs[-1].loaded_models = []
+    stubs = [BackgroundStubServer(config) for config in configs]
+    live_stubs = list(stubs)
+    for stub in stubs:
+        stub.__enter__()
+    try:
+        hosts = tuple(stub.base_url for stub in stubs)
+        single = OllamaProvider(
+            STUB_MODEL,
+            OllamaClientConfig(host=hosts[0]),
+            scheduler_config=UNLIMITED_SCHEDULER_CONFIG,
+        )
+        balanced = BalancedOllamaProvider(
+            STUB_MODEL,
+            OllamaPoolConfig(hosts=hosts, probe_interval=PROBE_INTERVAL),
+            scheduler_config=UNLIMITED_SCHEDULER_CONFIG,
+        )
+
+        print(f"{REQUESTS} requests, {CONCURRENCY} concurrent, {HOSTS} hosts x {SERVER_PARALLELISM} slots")
+        print(f"{'path':>22} {'req/s':>8} {'errors':>7}  per-host requests")
+        for name, provider, stream, stop_first_host in (
+            ("single host", single, False, False),
+            ("balanced", balanced, False, False),
+            ("balanced stream", balanced, True, False),
+            ("balanced, host 0 down", balanced, False, True),
+        ):
+            if stop_first_host:
+                stubs[0].__exit__(None, None, None)
+                live_stubs.remove(stubs[0])
+            before = [stub.server.chat_request_count for stub in stubs]
+            rate, errors = await _drive(provider, stream)
+            served = Counter(
+                {i: stub.server.chat_request_count - before[i] for i, stub in enumerate(stubs)}
+            )
+            print(f"{name:>22} {rate:>8.1f} {errors:>7}  {dict(sorted(served.items()))}")
+
+        health = [
+            f"{endpoint.host}: {'up' if endpoint.healthy else 'down'}"
+            for endpoint in balanced.pool.endpoints
+        ]
+        print("Host health: " + ", ".join(health))
+
+        await single.aclose()
+        await balanced.aclose()
+    finally:
+        for stub in live_stubs:
+            stub.__exit__(None, None, None)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
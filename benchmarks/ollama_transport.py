@@ -0,0 +1,84 @@
+"""
+Compare the pooled async Ollama transport with the previous to_thread path.
+
+Run with: python -m benchmarks.ollama_transport
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import ollama
+
+from src.LLM import HumanMessage
+from src.LLM.providers.impl.ollama import OllamaProvider
+from src.LLM.providers.impl.ollama_client import OllamaClientConfig
+from src.LLM.providers.scheduling import UNLIMITED_SCHEDULER_CONFIG
+
+from .stub_server import STUB_MODEL, BackgroundStubServer, StubServerConfig
+
+CONCURRENCY_LEVELS = [1, 16, 128]
+REQUESTS_PER_WORKER = 4
+STUB_RESPONSE_DELAY = 0.05
+
+
+async def _run_concurrent(concurrency: int, call: Callable[[], Awaitable[Any]]) -> float:
+    async def worker() -> None:
+        for _ in range(REQUESTS_PER_WORKER):
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start
+
+
+def _thread_call(client: ollama.Client) -> Callable[[], Awaitable[Any]]:
+    messages = [{"role": "user", "content": "hi"}]
+
+    async def call() -> Any:
+        return await asyncio.to_thread(client.chat, model=STUB_MODEL, messages=messages)
+
+    return call
+
+
+def _pooled_call(provider: OllamaProvider) -> Callable[[], Awaitable[Any]]:
+    messages = [HumanMessage(content="hi")]
+
+    async def call() -> Any:
+        return await provider.chat(messages)
+
+    return call
+
+
+async def main() -> None:
+    config = StubServerConfig(response_delay=STUB_RESPONSE_DELAY)
+    with BackgroundStubServer(config) as stub:
+        thread_client = ollama.Client(host=stub.base_url)
+        # Unlimited scheduling, so this measures the transport alone.
+        provider = OllamaProvider(
+            STUB_MODEL,
+            OllamaClientConfig(host=stub.base_url),
+            scheduler_config=UNLIMITED_SCHEDULER_CONFIG,
+        )
+
+        await _thread_call(thread_client)()
+        await _pooled_call(provider)()
+
+        print(f"{'concurrency':>12} {'to_thread req/s':>16} {'pooled req/s':>14} {'speedup':>8}")
+        for concurrency in CONCURRENCY_LEVELS:
+            total = concurrency * REQUESTS_PER_WORKER
+            thread_time = await _run_concurrent(concurrency, _thread_call(thread_client))
+            pooled_time = await _run_concurrent(concurrency, _pooled_call(provider))
+            print(
+                f"{concurrency:>12} {total / thread_time:>16.1f} {total / pooled_time:>14.1f} "
+                f"{thread_time / pooled_time:>7.2f}x"
+            )
+
+        thread_client.close()
+        await provider.aclose()
+        print(f"Stub server connections opened: {stub.server.connection_count}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
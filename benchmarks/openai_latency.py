@@ -0,0 +1,89 @@
+"""
+Per-call latency of OpenAIProvider.chat against an OpenAI-compatible stub server.
+
+The previous path ran each request through asyncio.run inside asyncio.to_thread.
+Reusing one AsyncOpenAI client across those throwaway loops fails on alternate
+calls ("Event loop is closed"), so the baseline here builds a client per call,
+which is the cheapest way that path works at all.
+
+Run with: python -m benchmarks.openai_latency
+"""
+
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from openai import AsyncOpenAI
+
+from src.LLM import HumanMessage
+from src.LLM.providers.impl.openai import OpenAIProvider
+
+from .stub_server import STUB_MODEL, BackgroundStubServer, StubServerConfig
+
+SEQUENTIAL_CALLS = 200
+STUB_API_KEY = "stub-key"
+
+
+def _thread_loop_call(base_url: str) -> Callable[[], Awaitable[Any]]:
+    messages: list[Any] = [{"role": "user", "content": "hi"}]
+
+    async def create() -> Any:
+        async with AsyncOpenAI(api_key=STUB_API_KEY, base_url=base_url) as client:
+            return await client.chat.completions.create(model=STUB_MODEL, messages=messages)
+
+    def run_in_fresh_loop() -> Any:
+        return asyncio.run(create())
+
+    async def call() -> Any:
+        return await asyncio.to_thread(run_in_fresh_loop)
+
+    return call
+
+
+def _direct_call(provider: OpenAIProvider) -> Callable[[], Awaitable[Any]]:
+    messages = [HumanMessage(content="hi")]
+
+    async def call() -> Any:
+        return await provider.chat(messages)
+
+    return call
+
+
+async def _measure(call: Callable[[], Awaitable[Any]]) -> list[float]:
+    await call()
+    latencies = []
+    for _ in range(SEQUENTIAL_CALLS):
+        start = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2] * 1000
+    p95 = ordered[int(len(ordered) * 0.95)] * 1000
+    print(f"{name:>16} {statistics.mean(latencies) * 1000:>9.2f} {p50:>9.2f} {p95:>9.2f}")
+
+
+async def main() -> None:
+    with BackgroundStubServer(StubServerConfig()) as stub:
+        base_url = f"{stub.base_url}/v1"
+        provider = OpenAIProvider(STUB_MODEL, api_key=STUB_API_KEY, base_url=base_url)
+
+        print(f"{SEQUENTIAL_CALLS} sequential calls, zero server delay (ms)")
+        print(f"{'path':>16} {'mean':>9} {'p50':>9} {'p95':>9}")
+        thread_latencies = await _measure(_thread_loop_call(base_url))
+        direct_latencies = await _measure(_direct_call(provider))
+        _report("to_thread+run", thread_latencies)
+        _report("direct", direct_latencies)
+        saved = statistics.mean(thread_latencies) - statistics.mean(direct_latencies)
+        print(f"Per-call overhead removed: {saved * 1000:.2f} ms")
+
+        await provider.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""
+Stress N parallel OllamaProvider streams plus one deliberately slow consumer.
+
+Reports event-loop lag and how evenly chunks interleave across the fast
+streams, for the previous sync-iteration path and the bounded-queue bridge.
+
+Run with: python -m benchmarks.parallel_streams
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import ollama
+
+from src.LLM import HumanMessage
+from src.LLM.providers.impl.ollama import OllamaProvider
+from src.LLM.providers.impl.ollama_client import OllamaClientConfig
+from src.LLM.providers.scheduling import UNLIMITED_SCHEDULER_CONFIG
+
+from .stub_server import STUB_MODEL, BackgroundStubServer, StubServerConfig
+
+PARALLEL_STREAMS = 32
+CHUNKS_PER_STREAM = 64
+CHUNK_DELAY = 0.002
+SLOW_CONSUMER_DELAY = 0.02
+LAG_PROBE_INTERVAL = 0.005
+
+StreamFactory = Callable[[], AsyncIterator[Any]]
+
+
+def _legacy_stream(client: ollama.Client) -> StreamFactory:
+    messages = [{"role": "user", "content": "hi"}]
+
+    async def stream() -> AsyncIterator[Any]:
+        def start() -> Any:
+            return client.chat(model=STUB_MODEL, messages=messages, stream=True)
+
+        stream_sync = await asyncio.to_thread(start)
+        for chunk in stream_sync:
+            yield chunk
+
+    return stream
+
+
+def _bridged_stream(provider: OllamaProvider) -> StreamFactory:
+    messages = [HumanMessage(content="hi")]
+
+    async def stream() -> AsyncIterator[Any]:
+        async for chunk in provider.stream(messages):
+            yield chunk
+
+    return stream
+
+
+def _jain_fairness(counts: list[int]) -> float:
+    total = sum(counts)
+    squares = sum(c * c for c in counts)
+    return (total * total) / (len(counts) * squares) if squares else 1.0
+
+
+async def _probe_loop_lag(stop: asyncio.Event, samples: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(LAG_PROBE_INTERVAL)
+        samples.append(time.perf_counter() - start - LAG_PROBE_INTERVAL)
+
+
+async def _run(factory: StreamFactory) -> tuple[float, float, float]:
+    counts = [0] * PARALLEL_STREAMS
+    midpoint_counts: list[int] = []
+    total_expected = PARALLEL_STREAMS * CHUNKS_PER_STREAM
+    received = 0
+
+    async def fast_consumer(index: int) -> None:
+        nonlocal received, midpoint_counts
+        async for _ in factory():
+            counts[index] += 1
+            received += 1
+            if not midpoint_counts and received >= total_expected // 2:
+                midpoint_counts = list(counts)
+
+    async def slow_consumer() -> None:
+        async for _ in factory():
+            await asyncio.sleep(SLOW_CONSUMER_DELAY)
+
+    lag_samples: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe_loop_lag(stop, lag_samples))
+    start = time.perf_counter()
+    await asyncio.gather(slow_consumer(), *(fast_consumer(i) for i in range(PARALLEL_STREAMS)))
+    duration = time.perf_counter() - start
+    stop.set()
+    await probe
+
+    return duration, max(lag_samples, default=0.0), _jain_fairness(midpoint_counts or counts)
+
+
+async def main() -> None:
+    config = StubServerConfig(stream_chunks=CHUNKS_PER_STREAM, chunk_delay=CHUNK_DELAY)
+    with BackgroundStubServer(config) as stub:
+        client = ollama.Client(host=stub.base_url)
+        # Unlimited scheduling, so this measures the transport alone.
+        provider = OllamaProvider(
+            STUB_MODEL,
+            OllamaClientConfig(host=stub.base_url),
+            scheduler_config=UNLIMITED_SCHEDULER_CONFIG,
+        )
+
+        print(f"{PARALLEL_STREAMS} fast streams + 1 slow consumer, {CHUNKS_PER_STREAM} chunks each")
+        print(f"{'path':>10} {'wall s':>8} {'max loop lag ms':>16} {'fairness':>9}")
+        for name, factory in (
+            ("legacy", _legacy_stream(client)),
+            ("bridged", _bridged_stream(provider)),
+        ):
+            duration, max_lag, fairness = await _run(factory)
+            print(f"{name:>10} {duration:>8.2f} {max_lag * 1000:>16.1f} {fairness:>9.3f}")
+
+        client.close()
+        await provider.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+"""
+Per-turn latency of default_execute_tool_calls when one assistant turn carries
+several I/O-bound tool calls, with the tool marked serial and concurrency-safe.
+
+Run with: python -m benchmarks.parallel_tools
+"""
+
+import asyncio
+import time
+
+from src.LLM import AgentTool, AssistantMessage, ToolCall
+from src.LLM.providers.base import default_execute_tool_calls
+
+CALLS_PER_TURN = (1, 4, 8, 16)
+TOOL_IO_DELAY = 0.02
+TURNS = 5
+
+
+class _SlowLookupTool(AgentTool):
+    @property
+    def name(self) -> str:
+        return "slow_lookup"
+
+    @property
+    def description(self) -> str:
+        return "Look up a key in a slow store."
+
+    async def execute(self, key: str) -> str:
+        """
+        Args:
+            key: The key to look up.
+        """
+        await asyncio.sleep(TOOL_IO_DELAY)
+        return f"value for {key}"
+
+
+class _SafeSlowLookupTool(_SlowLookupTool):
+    concurrency_safe = True
+
+
+async def _turn_latency(tool: AgentTool, calls: int) -> float:
+    definition = tool.to_tool()
+    message = AssistantMessage(
+        content="",
+        tool_calls=[
+            ToolCall(id=f"call-{i}", tool=definition, arguments={"key": f"k{i}"})
+            for i in range(calls)
+        ],
+    )
+    timings = []
+    for _ in range(TURNS):
+        start = time.perf_counter()
+        results = await default_execute_tool_calls(message, [tool])
+        timings.append(time.perf_counter() - start)
+        assert [r.tool_call_id for r in results] == [f"call-{i}" for i in range(calls)]
+    return min(timings)
+
+
+async def main() -> None:
+    print(f"Tool I/O {TOOL_IO_DELAY * 1000:.0f} ms per call, best of {TURNS} turns (ms)")
+    print(f"{'calls':>6} {'serial':>9} {'parallel':>9} {'speedup':>8}")
+    for calls in CALLS_PER_TURN:
+        serial = await _turn_latency(_SlowLookupTool(), calls)
+        parallel = await _turn_latency(_SafeSlowLookupTool(), calls)
+        print(f"{calls:>6} {serial * 1000:>9.1f} {parallel * 1000:>9.1f} {serial / parallel:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+"""
+Framework overhead measured by replaying a recorded session.
+
+A session of streamed calls is recorded once against the stub (20 chunks,
+10 ms apart). Replaying it with the original timing reproduces the run;
+replaying it instantly leaves only what the framework itself spends, so the
+difference is the model's share. A hand-written recording of a tool loop is
+then replayed through chat_tool, which runs the recorded tool calls for real.
+
+Run with: python -m benchmarks.replay_overhead
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from src.LLM import AgentTool, BaseMessage, HumanMessage, OllamaModels, chat_tool
+from src.LLM.providers import BaseProvider
+from src.LLM.providers.impl.ollama import OllamaProvider
+from src.LLM.providers.impl.ollama_client import OllamaClientConfig
+from src.LLM.providers.replay import (
+    RecordedCall,
+    RecordingProvider,
+    ReplayConfig,
+    ReplayMatch,
+    ReplayProvider,
+    ReplayTiming,
+    append_recording,
+)
+from src.LLM.providers.scheduling import UNLIMITED_SCHEDULER_CONFIG
+
+from .stub_server import BackgroundStubServer, StubServerConfig
+
+CALLS = 10
+CHUNKS = 20
+CHUNK_DELAY = 0.01
+TOOL_TURNS = 5
+MODEL = OllamaModels.QWEN_3_5_4B
+
+
+class _EchoTool(AgentTool):
+    @property
+    def name(self) -> str:
+        return "echo"
+
+    @property
+    def description(self) -> str:
+        return "Echo a value."
+
+    async def execute(self, value: str) -> str:
+        """
+        Args:
+            value: Text to echo.
+        """
+        return value
+
+
+def _prompt(index: int) -> list[BaseMessage]:
+    return [HumanMessage(content=f"Describe scene {index}.")]
+
+
+async def _run_session(provider: BaseProvider) -> float:
+    start = time.perf_counter()
+    for index in range(CALLS):
+        async for _ in provider.stream(_prompt(index)):
+            pass
+    return time.perf_counter() - start
+
+
+async def _record(path: Path) -> None:
+    config = StubServerConfig(stream_chunks=CHUNKS, chunk_delay=CHUNK_DELAY)
+    with BackgroundStubServer(config) as stub:
+        inner = OllamaProvider(
+            MODEL,
+            OllamaClientConfig(host=stub.base_url),
+            scheduler_config=UNLIMITED_SCHEDULER_CONFIG,
+        )
+        recorder = RecordingProvider(inner, path)
+        elapsed = await _run_session(recorder)
+        await recorder.aclose()
+    print(f"recorded {recorder.calls} calls against the stub in {elapsed:.3f} s")
+
+
+def _write_tool_loop(path: Path) -> None:
+    for turn in range(TOOL_TURNS):
+        call = {"function": {"name": "echo", "arguments": {"value": f"step {turn}"}}}
+        message = {"role": "assistant", "content": "", "tool_calls": [call]}
+        final = {"model": MODEL.value, "done": True, "message": message}
+        append_recording(path, RecordedCall("", MODEL.value, final, final_delay=CHUNK_DELAY * 5))
+    message = {"role": "assistant", "content": "All steps echoed."}
+    final = {"model": MODEL.value, "done": True, "message": message}
+    append_recording(path, RecordedCall("", MODEL.value, final, final_delay=CHUNK_DELAY * 5))
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        session = Path(tmp) / "session.jsonl.gz"
+        await _record(session)
+        print(f"recording is {session.stat().st_size} bytes (gzip)")
+
+        print(f"{'timing':>8} {'wall s':>7} {'model s':>8} {'overhead ms/call':>17}")
+        for timing in (ReplayTiming.ORIGINAL, ReplayTiming.INSTANT):
+            replay = ReplayProvider(session, ReplayConfig(timing=timing))
+            wall = await _run_session(replay)
+            model = sum(replay.config.scale(call.model_seconds) for call in replay.recorded)
+            overhead = (wall - model) / CALLS * 1000
+            print(f"{timing.value:>8} {wall:>7.3f} {model:>8.3f} {overhead:>17.3f}")
+
+        tool_loop = Path(tmp) / "tool_loop.jsonl"
+        _write_tool_loop(tool_loop)
+        replay = ReplayProvider(tool_loop, ReplayConfig(ReplayTiming.INSTANT, match=ReplayMatch.ORDER))
+        start = time.perf_counter()
+        new_messages = await chat_tool(
+            replay, _prompt(0), [_EchoTool()], stream=True, max_tool_calls=TOOL_TURNS + 1
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        tool_results = [m.content for m in new_messages if m.role == "tool"]
+        print(
+            f"tool loop: {replay.replayed} replayed calls, {len(tool_results)} tool results "
+            f"({', '.join(tool_results)}) in {elapsed:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+"""
+Interactive latency under mixed load, with and without the request scheduler.
+
+A stub "GPU" that runs two requests at a time serves a stream of short
+interactive calls while batch workers keep it busy with slow planner calls.
+Unscheduled, interactive calls queue behind the planner calls on the server;
+scheduled, they jump the queue and use the slot reserved for them.
+
+Run with: python -m benchmarks.scheduler_mixed_load
+"""
+
+import asyncio
+import time
+
+from src.LLM import HumanMessage
+from src.LLM.providers.impl.ollama import OllamaProvider
+from src.LLM.providers.impl.ollama_client import OllamaClientConfig
+from src.LLM.providers.scheduling import (
+    UNLIMITED_SCHEDULER_CONFIG,
+    RequestPriority,
+    SchedulerConfig,
+    percentile,
+    request_priority,
+)
+
+from .stub_server import STUB_MODEL, BackgroundStubServer, StubServerConfig
+
+PLANNER_MODEL = "stub-planner"
+SERVER_PARALLELISM = 2
+INTERACTIVE_DELAY = 0.02
+PLANNER_DELAY = 0.25
+BATCH_WORKERS = 6
+INTERACTIVE_CALLS = 40
+INTERACTIVE_GAP = 0.05
+
+SCHEDULED_CONFIG = SchedulerConfig(
+    max_concurrent=SERVER_PARALLELISM,
+    max_concurrent_per_model=SERVER_PARALLELISM,
+    reserved_interactive_slots=1,
+)
+
+
+async def _run(base_url: str, config: SchedulerConfig) -> tuple[list[float], float, str]:
+    client_config = OllamaClientConfig(host=base_url)
+    interactive = OllamaProvider(STUB_MODEL, client_config, scheduler_config=config)
+    planner = OllamaProvider(PLANNER_MODEL, client_config, scheduler_config=config)
+    messages = [HumanMessage(content="hi")]
+    stop = asyncio.Event()
+    batch_done = 0
+
+    async def batch_worker() -> None:
+        nonlocal batch_done
+        with request_priority(RequestPriority.BATCH):
+            while not stop.is_set():
+                await planner.chat(messages)
+                batch_done += 1
+
+    run_start = time.perf_counter()
+    workers = [asyncio.create_task(batch_worker()) for _ in range(BATCH_WORKERS)]
+    await asyncio.sleep(PLANNER_DELAY)
+
+    latencies = []
+    for _ in range(INTERACTIVE_CALLS):
+        start = time.perf_counter()
+        await interactive.chat(messages)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(INTERACTIVE_GAP)
+
+    stop.set()
+    await asyncio.gather(*workers)
+    batch_rate = batch_done / (time.perf_counter() - run_start)
+    report = interactive.scheduler.stats.format_report()
+    await interactive.aclose()
+    return latencies, batch_rate, report
+
+
+async def main() -> None:
+    config = StubServerConfig(
+        response_delay=INTERACTIVE_DELAY,
+        model_delays={PLANNER_MODEL: PLANNER_DELAY},
+        max_parallel=SERVER_PARALLELISM,
+    )
+    with BackgroundStubServer(config) as stub:
+        print(
+            f"{INTERACTIVE_CALLS} interactive calls ({INTERACTIVE_DELAY * 1000:.0f} ms) vs "
+            f"{BATCH_WORKERS} batch workers ({PLANNER_DELAY * 1000:.0f} ms), "
+            f"server runs {SERVER_PARALLELISM} at a time"
+        )
+        print(f"{'path':>12} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'batch/s':>8}")
+        reports = []
+        for name, scheduler_config in (
+            ("unscheduled", UNLIMITED_SCHEDULER_CONFIG),
+            ("scheduled", SCHEDULED_CONFIG),
+        ):
+            latencies, batch_rate, report = await _run(stub.base_url, scheduler_config)
+            reports.append((name, report))
+            print(
+                f"{name:>12} {percentile(latencies, 0.5) * 1000:>8.1f} "
+                f"{percentile(latencies, 0.95) * 1000:>8.1f} {max(latencies) * 1000:>8.1f} "
+                f"{batch_rate:>8.1f}"
+            )
+
+        for name, report in reports:
+            print(f"\nClient-side queue waits ({name}):\n{report}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,111 @@
+"""
+Near-duplicate `ask` questions with and without the semantic cache.
+
+Thirty questions are each asked in five wordings, shuffled. The stub takes
+100 ms per answer and echoes the question, so an audit can tell a hit on
+the same question from one on a different question. A threshold sweep with
+every hit audited shows the trade-off between hit rate and false hits.
+Memory is bounded by evicting the least recently used entries.
+
+Run with: python -m benchmarks.semantic_cache
+"""
+
+import asyncio
+import random
+import tempfile
+import time
+
+from src.LLM import HumanMessage, SemanticCacheConfig, SemanticCachingProvider
+from src.LLM.providers import BaseProvider
+from src.LLM.providers.impl.ollama import OllamaProvider
+from src.LLM.providers.impl.ollama_client import OllamaClientConfig
+from src.LLM.providers.scheduling import UNLIMITED_SCHEDULER_CONFIG
+from src.LLM.providers.semantic_cache import HAS_NUMPY
+
+from .stub_server import STUB_MODEL, BackgroundStubServer, StubServerConfig
+
+RESPONSE_DELAY = 0.1
+# A second stub model that answers at once, for the sweeps where every call reaches it.
+FAST_MODEL = "stub-fast"
+TOPICS = [
+    "the capital of France", "the capital of Spain", "photosynthesis", "a black hole",
+    "the French Revolution", "the American Revolution", "compound interest", "a neural network",
+    "the water cycle", "plate tectonics", "the Roman Empire", "the Ottoman Empire",
+    "quantum entanglement", "a sourdough starter", "the stock market", "climate change",
+    "the immune system", "a blockchain", "the Renaissance", "general relativity",
+    "a hash table", "the Silk Road", "jazz improvisation", "the Great Wall of China",
+    "machine translation", "volcanic eruptions", "the printing press", "ocean tides",
+    "the Olympic Games", "solar panels",
+]
+WORDINGS = [
+    "Explain {topic}.",
+    "Can you explain {topic}?",
+    "Please explain {topic} to me.",
+    "Explain {topic} briefly.",
+    "Could you explain {topic} in simple words?",
+]
+THRESHOLDS = (0.6, 0.75, 0.92)
+
+
+def _questions() -> list[str]:
+    questions = [wording.format(topic=topic) for topic in TOPICS for wording in WORDINGS]
+    random.Random(7).shuffle(questions)
+    return questions
+
+
+async def _ask_all(provider: BaseProvider, questions: list[str]) -> float:
+    start = time.perf_counter()
+    for question in questions:
+        await provider.chat([HumanMessage(content=question)])
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    questions = _questions()
+    config = StubServerConfig(
+        response_delay=RESPONSE_DELAY,
+        model_delays={FAST_MODEL: 0.0},
+        echo_prompt=True,
+        embedding_dim=256,
+    )
+    with BackgroundStubServer(config) as stub, tempfile.TemporaryDirectory() as cache_dir:
+        client_config = OllamaClientConfig(host=stub.base_url)
+        inner = OllamaProvider(STUB_MODEL, client_config, scheduler_config=UNLIMITED_SCHEDULER_CONFIG)
+        fast = OllamaProvider(FAST_MODEL, client_config, scheduler_config=UNLIMITED_SCHEDULER_CONFIG)
+        inner.embedding_cache_dir = fast.embedding_cache_dir = cache_dir
+        backend = "numpy" if HAS_NUMPY else "pure Python (numpy not installed)"
+        print(f"{len(questions)} questions, {len(TOPICS)} topics, similarity search: {backend}")
+
+        uncached = await _ask_all(inner, questions)
+        print(f"{'uncached':>18} {uncached:>6.2f} s")
+
+        cached = SemanticCachingProvider(inner, SemanticCacheConfig(enabled=True))
+        elapsed = await _ask_all(cached, questions)
+        print(f"{'semantic (0.92)':>18} {elapsed:>6.2f} s, hit rate {cached.stats.hit_rate:.0%}")
+        print(cached.stats.format_report())
+
+        print(f"{'threshold':>10} {'hit rate':>9} {'false hits':>11}")
+        for threshold in THRESHOLDS:
+            sweep = SemanticCachingProvider(
+                fast, SemanticCacheConfig(enabled=True, threshold=threshold, audit_rate=1.0)
+            )
+            await _ask_all(sweep, questions)
+            stats = sweep.stats
+            print(f"{threshold:>10.2f} {stats.hit_rate:>9.0%} {stats.false_hit_rate:>11.0%}")
+            for score, cached_question, asked in stats.false_hit_samples[:2]:
+                print(f"{'':>10} {score:.2f}: {asked!r} got the answer to {cached_question!r}")
+
+        bounded = SemanticCachingProvider(
+            fast, SemanticCacheConfig(enabled=True, max_entries=10, audit_rate=0.0)
+        )
+        await _ask_all(bounded, questions)
+        print(
+            f"max_entries=10: {len(bounded.index)} kept, {bounded.stats.evictions} evicted, "
+            f"hit rate {bounded.stats.hit_rate:.0%}"
+        )
+        await inner.aclose()
+        await fast.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
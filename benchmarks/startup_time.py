@@ -0,0 +1,128 @@
+"""
+CLI startup: wall clock of `main.py --help` and `main.py ask`, plus the
+slowest imports of `ask` from `python -X importtime`.
+
+`ask` runs against the stub, so the time is interpreter start, imports and
+one round trip. With --check this is a regression test: it exits non-zero if
+`--help` imports ollama or `ask` imports a subsystem it does not use.
+
+The same `ask` is then forwarded to a `main.py serve` daemon, which only
+needs the standard library on the client side.
+
+Run with: python -m benchmarks.startup_time [--check]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.constants import DAEMON_SOCKET_ENV
+from src.daemon import daemon_running
+from src.LLM.constants import OLLAMA_HOSTS_ENV, RESPONSE_CACHE_MODE_ENV
+
+from .stub_server import BackgroundStubServer
+
+RUNS = 7
+TOP_IMPORTS = 12
+MAIN = str(Path(__file__).resolve().parent.parent / "main.py")
+COMMANDS = {
+    "--help": [MAIN, "--help"],
+    "ask": [MAIN, "ask", "How are you?", "--no-stream"],
+}
+DAEMON_COMMAND = "ask (daemon)"
+# Modules a command must not import. The parser still reads the light
+# ImageGen and minigame constants for its defaults.
+FORBIDDEN = {
+    "--help": ("ollama", "pydantic", "httpx", "src.commands"),
+    "ask": (
+        "src.ImageGen.generate",
+        "src.minigames.animation_generator.main",
+        "src.minigames.company_logo.main",
+        "src.InfoGather",
+        "src.LLM.context_window",
+        "src.commands.interactive",
+    ),
+    DAEMON_COMMAND: ("ollama", "pydantic", "httpx", "src.commands"),
+}
+
+
+def _wall_clock(args: list[str], env: dict[str, str]) -> float:
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], env=env, check=True, capture_output=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _import_times(args: list[str], env: dict[str, str]) -> dict[str, tuple[int, int]]:
+    """Module -> (self, cumulative) microseconds, from -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def _measure(name: str, args: list[str], env: dict[str, str], failures: list[str]) -> None:
+    wall = _wall_clock(args, env)
+    imports = _import_times(args, env)
+    print(f"{name:>12}: {wall * 1000:>6.0f} ms wall, {len(imports)} modules imported")
+    for module in FORBIDDEN[name]:
+        if module in imports:
+            failures.append(f"{name} imports {module}")
+
+
+def main() -> None:
+    check = "--check" in sys.argv
+    failures: list[str] = []
+    with BackgroundStubServer() as stub, tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, "daemon.sock")
+        env = {
+            **os.environ,
+            OLLAMA_HOSTS_ENV: stub.base_url,
+            RESPONSE_CACHE_MODE_ENV: "off",
+            DAEMON_SOCKET_ENV: socket_path,
+        }
+        print(f"median of {RUNS} runs")
+        for name, args in COMMANDS.items():
+            _measure(name, args, env, failures)
+
+        daemon = subprocess.Popen(
+            [sys.executable, MAIN, "serve"], env=env, stdout=subprocess.DEVNULL
+        )
+        try:
+            while not daemon_running(socket_path):
+                time.sleep(0.05)
+            _measure(DAEMON_COMMAND, COMMANDS["ask"], env, failures)
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+        imports = _import_times(COMMANDS["ask"], env)
+        print("\nslowest imports of ask (self time, cumulative in brackets):")
+        slowest = sorted(imports.items(), key=lambda item: item[1][0], reverse=True)
+        for module, (own, cumulative) in slowest[:TOP_IMPORTS]:
+            print(f"  {own / 1000:>6.1f} ms ({cumulative / 1000:>6.1f}) {module}")
+
+    if failures:
+        print("\nunexpected imports:\n  " + "\n  ".join(failures))
+        if check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
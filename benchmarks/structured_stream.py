@@ -0,0 +1,100 @@
+"""
+Client-side cost of a 2000-chunk structured stream (an animation plan).
+
+The previous path regenerated the JSON schema for every request and ran the
+format validator on every chunk, each attempt failing on a JSON fragment. The
+current path reuses the schema cached per format and validates once, on the
+accumulated content of the final message.
+
+Run with: python -m benchmarks.structured_stream
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any, cast
+
+from pydantic import BaseModel
+
+from src.LLM import AssistantMessage
+from src.LLM.providers.base.stream_accumulator import StreamAccumulator
+from src.LLM.providers.base.utils import to_message
+from src.LLM.structured_format import format_schema
+from src.minigames.animation_generator.prompt_builder import (
+    AnimationFramePlan,
+    AnimationPlanResponse,
+)
+
+CHUNKS = 2000
+FRAMES = 16
+REPEATS = 10
+
+StreamRunner = Callable[[list[dict[str, Any]], type[BaseModel]], BaseModel | None]
+
+
+def _plan_chunks() -> list[dict[str, Any]]:
+    plan = AnimationPlanResponse(
+        animation_summary="A seed sprouts, grows a stem and opens into a flower.",
+        combined_prompt="A single seed in dark soil, soft studio light, macro lens, plain backdrop.",
+        continuity_rules=["Keep the camera locked.", "Keep the soil and pot identical."],
+        frames=[
+            AnimationFramePlan(
+                frame_number=index + 1,
+                motion_beat=f"Growth stage {index + 1}",
+                frame_prompt=f"The sprout at growth stage {index + 1}, leaves unfolding a little more.",
+            )
+            for index in range(FRAMES)
+        ],
+    )
+    text = plan.model_dump_json()
+    bounds = [len(text) * i // CHUNKS for i in range(CHUNKS + 1)]
+    pieces = [text[start:end] for start, end in zip(bounds, bounds[1:])]
+    chunks = [
+        {"model": "stub", "message": {"role": "assistant", "content": piece}, "done": False}
+        for piece in pieces
+    ]
+    chunks.append({"model": "stub", "message": {"role": "assistant", "content": ""}, "done": True})
+    return chunks
+
+
+def _previous(chunks: list[dict[str, Any]], format: type[BaseModel]) -> BaseModel | None:
+    format.model_json_schema()
+    parts = []
+    for chunk in chunks:
+        message = to_message(chunk, format=format)
+        parts.append(message.content)
+    # The old path had no accumulator; parse the joined text once for a fair result.
+    response = {"message": {"content": "".join(parts)}}
+    final = cast(AssistantMessage, to_message(response, format=format))
+    parsed: BaseModel | None = final.parsed
+    return parsed
+
+
+def _current(chunks: list[dict[str, Any]], format: type[BaseModel]) -> BaseModel | None:
+    format_schema(format)
+    accumulator = StreamAccumulator()
+    for chunk in chunks:
+        accumulator.add(chunk)
+    parsed: BaseModel | None = accumulator.build(format=format).parsed
+    return parsed
+
+
+def _time(runner: StreamRunner, chunks: list[dict[str, Any]]) -> float:
+    runner(chunks, AnimationPlanResponse)
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        parsed = runner(chunks, AnimationPlanResponse)
+        assert parsed is not None
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main() -> None:
+    chunks = _plan_chunks()
+    print(f"{len(chunks)} chunks, {FRAMES}-frame plan, mean of {REPEATS} streams")
+    previous = _time(_previous, chunks)
+    current = _time(_current, chunks)
+    print(f"{'previous':>10} {previous * 1000:>8.2f} ms/stream")
+    print(f"{'current':>10} {current * 1000:>8.2f} ms/stream  ({previous / current:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+import asyncio
+import hashlib
+import json
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+STUB_HOST = "127.0.0.1"
+STUB_MODEL = "stub-model"
+STUB_REPLY = "stub reply"
+
+
+@dataclass
+class StubServerConfig:
+    response_delay: float = 0.0
+    stream_chunks: int = 8
+    chunk_delay: float = 0.0
+    reply_text: str = STUB_REPLY
+    loaded_models: list[str] = field(default_factory=lambda: [STUB_MODEL])
+    # Per-model response delays, overriding response_delay.
+    model_delays: dict[str, float] = field(default_factory=dict)
+    # How many requests the "GPU" works on at once; None means unlimited.
+    max_parallel: int | None = None
+    # Every `slow_every`-th generation takes `slow_delay` instead (a cold load or a stall).
+    slow_every: int = 0
+    slow_delay: float = 0.0
+    # Models answered with 404, as if they were never pulled.
+    missing_models: list[str] = field(default_factory=list)
+    # Stream reply_text itself, split evenly over stream_chunks (e.g. a JSON document).
+    split_reply: bool = False
+    # Extra delay on the first generation per model, reported as load_duration.
+    cold_load_delay: float = 0.0
+    # Non-streamed Ollama chats answer with reply_text followed by the last message.
+    echo_prompt: bool = False
+    # /api/embed: vector size, and the time each embedding request takes.
+    embedding_dim: int = 64
+    embed_delay: float = 0.0
+
+
+@dataclass
+class _Request:
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+
+    def json(self) -> dict[str, Any]:
+        return json.loads(self.body) if self.body else {}
+
+
+class StubLLMServer:
+    """
+    Minimal keep-alive HTTP/1.1 server speaking enough of the Ollama API
+    to benchmark providers without a model.
+    """
+
+    def __init__(self, config: StubServerConfig | None = None, port: int = 0):
+        self.config = config or StubServerConfig()
+        self.port = port
+        self.request_count = 0
+        self.chat_request_count = 0
+        self.generation_count = 0
+        self.embedded_inputs = 0
+        self.connection_count = 0
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.Task[None]] = set()
+        self._parallel_slots: asyncio.Semaphore | None = None
+        self._loaded: set[str] = set()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{STUB_HOST}:{self.port}"
+
+    async def start(self) -> str:
+        if self.config.max_parallel is not None:
+            self._parallel_slots = asyncio.Semaphore(self.config.max_parallel)
+        self._server = await asyncio.start_server(self._handle_connection, STUB_HOST, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for task in list(self._connections):
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "StubLLMServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.stop()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connection_count += 1
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections.add(task)
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                self.request_count += 1
+                await self._dispatch(request, writer)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+            if task is not None:
+                self._connections.discard(task)
+
+    async def _dispatch(self, request: _Request, writer: asyncio.StreamWriter) -> None:
+        if "chat" in request.path:
+            self.chat_request_count += 1
+        if request.path == "/api/ps":
+            models = [{"name": name, "model": name} for name in self.config.loaded_models]
+            await _write_json(writer, {"models": models})
+        elif request.path == "/api/chat":
+            payload = request.json()
+            model = payload.get("model", STUB_MODEL)
+            if model in self.config.missing_models:
+                await _write_json(writer, {"error": f"model '{model}' not found"}, status=404)
+            elif payload.get("stream", True):
+                await self._stream_ollama_chat(writer, model)
+            else:
+                timings = await self._generate(model)
+                reply = self.config.reply_text
+                if self.config.echo_prompt and payload.get("messages"):
+                    reply = f"{reply}: {payload['messages'][-1].get('content', '')}"
+                await _write_json(writer, _ollama_chunk(model, reply, True, timings))
+        elif request.path == "/api/embed":
+            payload = request.json()
+            texts = payload.get("input", [])
+            texts = [texts] if isinstance(texts, str) else texts
+            self.embedded_inputs += len(texts)
+            await asyncio.sleep(self.config.embed_delay)
+            embeddings = [_bag_of_words(text, self.config.embedding_dim) for text in texts]
+            await _write_json(
+                writer, {"model": payload.get("model", STUB_MODEL), "embeddings": embeddings}
+            )
+        elif request.path == "/v1/chat/completions":
+            payload = request.json()
+            model = payload.get("model", STUB_MODEL)
+            await self._generate(model)
+            await _write_json(writer, _openai_completion(model, self.config.reply_text))
+        else:
+            await _write_json(writer, {"error": f"unknown path {request.path}"}, status=404)
+
+    async def _generate(self, model: str) -> dict[str, int]:
+        """Simulate generation and return Ollama-style timings (nanoseconds)."""
+        self.generation_count += 1
+        delay = self.config.model_delays.get(model, self.config.response_delay)
+        if self.config.slow_every and self.generation_count % self.config.slow_every == 0:
+            delay = self.config.slow_delay
+        load = 0.0 if model in self._loaded else self.config.cold_load_delay
+        self._loaded.add(model)
+        if self._parallel_slots is None:
+            await asyncio.sleep(load + delay)
+        else:
+            async with self._parallel_slots:
+                await asyncio.sleep(load + delay)
+        tokens = self.config.stream_chunks
+        return {
+            "total_duration": round((load + delay) * 1e9),
+            "load_duration": round(load * 1e9),
+            "prompt_eval_count": 4 * tokens,
+            "prompt_eval_duration": round(delay * 1e8),
+            "eval_count": tokens,
+            "eval_duration": round(delay * 9e8),
+        }
+
+    async def _stream_ollama_chat(self, writer: asyncio.StreamWriter, model: str) -> None:
+        timings = await self._generate(model)
+        _write_chunked_headers(writer, "application/x-ndjson")
+        for index in range(self.config.stream_chunks):
+            await asyncio.sleep(self.config.chunk_delay)
+            chunk = _ollama_chunk(model, self._stream_piece(index), False)
+            await _write_chunk(writer, (json.dumps(chunk) + "\n").encode())
+        final = _ollama_chunk(model, "", True, timings)
+        await _write_chunk(writer, (json.dumps(final) + "\n").encode())
+        await _write_chunk(writer, b"")
+
+
+    def _stream_piece(self, index: int) -> str:
+        text = self.config.reply_text
+        if not self.config.split_reply:
+            return f"{text} {index} "
+        chunks = self.config.stream_chunks
+        return text[len(text) * index // chunks : len(text) * (index + 1) // chunks]
+
+
+class BackgroundStubServer:
+    """
+    Run a StubLLMServer on its own event loop in a daemon thread, so the
+    benchmarked client loop never shares CPU time or blocking calls with it.
+    """
+
+    def __init__(self, config: StubServerConfig | None = None, port: int = 0):
+        self.server = StubLLMServer(config, port)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return self.server.base_url
+
+    def __enter__(self) -> "BackgroundStubServer":
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+def _ollama_chunk(
+    model: str, content: str, done: bool, timings: dict[str, int] | None = None
+) -> dict[str, Any]:
+    return {
+        "model": model,
+        "created_at": "2024-01-01T00:00:00Z",
+        "message": {"role": "assistant", "content": content},
+        "done": done,
+        **(timings or {}),
+    }
+
+
+_FILLER_WORDS = frozenset(
+    "a an the of to me you i can could would please is are what tell".split()
+)
+
+
+def _bag_of_words(text: str, dim: int) -> list[float]:
+    """
+    A unit vector of hashed word counts, ignoring filler words: rewordings of a
+    question score close to 1, questions sharing a few words score in between.
+    """
+    vector = [0.0] * dim
+    for word in re.findall(r"\w+", text.lower()):
+        if word in _FILLER_WORDS:
+            continue
+        vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % dim] += 1.0
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+def _openai_completion(model: str, content: str) -> dict[str, Any]:
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": 0,
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+    }
+
+
+async def _read_request(reader: asyncio.StreamReader) -> _Request | None:
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    method, path, _ = request_line.decode().split(" ", 2)
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, value = line.decode().split(":", 1)
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", "0"))
+    body = await reader.readexactly(length) if length else b""
+    return _Request(method=method, path=path, headers=headers, body=body)
+
+
+async def _write_json(writer: asyncio.StreamWriter, payload: Any, status: int = 200) -> None:
+    body = json.dumps(payload).encode()
+    writer.write(
+        f"HTTP/1.1 {status} OK\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: keep-alive\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+
+
+def _write_chunked_headers(writer: asyncio.StreamWriter, content_type: str) -> None:
+    writer.write(
+        "HTTP/1.1 200 OK\r\n"
+        f"Content-Type: {content_type}\r\n"
+        "Transfer-Encoding: chunked\r\n"
+        "Connection: keep-alive\r\n\r\n".encode()
+    )
+
+
+async def _write_chunk(writer: asyncio.StreamWriter, data: bytes) -> None:
+    writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+    await writer.drain()
@@ -0,0 +1,136 @@
+"""
+Cost of dispatching 10k tool calls through default_execute_tool_calls.
+
+The previous path rebuilt the handler table and the tool closures for every
+request and ran inspect.signature on every call. The compiled path resolves
+all of that once per CompiledToolset. Tools here return immediately, so the
+numbers are pure dispatch overhead.
+
+Run with: python -m benchmarks.tool_dispatch
+"""
+
+import asyncio
+import inspect
+import time
+from collections.abc import Awaitable, Callable
+
+from src.LLM import (
+    AgentTool,
+    AssistantMessage,
+    CompiledToolset,
+    ToolCall,
+    ToolMessage,
+    ToolUsageContext,
+    agent_tools_to_tools_and_handlers,
+)
+from src.LLM.providers.base import default_execute_tool_calls
+from src.LLM.tools.context import ToolContext
+
+TOTAL_CALLS = 10_000
+CALLS_PER_TURN = 10
+REPEATS = 3
+
+
+class _EchoTool(AgentTool):
+    @property
+    def name(self) -> str:
+        return "echo"
+
+    @property
+    def description(self) -> str:
+        return "Echo a value."
+
+    async def execute(self, value: str, times: int = 1) -> str:
+        """
+        Args:
+            value: Text to echo.
+            times: How many times to repeat it.
+        """
+        return value * times
+
+
+class _ContextEchoTool(AgentTool):
+    @property
+    def name(self) -> str:
+        return "context_echo"
+
+    @property
+    def description(self) -> str:
+        return "Echo a value and report how often tools were used."
+
+    async def execute(self, value: str, context: ToolContext | None = None) -> str:
+        """
+        Args:
+            value: Text to echo.
+        """
+        return value
+
+
+async def _legacy_execute(
+    assistant_msg: AssistantMessage, agent_tools: list[AgentTool]
+) -> list[ToolMessage]:
+    """The dispatch loop as it was before CompiledToolset."""
+    agent_tools_to_tools_and_handlers(agent_tools)
+    ctx = ToolUsageContext()
+    handlers = {tool.name: tool.execute for tool in agent_tools}
+    tool_messages = []
+    for tc in assistant_msg.tool_calls or []:
+        handler = handlers[tc.tool.name]
+        sig = inspect.signature(handler)
+        kwargs = tc.arguments.copy()
+        if "context" in sig.parameters:
+            kwargs["context"] = ctx
+        result = await handler(**kwargs)
+        ctx.register_tool_used(tc.tool.name)
+        tool_messages.append(
+            ToolMessage(content=str(result), tool_call_id=tc.id, tool_name=tc.tool.name)
+        )
+    return tool_messages
+
+
+def _build_turn(agent_tools: list[AgentTool]) -> AssistantMessage:
+    echo, context_echo = (tool.to_tool() for tool in agent_tools)
+    calls = [
+        ToolCall(
+            id=f"call-{i}",
+            tool=echo if i % 2 else context_echo,
+            arguments={"value": "x", "times": 2} if i % 2 else {"value": "y"},
+        )
+        for i in range(CALLS_PER_TURN)
+    ]
+    return AssistantMessage(content="", tool_calls=calls)
+
+
+async def _time_turns(run_turn: Callable[[], Awaitable[list[ToolMessage]]]) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(TOTAL_CALLS // CALLS_PER_TURN):
+            await run_turn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def main() -> None:
+    agent_tools: list[AgentTool] = [_EchoTool(), _ContextEchoTool()]
+    toolset = CompiledToolset.compile(agent_tools)
+    turn = _build_turn(agent_tools)
+
+    async def legacy_turn() -> list[ToolMessage]:
+        return await _legacy_execute(turn, agent_tools)
+
+    async def compiled_turn() -> list[ToolMessage]:
+        return await default_execute_tool_calls(turn, toolset)
+
+    legacy = await _time_turns(legacy_turn)
+    compiled = await _time_turns(compiled_turn)
+
+    print(f"{TOTAL_CALLS} dispatched calls, {CALLS_PER_TURN} per turn, best of {REPEATS}")
+    print(f"{'path':>10} {'total ms':>9} {'us/call':>8}")
+    for name, seconds in (("legacy", legacy), ("compiled", compiled)):
+        print(f"{name:>10} {seconds * 1000:>9.1f} {seconds / TOTAL_CALLS * 1e6:>8.2f}")
+    print(f"Speedup: {legacy / compiled:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
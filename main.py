@@ -3,16 +3,18 @@ import asyncio
 from collections.abc import Coroutine
 from typing import Any
 
-from src.commands import (
-    ask,
-    chat_cli,
-    handle_animation_generator,
-    handle_company_logo,
-    handle_image_gen,
+from src.constants import (
+    ANIMATION_COMMAND,
+    API_COMMAND,
+    COMPANY_LOGO_COMMAND,
+    DAEMON_COMMANDS,
+    DEFAULT_API_HOST,
+    DEFAULT_API_PORT,
+    SERVE_COMMAND,
 )
-from src.constants import ANIMATION_COMMAND, COMPANY_LOGO_COMMAND
 from src.ImageGen import DEFAULT_IMAGE_MODEL as DEFAULT_IMAGE_MODEL_ENUM
-from src.LLM import DEFAULT_MODEL, LLMConfig
+from src.LLM import DEFAULT_MODEL
+from src.LLM.telemetry import export_telemetry_from_env
 from src.minigames.company_logo.constants import (
     DEFAULT_CHAT_MODEL,
     DEFAULT_IMAGE_MODEL,
@@ -22,6 +24,11 @@ from src.minigames.company_logo.constants import (
 
 def parse_args():
     parser = argparse.ArgumentParser(prog="main.py", description="AI-Fun CLI")
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help=f"Run in this process even if a `{SERVE_COMMAND}` daemon is running",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # ASK
@@ -69,6 +76,12 @@ def parse_args():
     chat_parser.add_argument(
         "-nt", "--no-think", dest="think", action="store_false", help="Disable thinking"
     )
+    chat_parser.add_argument(
+        "-c",
+        "--compact",
+        action="store_true",
+        help="Summarize older turns in the background once the history grows",
+    )
 
     # IMG
     img_parser = subparsers.add_parser("img", help="Generate an image")
@@ -105,6 +118,28 @@ def parse_args():
     comp_parser.add_argument(
         "-im", "--image-model", type=str, default=DEFAULT_IMAGE_MODEL, help="Image model to use"
     )
+    comp_parser.add_argument(
+        "--hedge-model",
+        type=str,
+        default=None,
+        help="Send slow chat turns to this model as well and keep the faster answer",
+    )
+
+    # DAEMON
+    serve_parser = subparsers.add_parser(
+        SERVE_COMMAND,
+        help=f"Run a daemon that keeps clients and caches warm for {', '.join(DAEMON_COMMANDS)}",
+    )
+    serve_parser.add_argument(
+        "--socket", type=str, default=None, help="Unix socket path (default: per-user temp file)"
+    )
+
+    # HTTP API
+    api_parser = subparsers.add_parser(
+        API_COMMAND, help="Serve ask, chat, image and animation jobs over HTTP"
+    )
+    api_parser.add_argument("--host", type=str, default=DEFAULT_API_HOST, help="Address to bind")
+    api_parser.add_argument("--port", type=int, default=DEFAULT_API_PORT, help="Port to bind")
 
     return parser.parse_args()
 
@@ -118,28 +153,43 @@ def _run_async(coroutine: Coroutine[Any, Any, object]) -> None:
 
 def main():
     args = parse_args()
+    if args.command in DAEMON_COMMANDS and not args.local and _forward(args):
+        return
+    try:
+        _dispatch(args)
+    finally:
+        export_telemetry_from_env()
+
+
+def _command_args(args: argparse.Namespace) -> dict[str, Any]:
+    return {k: v for k, v in vars(args).items() if k not in ("command", "local")}
+
+
+def _forward(args: argparse.Namespace) -> bool:
+    """Run the command on the daemon if one is listening."""
+    from src.daemon import forward_command
+
+    try:
+        return forward_command(args.command, _command_args(args))
+    except KeyboardInterrupt:
+        print("\nOperation cancelled.")
+        return True
+
+
+def _dispatch(args: argparse.Namespace) -> None:
+    if args.command == SERVE_COMMAND:
+        from src.daemon import serve
+
+        _run_async(serve(args.socket))
+        return
+    if args.command == API_COMMAND:
+        from src.api import ApiConfig, serve_api
+
+        _run_async(serve_api(ApiConfig(host=args.host, port=args.port)))
+        return
+    from src.commands.dispatch import run_command
 
-    if args.command == "ask":
-        llm_config = LLMConfig(think=args.think) if args.think else None
-        _run_async(ask(args.question, args.model, args.stream, llm_config))
-    elif args.command == "chat":
-        llm_config = LLMConfig(think=args.think) if args.think else None
-        _run_async(chat_cli(args.model, args.system, args.stream, llm_config))
-    elif args.command == "img":
-        _run_async(
-            handle_image_gen(
-                args.prompt,
-                args.model,
-                args.steps,
-                args.negative_prompt,
-            )
-        )
-    elif args.command in {ANIMATION_COMMAND, "anim"}:
-        _run_async(handle_animation_generator())
-    elif args.command == COMPANY_LOGO_COMMAND:
-        _run_async(handle_company_logo(args.chat_model, args.prompt_model, args.image_model))
-    else:
-        print(f"Unknown command: {args.command}")
+    _run_async(run_command(args.command, _command_args(args)))
 
 
 if __name__ == "__main__":
@@ -1,7 +1,21 @@
-from .generate import generate_image
+from typing import TYPE_CHECKING, Any
+
 from .models import DEFAULT_IMAGE_MODEL, ImageModels
 from .types import ImageRequest, ImageResponse
 
+if TYPE_CHECKING:
+    from .generate import generate_image
+
+
+# Lazy import: generation pulls in the ollama client
+def __getattr__(name: str) -> Any:
+    if name == "generate_image":
+        from .generate import generate_image
+
+        return generate_image
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "generate_image",
     "DEFAULT_IMAGE_MODEL",
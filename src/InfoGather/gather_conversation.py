@@ -1,12 +1,16 @@
+from collections.abc import MutableSequence, Sequence
 from typing import Any
 
 from src.InfoGather.constants import InputHandler
 from src.LLM import (
     AgentTool,
     BaseMessage,
+    CallType,
+    ContextWindowMiddleware,
     HumanMessage,
     LLMConfig,
     OllamaModels,
+    RoutedProvider,
     SystemMessage,
     ToolLoopMiddleware,
     ToolUsageContext,
@@ -34,7 +38,9 @@ class QuestionLimitMiddleware(ToolLoopMiddleware):
         self.ask_count = 0
         self.warning_sent = False
 
-    async def on_before_llm_call(self, messages: list, context: ToolUsageContext) -> None:
+    async def on_before_llm_call(
+        self, messages: MutableSequence[BaseMessage], context: ToolUsageContext
+    ) -> None:
         pass
 
     async def on_after_llm_call(self, assistant_msg: Any, context: ToolUsageContext) -> None:
@@ -51,7 +57,9 @@ class QuestionLimitMiddleware(ToolLoopMiddleware):
             return False
         return True
 
-    async def on_injections(self, injections: list, context: ToolUsageContext) -> list:
+    async def on_injections(
+        self, injections: Sequence[BaseMessage], context: ToolUsageContext
+    ) -> list:
         result_injections = []
         if self.ask_count >= self.limit:
             result_injections.append(
@@ -149,15 +157,21 @@ async def gather_conversation(
 
     llm_config = LLMConfig(**chat_kwargs) if chat_kwargs else None
 
+    # The fallback only reads fields off the transcript; when the provider is
+    # ours, let the router send it to a small model.
+    fallback_provider: BaseProvider | None = provider
     if provider is None:
-        from src.LLM.providers.impl.ollama import OllamaProvider
+        from src.LLM.providers.impl.ollama_balanced import build_ollama_provider
 
-        provider = OllamaProvider(model)
+        provider = build_ollama_provider(model)
 
     question_middleware: ToolLoopMiddleware = QuestionLimitMiddleware(
         limit=question_limit, warn_at=warn_at_question
     )
-    all_middleware: list[ToolLoopMiddleware] = [question_middleware]
+    all_middleware: list[ToolLoopMiddleware] = [
+        ContextWindowMiddleware(provider.model),
+        question_middleware,
+    ]
     if middleware:
         all_middleware.extend(middleware)
 
@@ -177,7 +191,7 @@ async def gather_conversation(
         await fill_unfilled_fields(
             messages=all_messages,
             info_book=info_book,
-            provider=provider,
+            provider=fallback_provider or RoutedProvider(CallType.STRUCTURED_EXTRACTION),
             llm_config=llm_config,
         )
 
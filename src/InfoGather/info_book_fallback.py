@@ -10,6 +10,7 @@ from src.LLM import (
     LLMConfig,
     ToolMessage,
     chat_non_stream_no_tool,
+    with_response_cache,
 )
 
 CANNOT_INFER = "CANNOT_INFER"
@@ -94,7 +95,7 @@ async def fill_unfilled_fields(
     config.format = FallbackResponse
 
     response = await chat_non_stream_no_tool(
-        provider=provider,
+        provider=with_response_cache(provider),
         messages=[HumanMessage(content=prompt)],
         llm_config=config,
     )
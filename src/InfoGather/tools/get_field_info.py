@@ -12,6 +12,8 @@ NOT_SET = "(not set)"
 
 
 class GetFieldInfoTool(InfoBookTool):
+    concurrency_safe = True
+
     @property
     def name(self) -> str:
         return "get_field_info"
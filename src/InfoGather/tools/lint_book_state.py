@@ -2,6 +2,8 @@ from src.InfoGather.tools.base import InfoBookTool
 
 
 class LintBookStateTool(InfoBookTool):
+    concurrency_safe = True
+
     @property
     def name(self) -> str:
         return "lint_book_state"
@@ -2,6 +2,8 @@ from src.InfoGather.tools.base import InfoBookTool
 
 
 class ViewBookTool(InfoBookTool):
+    concurrency_safe = True
+
     @property
     def name(self) -> str:
         return "view_book"
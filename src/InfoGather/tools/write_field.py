@@ -5,6 +5,8 @@ ERROR_FIELD_NOT_EXIST = "Error: Field '{field_name}' does not exist"
 
 
 class WriteFieldTool(InfoBookTool):
+    concurrency_safe = True
+
     @property
     def name(self) -> str:
         return "write_field"
@@ -1,76 +1,192 @@
-from pydantic import BaseModel
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .config import LLMConfig
-from .constants import (
-    DEFAULT_FREQUENCY_PENALTY,
-    DEFAULT_NUM_PREDICT,
-    DEFAULT_PRESENCE_PENALTY,
-    DEFAULT_TEMPERATURE,
-    DEFAULT_TOP_K,
-    DEFAULT_TOP_P,
-)
-from .models.messages import AssistantMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
-from .models.tool_context import ToolLoopMiddleware, ToolUsageContext
-from .providers import BaseProvider, get_provider
-from .providers.impl.ollama import DEFAULT_MODEL, OllamaModels, get_model
-from .providers.usage import (
-    chat_non_stream,
-    chat_non_stream_no_tool,
-    chat_stream,
-    chat_stream_no_tool,
-    chat_tool,
-)
-from .tools import agent_tools_to_tools_and_handlers
-from .tools.base import AgentTool, Tool, ToolCall
-from .tools.context import (
-    ContextResult,
-    ToolContext,
-    ToolExecutionResult,
-)
-from .tools.factory import build_usable_tools
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
+    from .config import LLMConfig
+    from .constants import (
+        AUTO_MODEL,
+        DEFAULT_FREQUENCY_PENALTY,
+        DEFAULT_NUM_PREDICT,
+        DEFAULT_PRESENCE_PENALTY,
+        DEFAULT_TEMPERATURE,
+        DEFAULT_TOP_K,
+        DEFAULT_TOP_P,
+    )
+    from .context_window import (
+        CompactionConfig,
+        ContextStrategy,
+        ContextWindowConfig,
+        ContextWindowManager,
+        ContextWindowMiddleware,
+        ConversationCompactor,
+    )
+    from .models.conversation_buffer import ConversationBuffer
+    from .models.messages import (
+        AssistantMessage,
+        AssistantMessageDelta,
+        BaseMessage,
+        HumanMessage,
+        SystemMessage,
+        ToolMessage,
+    )
+    from .models.ollama_models import DEFAULT_MODEL, OllamaModels, get_model
+    from .models.tool_context import ToolLoopMiddleware, ToolUsageContext
+    from .providers import BaseProvider, get_provider
+    from .providers.base import CompiledToolset
+    from .providers.cache import (
+        CacheMode,
+        CachingProvider,
+        ResponseCacheConfig,
+        with_response_cache,
+    )
+    from .providers.hedging import HedgedProvider, HedgePolicy
+    from .providers.impl.ollama_balanced import build_ollama_provider
+    from .providers.impl.ollama_pool import OllamaPoolConfig
+    from .providers.replay import (
+        RecordingProvider,
+        ReplayConfig,
+        ReplayMatch,
+        ReplayProvider,
+        ReplayTiming,
+    )
+    from .providers.scheduling import (
+        RequestPriority,
+        RequestScheduler,
+        SchedulerConfig,
+        request_priority,
+    )
+    from .providers.semantic_cache import (
+        SemanticCacheConfig,
+        SemanticCachingProvider,
+        with_semantic_cache,
+    )
+    from .providers.usage import (
+        BatchReport,
+        chat_many,
+        chat_non_stream,
+        chat_non_stream_no_tool,
+        chat_stream,
+        chat_stream_no_tool,
+        chat_stream_structured,
+        chat_tool,
+    )
+    from .routing import CallType, ModelRouter, RoutedProvider, RoutingConfig, routed_or_fixed
+    from .structured_stream import StructuredStreamParser, StructuredUpdate
+    from .telemetry import CallMetrics, TelemetryRegistry, get_telemetry_registry
+    from .tools import agent_tools_to_tools_and_handlers
+    from .tools.base import AgentTool, Tool, ToolCall
+    from .tools.context import (
+        ContextResult,
+        ToolContext,
+        ToolExecutionResult,
+    )
+    from .tools.factory import build_usable_tools
 
-def __getattr__(name):
-    if name == "OllamaProvider":
-        return get_provider("ollama")
-    elif name == "OpenAIProvider":
-        return get_provider("openai")
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+# Names are imported from their submodule on first access, so `from src.LLM import
+# HumanMessage` does not pull in every provider, tool and cache (PEP 562).
+_EXPORTS: dict[str, str] = {
+    "BaseModel": "pydantic",
+    "LLMConfig": ".config",
+    "AUTO_MODEL": ".constants",
+    "DEFAULT_FREQUENCY_PENALTY": ".constants",
+    "DEFAULT_NUM_PREDICT": ".constants",
+    "DEFAULT_PRESENCE_PENALTY": ".constants",
+    "DEFAULT_TEMPERATURE": ".constants",
+    "DEFAULT_TOP_K": ".constants",
+    "DEFAULT_TOP_P": ".constants",
+    "CompactionConfig": ".context_window",
+    "ContextStrategy": ".context_window",
+    "ContextWindowConfig": ".context_window",
+    "ContextWindowManager": ".context_window",
+    "ContextWindowMiddleware": ".context_window",
+    "ConversationCompactor": ".context_window",
+    "ConversationBuffer": ".models.conversation_buffer",
+    "AssistantMessage": ".models.messages",
+    "AssistantMessageDelta": ".models.messages",
+    "BaseMessage": ".models.messages",
+    "HumanMessage": ".models.messages",
+    "SystemMessage": ".models.messages",
+    "ToolMessage": ".models.messages",
+    "ToolLoopMiddleware": ".models.tool_context",
+    "ToolUsageContext": ".models.tool_context",
+    "BaseProvider": ".providers",
+    "get_provider": ".providers",
+    "CompiledToolset": ".providers.base",
+    "CacheMode": ".providers.cache",
+    "CachingProvider": ".providers.cache",
+    "ResponseCacheConfig": ".providers.cache",
+    "with_response_cache": ".providers.cache",
+    "RequestPriority": ".providers.scheduling",
+    "RequestScheduler": ".providers.scheduling",
+    "SchedulerConfig": ".providers.scheduling",
+    "request_priority": ".providers.scheduling",
+    "SemanticCacheConfig": ".providers.semantic_cache",
+    "SemanticCachingProvider": ".providers.semantic_cache",
+    "with_semantic_cache": ".providers.semantic_cache",
+    "HedgedProvider": ".providers.hedging",
+    "HedgePolicy": ".providers.hedging",
+    "DEFAULT_MODEL": ".models.ollama_models",
+    "OllamaModels": ".models.ollama_models",
+    "get_model": ".models.ollama_models",
+    "build_ollama_provider": ".providers.impl.ollama_balanced",
+    "OllamaPoolConfig": ".providers.impl.ollama_pool",
+    "RecordingProvider": ".providers.replay",
+    "ReplayConfig": ".providers.replay",
+    "ReplayMatch": ".providers.replay",
+    "ReplayProvider": ".providers.replay",
+    "ReplayTiming": ".providers.replay",
+    "BatchReport": ".providers.usage",
+    "chat_many": ".providers.usage",
+    "chat_non_stream": ".providers.usage",
+    "chat_non_stream_no_tool": ".providers.usage",
+    "chat_stream": ".providers.usage",
+    "chat_stream_no_tool": ".providers.usage",
+    "chat_stream_structured": ".providers.usage",
+    "chat_tool": ".providers.usage",
+    "CallType": ".routing",
+    "ModelRouter": ".routing",
+    "RoutedProvider": ".routing",
+    "RoutingConfig": ".routing",
+    "routed_or_fixed": ".routing",
+    "StructuredStreamParser": ".structured_stream",
+    "StructuredUpdate": ".structured_stream",
+    "CallMetrics": ".telemetry",
+    "TelemetryRegistry": ".telemetry",
+    "get_telemetry_registry": ".telemetry",
+    "agent_tools_to_tools_and_handlers": ".tools",
+    "AgentTool": ".tools.base",
+    "Tool": ".tools.base",
+    "ToolCall": ".tools.base",
+    "ContextResult": ".tools.context",
+    "ToolContext": ".tools.context",
+    "ToolExecutionResult": ".tools.context",
+    "build_usable_tools": ".tools.factory",
+}
 
+_PROVIDER_TYPES = {
+    "OllamaProvider": "ollama",
+    "BalancedOllamaProvider": "ollama_pool",
+    "OpenAIProvider": "openai",
+}
 
-__all__ = [
-    "AgentTool",
-    "agent_tools_to_tools_and_handlers",
-    "build_usable_tools",
-    "chat_non_stream",
-    "chat_non_stream_no_tool",
-    "chat_stream",
-    "chat_stream_no_tool",
-    "chat_tool",
-    "DEFAULT_MODEL",
-    "LLMConfig",
-    "BaseProvider",
-    "OllamaProvider",
-    "OllamaModels",
-    "OpenAIProvider",
-    "get_model",
-    "BaseMessage",
-    "HumanMessage",
-    "AssistantMessage",
-    "SystemMessage",
-    "ToolMessage",
-    "Tool",
-    "ToolCall",
-    "ToolUsageContext",
-    "ToolLoopMiddleware",
-    "BaseModel",
-    "DEFAULT_TEMPERATURE",
-    "DEFAULT_TOP_P",
-    "DEFAULT_TOP_K",
-    "DEFAULT_NUM_PREDICT",
-    "DEFAULT_FREQUENCY_PENALTY",
-    "DEFAULT_PRESENCE_PENALTY",
-    "ContextResult",
-    "ToolContext",
-    "ToolExecutionResult",
-]
+
+def __getattr__(name: str) -> Any:
+    if name in _PROVIDER_TYPES:
+        from .providers import get_provider
+
+        return get_provider(_PROVIDER_TYPES[name])
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
+
+
+__all__ = sorted([*_EXPORTS, *_PROVIDER_TYPES])
@@ -10,6 +10,7 @@ from .constants import (
     DEFAULT_TOP_K,
     DEFAULT_TOP_P,
 )
+from .structured_format import format_schema
 
 
 class LLMConfig(BaseModel):
@@ -41,7 +42,7 @@ class LLMConfig(BaseModel):
     def get_format_schema(self) -> dict[str, Any] | None:
         if self.format is None:
             return None
-        return self.format.model_json_schema()
+        return format_schema(self.format)
 
 
 __all__ = ["LLMConfig"]
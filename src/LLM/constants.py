@@ -5,6 +5,89 @@ DEFAULT_NUM_PREDICT = 2048
 DEFAULT_FREQUENCY_PENALTY = 0.0
 DEFAULT_PRESENCE_PENALTY = 0.0
 
+DEFAULT_OLLAMA_MAX_CONNECTIONS = 64
+DEFAULT_OLLAMA_MAX_KEEPALIVE_CONNECTIONS = 32
+DEFAULT_OLLAMA_KEEPALIVE_EXPIRY_SECONDS = 30.0
+DEFAULT_OLLAMA_TIMEOUT_SECONDS: float | None = None
+DEFAULT_STREAM_BUFFER_SIZE = 64
+OLLAMA_HOSTS_ENV = "AI_FUN_OLLAMA_HOSTS"
+DEFAULT_OLLAMA_PROBE_INTERVAL_SECONDS = 10.0
+DEFAULT_OLLAMA_PROBE_TIMEOUT_SECONDS = 2.0
+DEFAULT_OLLAMA_OVERFLOW_IN_FLIGHT = 4
+
+DEFAULT_OPENAI_MAX_CONCURRENT_REQUESTS = 16
+
+DEFAULT_TOOL_CONCURRENCY = 8
+
+DEFAULT_BATCH_CONCURRENCY = 8
+
+# None means unlimited; set the env vars below to cap a host without code changes.
+DEFAULT_SCHEDULER_MAX_CONCURRENT: int | None = None
+DEFAULT_SCHEDULER_MAX_CONCURRENT_PER_MODEL: int | None = None
+SCHEDULER_MAX_CONCURRENT_ENV = "AI_FUN_MAX_CONCURRENT"
+SCHEDULER_MAX_CONCURRENT_PER_MODEL_ENV = "AI_FUN_MAX_CONCURRENT_PER_MODEL"
+DEFAULT_SCHEDULER_RESERVED_INTERACTIVE_SLOTS = 1
+SCHEDULER_WAIT_SAMPLE_SIZE = 1024
+
+DEFAULT_HEDGE_PERCENTILE = 0.95
+DEFAULT_HEDGE_INITIAL_DELAY_SECONDS = 2.0
+DEFAULT_HEDGE_MIN_DELAY_SECONDS = 0.05
+DEFAULT_HEDGE_MAX_DELAY_SECONDS = 10.0
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+HEDGE_LATENCY_SAMPLE_SIZE = 256
+
+CHARS_PER_TOKEN_ESTIMATE = 4
+MESSAGE_TOKEN_OVERHEAD = 4
+IMAGE_TOKEN_ESTIMATE = 768
+DEFAULT_CONTEXT_WINDOW_TOKENS = 8192
+DEFAULT_CONTEXT_OUTPUT_RESERVE_TOKENS = 1024
+DEFAULT_CONTEXT_KEEP_LAST_TURNS = 6
+DEFAULT_CONTEXT_TRUNCATE_CHARS = 400
+MODEL_CONTEXT_WINDOW_TOKENS: dict[str, int] = {
+    "qwen3:8b": 40960,
+    "qwen3.5:4b": 32768,
+    "qwen3.5:9b": 32768,
+    "glm-4.7-flash": 131072,
+    "gemma3:1b": 32768,
+    "gemma3:4b": 131072,
+    "gpt-4o": 128000,
+    "gpt-4o-mini": 128000,
+    "o1": 200000,
+    "o1-mini": 128000,
+}
+
+AUTO_MODEL = "auto"
+DEFAULT_ROUTING_EWMA_ALPHA = 0.3
+DEFAULT_ROUTING_EXPLORE_EVERY = 20
+ROUTING_PROMPT_BUCKET_TOKENS = 512
+
+DEFAULT_COMPACTION_THRESHOLD_TOKENS = 3000
+DEFAULT_COMPACTION_KEEP_LAST_TURNS = 4
+DEFAULT_COMPACTION_SUMMARY_TOKENS = 512
+
+QUEUE_DURATION_FIELD = "queue_duration"
+COLD_LOAD_THRESHOLD_SECONDS = 0.5
+TELEMETRY_FILE_ENV = "AI_FUN_METRICS_FILE"
+TELEMETRY_RATE_BUCKETS: tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+TELEMETRY_SECONDS_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120
+)
+
+RESPONSE_CACHE_PATH = ".cache/llm_responses.sqlite"
+RESPONSE_CACHE_MODE_ENV = "AI_FUN_LLM_CACHE"
+DEFAULT_RESPONSE_CACHE_MEMORY_ENTRIES = 256
+DEFAULT_RESPONSE_CACHE_DISK_ENTRIES = 10_000
+DEFAULT_RESPONSE_CACHE_TTL_SECONDS: float | None = 7 * 24 * 60 * 60
+
+DEFAULT_EMBEDDING_MODEL = "nomic-embed-text"
+EMBEDDING_BATCH_SIZE = 64
+EMBEDDING_CACHE_DIR = ".cache/embeddings"
+
+SEMANTIC_CACHE_ENV = "AI_FUN_SEMANTIC_CACHE"
+DEFAULT_SEMANTIC_CACHE_THRESHOLD = 0.92
+DEFAULT_SEMANTIC_CACHE_MAX_ENTRIES = 2048
+DEFAULT_SEMANTIC_CACHE_AUDIT_RATE = 0.05
+
 __all__ = [
     "DEFAULT_TEMPERATURE",
     "DEFAULT_TOP_P",
@@ -12,4 +95,60 @@ __all__ = [
     "DEFAULT_NUM_PREDICT",
     "DEFAULT_FREQUENCY_PENALTY",
     "DEFAULT_PRESENCE_PENALTY",
+    "DEFAULT_OLLAMA_MAX_CONNECTIONS",
+    "DEFAULT_OLLAMA_MAX_KEEPALIVE_CONNECTIONS",
+    "DEFAULT_OLLAMA_KEEPALIVE_EXPIRY_SECONDS",
+    "DEFAULT_OLLAMA_TIMEOUT_SECONDS",
+    "DEFAULT_STREAM_BUFFER_SIZE",
+    "OLLAMA_HOSTS_ENV",
+    "DEFAULT_OLLAMA_PROBE_INTERVAL_SECONDS",
+    "DEFAULT_OLLAMA_PROBE_TIMEOUT_SECONDS",
+    "DEFAULT_OLLAMA_OVERFLOW_IN_FLIGHT",
+    "DEFAULT_OPENAI_MAX_CONCURRENT_REQUESTS",
+    "DEFAULT_TOOL_CONCURRENCY",
+    "DEFAULT_BATCH_CONCURRENCY",
+    "DEFAULT_SCHEDULER_MAX_CONCURRENT",
+    "DEFAULT_SCHEDULER_MAX_CONCURRENT_PER_MODEL",
+    "SCHEDULER_MAX_CONCURRENT_ENV",
+    "SCHEDULER_MAX_CONCURRENT_PER_MODEL_ENV",
+    "DEFAULT_SCHEDULER_RESERVED_INTERACTIVE_SLOTS",
+    "SCHEDULER_WAIT_SAMPLE_SIZE",
+    "DEFAULT_HEDGE_PERCENTILE",
+    "DEFAULT_HEDGE_INITIAL_DELAY_SECONDS",
+    "DEFAULT_HEDGE_MIN_DELAY_SECONDS",
+    "DEFAULT_HEDGE_MAX_DELAY_SECONDS",
+    "DEFAULT_HEDGE_MIN_SAMPLES",
+    "HEDGE_LATENCY_SAMPLE_SIZE",
+    "CHARS_PER_TOKEN_ESTIMATE",
+    "MESSAGE_TOKEN_OVERHEAD",
+    "IMAGE_TOKEN_ESTIMATE",
+    "DEFAULT_CONTEXT_WINDOW_TOKENS",
+    "DEFAULT_CONTEXT_OUTPUT_RESERVE_TOKENS",
+    "DEFAULT_CONTEXT_KEEP_LAST_TURNS",
+    "DEFAULT_CONTEXT_TRUNCATE_CHARS",
+    "MODEL_CONTEXT_WINDOW_TOKENS",
+    "AUTO_MODEL",
+    "DEFAULT_ROUTING_EWMA_ALPHA",
+    "DEFAULT_ROUTING_EXPLORE_EVERY",
+    "ROUTING_PROMPT_BUCKET_TOKENS",
+    "DEFAULT_COMPACTION_THRESHOLD_TOKENS",
+    "DEFAULT_COMPACTION_KEEP_LAST_TURNS",
+    "DEFAULT_COMPACTION_SUMMARY_TOKENS",
+    "QUEUE_DURATION_FIELD",
+    "COLD_LOAD_THRESHOLD_SECONDS",
+    "TELEMETRY_FILE_ENV",
+    "TELEMETRY_RATE_BUCKETS",
+    "TELEMETRY_SECONDS_BUCKETS",
+    "RESPONSE_CACHE_PATH",
+    "RESPONSE_CACHE_MODE_ENV",
+    "DEFAULT_RESPONSE_CACHE_MEMORY_ENTRIES",
+    "DEFAULT_RESPONSE_CACHE_DISK_ENTRIES",
+    "DEFAULT_RESPONSE_CACHE_TTL_SECONDS",
+    "DEFAULT_EMBEDDING_MODEL",
+    "EMBEDDING_BATCH_SIZE",
+    "EMBEDDING_CACHE_DIR",
+    "SEMANTIC_CACHE_ENV",
+    "DEFAULT_SEMANTIC_CACHE_THRESHOLD",
+    "DEFAULT_SEMANTIC_CACHE_MAX_ENTRIES",
+    "DEFAULT_SEMANTIC_CACHE_AUDIT_RATE",
 ]
@@ -0,0 +1,25 @@
+from .compaction_stats import CompactionStats
+from .compactor import CompactionConfig, ConversationCompactor
+from .config import (
+    DEFAULT_CONTEXT_STRATEGIES,
+    DEFAULT_CONTEXT_WINDOW_CONFIG,
+    ContextStrategy,
+    ContextWindowConfig,
+)
+from .manager import ContextFitReport, ContextWindowManager
+from .middleware import ContextWindowMiddleware
+from .token_estimator import TokenEstimator
+
+__all__ = [
+    "CompactionConfig",
+    "CompactionStats",
+    "ConversationCompactor",
+    "DEFAULT_CONTEXT_STRATEGIES",
+    "DEFAULT_CONTEXT_WINDOW_CONFIG",
+    "ContextFitReport",
+    "ContextStrategy",
+    "ContextWindowConfig",
+    "ContextWindowManager",
+    "ContextWindowMiddleware",
+    "TokenEstimator",
+]
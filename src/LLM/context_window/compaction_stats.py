@@ -0,0 +1,59 @@
+import statistics
+from dataclasses import dataclass, field
+
+# Below this many requests the latency-per-token fit is too noisy to report.
+MIN_REQUESTS_FOR_LATENCY_ESTIMATE = 3
+
+
+@dataclass
+class CompactionStats:
+    """Per-session prompt-size and latency bookkeeping for compaction."""
+
+    compactions: int = 0
+    summary_seconds: float = 0.0
+    prompt_tokens_sent: list[int] = field(default_factory=list)
+    prompt_tokens_full: list[int] = field(default_factory=list)
+    request_seconds: list[float] = field(default_factory=list)
+
+    def record_request(self, sent_tokens: int, full_tokens: int, seconds: float) -> None:
+        self.prompt_tokens_sent.append(sent_tokens)
+        self.prompt_tokens_full.append(full_tokens)
+        self.request_seconds.append(seconds)
+
+    @property
+    def tokens_saved(self) -> int:
+        return sum(self.prompt_tokens_full) - sum(self.prompt_tokens_sent)
+
+    def seconds_per_prompt_token(self) -> float | None:
+        """Least-squares slope of request latency against prompt size."""
+        if len(self.request_seconds) < MIN_REQUESTS_FOR_LATENCY_ESTIMATE:
+            return None
+        if len(set(self.prompt_tokens_sent)) < 2:
+            return None
+        slope = statistics.linear_regression(self.prompt_tokens_sent, self.request_seconds).slope
+        return max(slope, 0.0)
+
+    def format_report(self) -> str:
+        requests = len(self.request_seconds)
+        if requests == 0:
+            return "Compaction: no requests sent."
+
+        sent = sum(self.prompt_tokens_sent)
+        full = sum(self.prompt_tokens_full)
+        saved_pct = 100 * self.tokens_saved / full if full else 0.0
+        lines = [
+            f"Compaction: {self.compactions} summaries over {requests} requests "
+            f"({self.summary_seconds:.1f}s of background summarization).",
+            f"Prompt tokens sent: ~{sent} vs ~{full} without compaction ({saved_pct:.0f}% smaller).",
+            f"Mean request latency: {statistics.mean(self.request_seconds) * 1000:.0f} ms.",
+        ]
+        per_token = self.seconds_per_prompt_token()
+        if per_token is not None:
+            lines.append(
+                f"Estimated prompt time saved: {self.tokens_saved * per_token:.1f}s "
+                f"(~{per_token * 1000:.2f} ms per prompt token, fitted on this session)."
+            )
+        return "\n".join(lines)
+
+
+__all__ = ["CompactionStats"]
@@ -0,0 +1,192 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
+from ..config import LLMConfig
+from ..constants import (
+    DEFAULT_COMPACTION_KEEP_LAST_TURNS,
+    DEFAULT_COMPACTION_SUMMARY_TOKENS,
+    DEFAULT_COMPACTION_THRESHOLD_TOKENS,
+)
+from ..models.messages import (
+    AssistantMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from ..models.ollama_models import OllamaModels
+from ..providers import BaseProvider
+from ..providers.impl.ollama_balanced import build_ollama_provider
+from ..providers.scheduling import RequestPriority, request_priority
+from ..providers.usage import chat_non_stream_no_tool
+from .compaction_stats import CompactionStats
+from .token_estimator import TokenEstimator
+from .turns import split_turns
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+SUMMARIZER_PROMPT = """You compress chat history. Summarize the conversation below so the
+assistant can continue it without the original messages. Keep names, facts, decisions, open
+questions and user preferences. Drop greetings and filler. Write plain prose, no preamble."""
+
+
+@dataclass(frozen=True)
+class CompactionConfig:
+    """
+    When and how a chat history is folded into a summary.
+
+    Once the history passes `threshold_tokens`, everything except the system
+    prompt and the last `keep_last_turns` turns is summarized by `model`.
+    """
+
+    model: OllamaModels = OllamaModels.GEMMA_1B
+    threshold_tokens: int = DEFAULT_COMPACTION_THRESHOLD_TOKENS
+    keep_last_turns: int = DEFAULT_COMPACTION_KEEP_LAST_TURNS
+    summary_tokens: int = DEFAULT_COMPACTION_SUMMARY_TOKENS
+
+
+DEFAULT_COMPACTION_CONFIG = CompactionConfig()
+
+
+@dataclass
+class _PendingSummary:
+    task: "asyncio.Task[str]"
+    folded: list[BaseMessage]
+    folded_tokens: int
+
+
+def _format_transcript(messages: list[BaseMessage]) -> str:
+    lines = []
+    for message in messages:
+        if isinstance(message, SystemMessage) and message.content.startswith(SUMMARY_PREFIX):
+            lines.append(f"Earlier summary: {message.content[len(SUMMARY_PREFIX):]}")
+        elif isinstance(message, HumanMessage):
+            lines.append(f"User: {message.content}")
+        elif isinstance(message, AssistantMessage) and message.content:
+            lines.append(f"Assistant: {message.content}")
+        elif isinstance(message, ToolMessage):
+            lines.append(f"Tool ({message.tool_name}): {message.content}")
+    return "\n".join(lines)
+
+
+class ConversationCompactor:
+    """
+    Rolling summarization for interactive chats.
+
+    `maybe_start` launches the summary in the background (e.g. while the user
+    is typing); `apply` swaps the summarized prefix for the summary once it is
+    ready and never waits for it, so a slow summarizer cannot delay a turn.
+    """
+
+    def __init__(
+        self,
+        config: CompactionConfig = DEFAULT_COMPACTION_CONFIG,
+        provider: BaseProvider | None = None,
+        estimator: TokenEstimator | None = None,
+    ):
+        self.config = config
+        self.provider = provider or build_ollama_provider(config.model)
+        self.estimator = estimator or TokenEstimator()
+        self.stats = CompactionStats()
+        self._pending: _PendingSummary | None = None
+        self._summary: SystemMessage | None = None
+        self._folded_tokens = 0
+
+    def full_history_tokens(self, conversation: list[BaseMessage]) -> int:
+        """Estimated prompt size had nothing been summarized."""
+        tokens = self.estimator.estimate_all(conversation)
+        if self._summary is not None:
+            tokens += self._folded_tokens - self.estimator.estimate(self._summary)
+        return tokens
+
+    def record_request(self, conversation: list[BaseMessage], seconds: float) -> None:
+        self.stats.record_request(
+            sent_tokens=self.estimator.estimate_all(conversation),
+            full_tokens=self.full_history_tokens(conversation),
+            seconds=seconds,
+        )
+
+    def maybe_start(self, conversation: list[BaseMessage]) -> bool:
+        """Start summarizing the older turns if the history is over the threshold."""
+        if self._pending is not None:
+            return False
+        if self.estimator.estimate_all(conversation) <= self.config.threshold_tokens:
+            return False
+
+        pinned, turns = split_turns(conversation)
+        old_turns = turns[: -self.config.keep_last_turns]
+        if not old_turns:
+            return False
+
+        # The previous summary is pinned right after the system prompt; fold it
+        # into the new summary instead of keeping both.
+        previous = [m for m in pinned if m is self._summary]
+        old_messages = [m for turn in old_turns for m in turn]
+        folded = previous + old_messages
+        self._pending = _PendingSummary(
+            task=asyncio.create_task(self._summarize(folded)),
+            folded=folded,
+            folded_tokens=(self._folded_tokens if previous else 0)
+            + self.estimator.estimate_all(old_messages),
+        )
+        return True
+
+    async def _summarize(self, messages: list[BaseMessage]) -> str:
+        start = time.perf_counter()
+        # Summaries must never delay the turns of the chat they belong to.
+        with request_priority(RequestPriority.BACKGROUND):
+            response = await chat_non_stream_no_tool(
+                provider=self.provider,
+                messages=[
+                    SystemMessage(content=SUMMARIZER_PROMPT),
+                    HumanMessage(content=_format_transcript(messages)),
+                ],
+                llm_config=LLMConfig(temperature=0, num_predict=self.config.summary_tokens),
+            )
+        self.stats.summary_seconds += time.perf_counter() - start
+        return response.content.strip()
+
+    def apply(self, conversation: list[BaseMessage]) -> list[BaseMessage]:
+        """Return the history with a finished summary swapped in, else unchanged."""
+        pending = self._pending
+        if pending is None or not pending.task.done():
+            return conversation
+        self._pending = None
+
+        if pending.task.cancelled():
+            return conversation
+        error = pending.task.exception()
+        if error is not None:
+            print(f"WARNING - Conversation summary failed: {error}")
+            return conversation
+        summary_text = pending.task.result()
+        if not summary_text:
+            return conversation
+
+        folded_ids = {id(m) for m in pending.folded}
+        if not folded_ids.issubset(id(m) for m in conversation):
+            # The history was edited meanwhile; the summary no longer matches it.
+            return conversation
+
+        summary = SystemMessage(content=SUMMARY_PREFIX + summary_text)
+        leading, _ = split_turns(conversation)
+        system_prompt = [m for m in leading if id(m) not in folded_ids]
+        rest = [m for m in conversation[len(leading) :] if id(m) not in folded_ids]
+
+        self._summary = summary
+        self._folded_tokens = pending.folded_tokens
+        self.stats.compactions += 1
+        return system_prompt + [summary] + rest
+
+    async def aclose(self) -> None:
+        if self._pending is not None:
+            self._pending.task.cancel()
+            try:
+                await self._pending.task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._pending = None
+
+
+__all__ = ["DEFAULT_COMPACTION_CONFIG", "CompactionConfig", "ConversationCompactor"]
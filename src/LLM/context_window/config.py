@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from enum import Enum
+
+from ..constants import (
+    DEFAULT_CONTEXT_KEEP_LAST_TURNS,
+    DEFAULT_CONTEXT_OUTPUT_RESERVE_TOKENS,
+    DEFAULT_CONTEXT_TRUNCATE_CHARS,
+    DEFAULT_CONTEXT_WINDOW_TOKENS,
+    MODEL_CONTEXT_WINDOW_TOKENS,
+)
+
+
+class ContextStrategy(Enum):
+    # Replace tool outputs that a newer call to the same tool superseded, or
+    # that fall outside the recent turns, with a short placeholder.
+    DROP_STALE_TOOL_OUTPUTS = "drop_stale_tool_outputs"
+    # Shorten the content of messages outside the recent turns.
+    TRUNCATE_OLD_TURNS = "truncate_old_turns"
+    # Keep only the leading system prompt and the recent turns.
+    PIN_SYSTEM_AND_RECENT = "pin_system_and_recent"
+
+
+DEFAULT_CONTEXT_STRATEGIES = (
+    ContextStrategy.DROP_STALE_TOOL_OUTPUTS,
+    ContextStrategy.TRUNCATE_OLD_TURNS,
+    ContextStrategy.PIN_SYSTEM_AND_RECENT,
+)
+
+
+@dataclass(frozen=True)
+class ContextWindowConfig:
+    """
+    How a conversation is fitted into a model's context window.
+
+    Strategies run in order and stop as soon as the history fits. If it still
+    does not fit, the oldest unpinned turns are dropped, always keeping the
+    latest turn. `max_context_tokens` overrides the per-model window table.
+    """
+
+    strategies: tuple[ContextStrategy, ...] = DEFAULT_CONTEXT_STRATEGIES
+    keep_last_turns: int = DEFAULT_CONTEXT_KEEP_LAST_TURNS
+    truncate_chars: int = DEFAULT_CONTEXT_TRUNCATE_CHARS
+    output_reserve_tokens: int = DEFAULT_CONTEXT_OUTPUT_RESERVE_TOKENS
+    max_context_tokens: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.keep_last_turns < 1:
+            raise ValueError(f"keep_last_turns must be at least 1, got {self.keep_last_turns}")
+        if self.truncate_chars < 0:
+            raise ValueError(f"truncate_chars must not be negative, got {self.truncate_chars}")
+
+    def budget_for(self, model: str) -> int:
+        """Prompt token budget: the model's window minus room for the reply."""
+        window = self.max_context_tokens or MODEL_CONTEXT_WINDOW_TOKENS.get(
+            model, DEFAULT_CONTEXT_WINDOW_TOKENS
+        )
+        return max(window - self.output_reserve_tokens, 0)
+
+
+DEFAULT_CONTEXT_WINDOW_CONFIG = ContextWindowConfig()
+
+
+__all__ = [
+    "DEFAULT_CONTEXT_STRATEGIES",
+    "DEFAULT_CONTEXT_WINDOW_CONFIG",
+    "ContextStrategy",
+    "ContextWindowConfig",
+]
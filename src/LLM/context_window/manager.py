@@ -0,0 +1,79 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from ..models.messages import BaseMessage
+from .config import DEFAULT_CONTEXT_WINDOW_CONFIG, ContextStrategy, ContextWindowConfig
+from .strategies import STRATEGY_FUNCTIONS
+from .token_estimator import TokenEstimator
+from .turns import Turn, join_turns, split_turns
+
+
+@dataclass
+class ContextFitReport:
+    budget: int
+    tokens_before: int
+    tokens_after: int
+    strategies_applied: list[ContextStrategy] = field(default_factory=list)
+    dropped_turns: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.strategies_applied) or self.dropped_turns > 0
+
+    @property
+    def fits(self) -> bool:
+        return self.tokens_after <= self.budget
+
+
+class ContextWindowManager:
+    """
+    Fit a conversation into a model's prompt budget.
+
+    Message objects that survive unchanged are returned as-is, so their token
+    estimates and ConversationBuffer wire dicts stay cached.
+    """
+
+    def __init__(
+        self,
+        config: ContextWindowConfig = DEFAULT_CONTEXT_WINDOW_CONFIG,
+        estimator: TokenEstimator | None = None,
+    ):
+        self.config = config
+        self.estimator = estimator or TokenEstimator()
+        self.last_report: ContextFitReport | None = None
+
+    def _count(self, pinned: list[BaseMessage], turns: list[Turn]) -> int:
+        return self.estimator.estimate_all(pinned) + sum(
+            self.estimator.estimate_all(turn) for turn in turns
+        )
+
+    def fit(self, messages: Sequence[BaseMessage], model: str) -> list[BaseMessage]:
+        budget = self.config.budget_for(model)
+        tokens = self.estimator.estimate_all(list(messages))
+        report = ContextFitReport(budget=budget, tokens_before=tokens, tokens_after=tokens)
+        self.last_report = report
+        if tokens <= budget:
+            return list(messages)
+
+        pinned, turns = split_turns(messages)
+        for strategy in self.config.strategies:
+            turns = STRATEGY_FUNCTIONS[strategy](turns, self.config)
+            report.strategies_applied.append(strategy)
+            tokens = self._count(pinned, turns)
+            if tokens <= budget:
+                break
+
+        while tokens > budget and len(turns) > 1:
+            tokens -= self.estimator.estimate_all(turns.pop(0))
+            report.dropped_turns += 1
+
+        report.tokens_after = tokens
+        if not report.fits:
+            print(
+                f"WARNING - Conversation needs ~{tokens} tokens, over the {budget} token "
+                f"budget for '{model}' even after trimming."
+            )
+        return join_turns(pinned, turns)
+
+
+__all__ = ["ContextFitReport", "ContextWindowManager"]
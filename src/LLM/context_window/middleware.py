@@ -0,0 +1,24 @@
+from collections.abc import MutableSequence
+
+from ..models.messages import BaseMessage
+from ..models.tool_context import ToolLoopMiddleware, ToolUsageContext
+from .manager import ContextWindowManager
+
+
+class ContextWindowMiddleware(ToolLoopMiddleware):
+    """Trim the tool loop's history in place before each LLM call."""
+
+    def __init__(self, model: str, manager: ContextWindowManager | None = None):
+        self.model = model
+        self.manager = manager or ContextWindowManager()
+
+    async def on_before_llm_call(
+        self, messages: MutableSequence[BaseMessage], context: ToolUsageContext
+    ) -> None:
+        fitted = self.manager.fit(messages, self.model)
+        report = self.manager.last_report
+        if report is not None and report.changed:
+            messages[:] = fitted
+
+
+__all__ = ["ContextWindowMiddleware"]
@@ -0,0 +1,95 @@
+import json
+from collections.abc import Callable
+from dataclasses import replace
+
+from ..models.messages import AssistantMessage, BaseMessage, ToolMessage
+from .config import ContextStrategy, ContextWindowConfig
+from .turns import Turn
+
+STALE_TOOL_OUTPUT = "[Earlier {tool_name} output omitted to save context.]"
+TRUNCATION_MARKER = " ...[truncated]"
+
+StrategyFn = Callable[[list[Turn], ContextWindowConfig], list[Turn]]
+
+
+def _tool_call_signatures(turn: Turn) -> list[tuple[str, str] | None]:
+    """
+    Pair each tool message in a turn with the (name, arguments) of the call that
+    produced it. Tool results follow their assistant message in call order.
+    """
+    calls: list[tuple[str, str]] = []
+    signatures: list[tuple[str, str] | None] = []
+    for message in turn:
+        if isinstance(message, AssistantMessage):
+            calls = [
+                (tc.tool.name, json.dumps(tc.arguments, sort_keys=True, default=str))
+                for tc in message.tool_calls or []
+            ]
+        elif isinstance(message, ToolMessage):
+            signatures.append(calls.pop(0) if calls else None)
+    return signatures
+
+
+def drop_stale_tool_outputs(turns: list[Turn], config: ContextWindowConfig) -> list[Turn]:
+    """
+    Replace tool outputs outside the recent turns, and outputs superseded by a
+    later identical call (e.g. repeated `view_book` dumps), with a placeholder.
+    """
+    recent_start = max(len(turns) - config.keep_last_turns, 0)
+    seen: set[tuple[str, str]] = set()
+    result: list[Turn] = []
+    for turn_index in range(len(turns) - 1, -1, -1):
+        turn = turns[turn_index]
+        signatures = _tool_call_signatures(turn)
+        new_turn: Turn = []
+        tool_position = len(signatures)
+        for message in reversed(turn):
+            if isinstance(message, ToolMessage):
+                tool_position -= 1
+                signature = signatures[tool_position]
+                superseded = signature is not None and signature in seen
+                if signature is not None:
+                    seen.add(signature)
+                placeholder = STALE_TOOL_OUTPUT.format(tool_name=message.tool_name)
+                if (superseded or turn_index < recent_start) and len(message.content) > len(
+                    placeholder
+                ):
+                    message = replace(message, content=placeholder)
+            new_turn.append(message)
+        new_turn.reverse()
+        result.append(new_turn)
+    result.reverse()
+    return result
+
+
+def _truncate(message: BaseMessage, max_chars: int) -> BaseMessage:
+    if len(message.content) <= max_chars + len(TRUNCATION_MARKER):
+        return message
+    return replace(message, content=message.content[:max_chars] + TRUNCATION_MARKER)
+
+
+def truncate_old_turns(turns: list[Turn], config: ContextWindowConfig) -> list[Turn]:
+    recent_start = max(len(turns) - config.keep_last_turns, 0)
+    return [
+        turn if index >= recent_start else [_truncate(m, config.truncate_chars) for m in turn]
+        for index, turn in enumerate(turns)
+    ]
+
+
+def pin_system_and_recent(turns: list[Turn], config: ContextWindowConfig) -> list[Turn]:
+    return turns[-config.keep_last_turns :]
+
+
+STRATEGY_FUNCTIONS: dict[ContextStrategy, StrategyFn] = {
+    ContextStrategy.DROP_STALE_TOOL_OUTPUTS: drop_stale_tool_outputs,
+    ContextStrategy.TRUNCATE_OLD_TURNS: truncate_old_turns,
+    ContextStrategy.PIN_SYSTEM_AND_RECENT: pin_system_and_recent,
+}
+
+
+__all__ = [
+    "STRATEGY_FUNCTIONS",
+    "drop_stale_tool_outputs",
+    "pin_system_and_recent",
+    "truncate_old_turns",
+]
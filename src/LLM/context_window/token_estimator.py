@@ -0,0 +1,62 @@
+import functools
+import json
+import math
+import weakref
+
+from ..constants import CHARS_PER_TOKEN_ESTIMATE, IMAGE_TOKEN_ESTIMATE, MESSAGE_TOKEN_OVERHEAD
+from ..models.messages import AssistantMessage, BaseMessage, HumanMessage
+
+
+def _count_message_tokens(message: BaseMessage) -> int:
+    chars = len(message.content)
+    images = 0
+    if isinstance(message, AssistantMessage):
+        chars += len(message.thinking or "")
+        for tc in message.tool_calls or []:
+            chars += len(tc.tool.name) + len(json.dumps(tc.arguments, default=str))
+    elif isinstance(message, HumanMessage):
+        images = len(message.images or [])
+    text_tokens = math.ceil(chars / CHARS_PER_TOKEN_ESTIMATE)
+    return MESSAGE_TOKEN_OVERHEAD + text_tokens + images * IMAGE_TOKEN_ESTIMATE
+
+
+_Cache = dict[int, tuple[weakref.ref[BaseMessage], int]]
+
+
+def _evict(cache: _Cache, key: int, ref: weakref.ref[BaseMessage]) -> None:
+    cache.pop(key, None)
+
+
+class TokenEstimator:
+    """
+    Character-based token estimate, cached per message object.
+
+    Messages are dataclasses and not hashable, so the cache is keyed by id and
+    entries are dropped by a weakref callback when the message is collected;
+    a recycled id can never return a stale count. Like ConversationBuffer, this
+    assumes messages are not mutated once they are in a conversation.
+    """
+
+    def __init__(self) -> None:
+        self._cache: _Cache = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def estimate(self, message: BaseMessage) -> int:
+        key = id(message)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0]() is message:
+            return cached[1]
+
+        tokens = _count_message_tokens(message)
+        # The callback holds the dict, not self, so the estimator is not kept alive by it.
+        ref = weakref.ref(message, functools.partial(_evict, self._cache, key))
+        self._cache[key] = (ref, tokens)
+        return tokens
+
+    def estimate_all(self, messages: "list[BaseMessage]") -> int:
+        return sum(self.estimate(message) for message in messages)
+
+
+__all__ = ["TokenEstimator"]
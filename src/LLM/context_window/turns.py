@@ -0,0 +1,39 @@
+from collections.abc import Sequence
+
+from ..models.messages import AssistantMessage, BaseMessage, HumanMessage, SystemMessage
+
+Turn = list[BaseMessage]
+
+
+def split_turns(messages: Sequence[BaseMessage]) -> tuple[list[BaseMessage], list[Turn]]:
+    """
+    Split a history into the leading system prompt and a list of turns.
+
+    A turn starts at a user message, or at an assistant message when the current
+    turn already has one. Tool results and injected system messages stay with
+    the turn they follow, so an assistant's tool calls and their results are
+    never separated.
+    """
+    index = 0
+    while index < len(messages) and isinstance(messages[index], SystemMessage):
+        index += 1
+    pinned = list(messages[:index])
+
+    turns: list[Turn] = []
+    turn_has_assistant = False
+    for message in messages[index:]:
+        is_assistant = isinstance(message, AssistantMessage)
+        if not turns or isinstance(message, HumanMessage) or (is_assistant and turn_has_assistant):
+            turns.append([message])
+            turn_has_assistant = is_assistant
+        else:
+            turns[-1].append(message)
+            turn_has_assistant = turn_has_assistant or is_assistant
+    return pinned, turns
+
+
+def join_turns(pinned: list[BaseMessage], turns: list[Turn]) -> list[BaseMessage]:
+    return pinned + [message for turn in turns for message in turn]
+
+
+__all__ = ["Turn", "join_turns", "split_turns"]
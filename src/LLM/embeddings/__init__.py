@@ -0,0 +1,17 @@
+from .cache import (
+    EmbeddingCache,
+    EmbeddingCacheStats,
+    embed_in_batches,
+    embedding_cache_enabled,
+    get_shared_embedding_cache,
+)
+from .vector_store import VectorStore
+
+__all__ = [
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "VectorStore",
+    "embed_in_batches",
+    "embedding_cache_enabled",
+    "get_shared_embedding_cache",
+]
@@ -0,0 +1,118 @@
+import asyncio
+import hashlib
+import math
+import os
+import re
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..constants import EMBEDDING_BATCH_SIZE, EMBEDDING_CACHE_DIR, RESPONSE_CACHE_MODE_ENV
+from .vector_store import VectorStore
+
+EmbedBatch = Callable[[list[str]], Awaitable[list[list[float]]]]
+
+
+@dataclass
+class EmbeddingCacheStats:
+    hits: int = 0
+    misses: int = 0
+    batches: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def text_key(model: str, text: str) -> str:
+    return hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+
+
+def embedding_cache_enabled() -> bool:
+    """Embeddings are deterministic, so only AI_FUN_LLM_CACHE=off turns the cache off."""
+    return os.getenv(RESPONSE_CACHE_MODE_ENV, "").strip().lower() != "off"
+
+
+async def embed_in_batches(
+    texts: Sequence[str], embed_batch: EmbedBatch, batch_size: int = EMBEDDING_BATCH_SIZE
+) -> list[list[float]]:
+    """Embed each distinct text once, `batch_size` texts per request, in input order."""
+    unique = list(dict.fromkeys(texts))
+    vectors: dict[str, list[float]] = {}
+    for start in range(0, len(unique), batch_size):
+        batch = unique[start : start + batch_size]
+        vectors.update(zip(batch, await embed_batch(batch)))
+    return [vectors[text] for text in texts]
+
+
+class EmbeddingCache:
+    """
+    Content-hashed vector cache with one VectorStore per embedding model.
+
+    Only texts that were never embedded with a model reach `embed_batch`, so
+    repeated system prompts and field descriptions cost one lookup each.
+    """
+
+    def __init__(self, directory: str | Path = EMBEDDING_CACHE_DIR):
+        self.directory = Path(directory)
+        self.stats = EmbeddingCacheStats()
+        self._stores: dict[str, VectorStore] = {}
+
+    def store(self, model: str) -> VectorStore:
+        store = self._stores.get(model)
+        if store is None:
+            store = VectorStore(self.directory / re.sub(r"[^\w.-]", "_", model))
+            self._stores[model] = store
+        return store
+
+    async def embed(
+        self,
+        model: str,
+        texts: Sequence[str],
+        embed_batch: EmbedBatch,
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+    ) -> list[list[float]]:
+        store = self.store(model)
+        cached = await asyncio.to_thread(store.get_many, [text_key(model, t) for t in texts])
+
+        missing = list(dict.fromkeys(t for t, vector in zip(texts, cached) if vector is None))
+        self.stats.hits += sum(vector is not None for vector in cached)
+        self.stats.misses += len(missing)
+        fresh: dict[str, list[float]] = {}
+        if missing:
+            self.stats.batches += math.ceil(len(missing) / batch_size)
+            vectors = await embed_in_batches(missing, embed_batch, batch_size)
+            await asyncio.to_thread(
+                store.put_many, [text_key(model, t) for t in missing], vectors
+            )
+            fresh = dict(zip(missing, vectors))
+        return [vector if vector is not None else fresh[t] for t, vector in zip(texts, cached)]
+
+    def close(self) -> None:
+        for store in self._stores.values():
+            store.close()
+
+
+_shared_caches: dict[Path, EmbeddingCache] = {}
+
+
+def get_shared_embedding_cache(directory: str | Path = EMBEDDING_CACHE_DIR) -> EmbeddingCache:
+    """One cache (and one memory map per model) per directory, shared by all providers."""
+    path = Path(directory)
+    cache = _shared_caches.get(path)
+    if cache is None:
+        cache = EmbeddingCache(path)
+        _shared_caches[path] = cache
+    return cache
+
+
+__all__ = [
+    "EmbedBatch",
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "embed_in_batches",
+    "embedding_cache_enabled",
+    "get_shared_embedding_cache",
+    "text_key",
+]
@@ -0,0 +1,196 @@
+import importlib.util
+import json
+import mmap
+import threading
+from array import array
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import cast
+
+_VECTORS_FILE = "vectors.f32"
+_INDEX_FILE = "index.txt"
+_META_FILE = "meta.json"
+_LOCK_FILE = ".lock"
+_FLOAT_SIZE = array("f").itemsize
+# fcntl is POSIX-only; elsewhere only appends within this process are serialized.
+HAS_FCNTL = importlib.util.find_spec("fcntl") is not None
+
+
+class VectorStore:
+    """
+    Append-only on-disk vectors for one embedding model.
+
+    Rows live in `vectors.f32`, a flat float32 array read through a memory
+    map, and `index.txt` holds one key per row in the same order. Vectors are
+    written before their keys, so a crash mid-write leaves at most an unused
+    tail. Several processes may share a directory (the daemon and a `--local`
+    run, say): appends hold an exclusive lock on `.lock` (where fcntl is
+    available) and take their row numbers from the file on disk, and readers
+    pick up rows appended by others by reading the new tail of the index.
+    Methods are blocking; call them through asyncio.to_thread.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.dim: int | None = None
+        self._rows: dict[str, int] = {}
+        self._lock = threading.Lock()
+        # How much of index.txt has been read, in bytes and in rows.
+        self._index_offset = 0
+        self._index_rows = 0
+        self._map: mmap.mmap | None = None
+        self._view: memoryview[float] | None = None
+        self._mapped_size = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._rows)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if not HAS_FCNTL:
+            yield
+            return
+        import fcntl
+
+        with open(self.directory / _LOCK_FILE, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _vectors_size(self) -> int:
+        path = self.directory / _VECTORS_FILE
+        return path.stat().st_size if path.exists() else 0
+
+    def _refresh(self) -> None:
+        """Read keys appended to the index since the last call and remap if the file grew."""
+        if self.dim is None:
+            meta_path = self.directory / _META_FILE
+            if not meta_path.exists():
+                return
+            self.dim = int(json.loads(meta_path.read_text(encoding="utf-8"))["dim"])
+        index_path = self.directory / _INDEX_FILE
+        if index_path.exists() and index_path.stat().st_size > self._index_offset:
+            with open(index_path, "rb") as f:
+                f.seek(self._index_offset)
+                tail = f.read()
+            # A key still being written has no newline yet; leave it for next time.
+            complete = tail[: tail.rfind(b"\n") + 1]
+            for key in complete.decode("utf-8").splitlines():
+                self._rows[key] = self._index_rows
+                self._index_rows += 1
+            self._index_offset += len(complete)
+        if self._vectors_size() != self._mapped_size:
+            self._remap()
+
+    def _repair(self) -> None:
+        """
+        Drop rows left half-written by an interrupted append. Runs under the
+        file lock, so no other process is mid-write.
+        """
+        assert self.dim is not None
+        row_bytes = self.dim * _FLOAT_SIZE
+        index_path = self.directory / _INDEX_FILE
+        vectors_path = self.directory / _VECTORS_FILE
+        index_size = index_path.stat().st_size if index_path.exists() else 0
+        vectors_size = self._vectors_size()
+        if index_size == self._index_offset and vectors_size == self._index_rows * row_bytes:
+            return
+        keys = index_path.read_text(encoding="utf-8").split("\n")[: self._index_rows]
+        rows = min(len(keys), vectors_size // row_bytes)
+        self._unmap()
+        with open(vectors_path, "ab") as f:
+            f.truncate(rows * row_bytes)
+        data = "".join(key + "\n" for key in keys[:rows])
+        index_path.write_text(data, encoding="utf-8")
+        self._rows = {key: row for row, key in enumerate(keys[:rows])}
+        self._index_offset = len(data.encode("utf-8"))
+        self._index_rows = rows
+        self._remap()
+
+    def _remap(self) -> None:
+        self._unmap()
+        path = self.directory / _VECTORS_FILE
+        size = self._vectors_size()
+        if size == 0:
+            return
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map).cast("f")
+        self._mapped_size = size
+
+    def _unmap(self) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._mapped_size = 0
+
+    def _lookup(self, keys: Sequence[str]) -> list[list[float] | None]:
+        if self._view is None or self.dim is None:
+            return [None] * len(keys)
+        dim, view = self.dim, self._view
+        rows = len(view) // dim
+        results: list[list[float] | None] = []
+        for key in keys:
+            row = self._rows.get(key)
+            if row is None or row >= rows:
+                results.append(None)
+            else:
+                # typeshed types tolist() as list[int] whatever the format.
+                results.append(cast(list[float], view[row * dim : (row + 1) * dim].tolist()))
+        return results
+
+    def get_many(self, keys: Sequence[str]) -> list[list[float] | None]:
+        with self._lock:
+            self._refresh()
+            return self._lookup(keys)
+
+    def put_many(self, keys: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        with self._lock, self._file_lock():
+            # Another process may have appended since our last read.
+            self._refresh()
+            fresh: dict[str, Sequence[float]] = {}
+            for key, vector in zip(keys, vectors):
+                if key not in self._rows:
+                    fresh[key] = vector
+            if not fresh:
+                return
+            if self.dim is None:
+                self.dim = len(next(iter(fresh.values())))
+                (self.directory / _META_FILE).write_text(json.dumps({"dim": self.dim}))
+                (self.directory / _INDEX_FILE).touch()
+            for vector in fresh.values():
+                if len(vector) != self.dim:
+                    raise ValueError(f"Expected {self.dim}-dimensional vectors, got {len(vector)}")
+            self._repair()
+
+            flat = array("f")
+            for vector in fresh.values():
+                flat.extend(vector)
+            first_row = self._vectors_size() // (self.dim * _FLOAT_SIZE)
+            self._unmap()
+            with open(self.directory / _VECTORS_FILE, "ab") as f:
+                f.write(flat.tobytes())
+            data = "".join(key + "\n" for key in fresh).encode("utf-8")
+            with open(self.directory / _INDEX_FILE, "ab") as f:
+                f.write(data)
+            for row, key in enumerate(fresh, start=first_row):
+                self._rows[key] = row
+            self._index_offset += len(data)
+            self._index_rows = first_row + len(fresh)
+            self._remap()
+
+    def close(self) -> None:
+        with self._lock:
+            self._unmap()
+
+
+__all__ = ["VectorStore"]
@@ -1,4 +1,4 @@
-from ..providers.impl.ollama import DEFAULT_MODEL, OllamaModels, get_model
+from .ollama_models import DEFAULT_MODEL, OllamaModels, get_model
 
 __all__ = [
     "DEFAULT_MODEL",
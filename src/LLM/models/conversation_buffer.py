@@ -0,0 +1,68 @@
+from collections.abc import Iterable, MutableSequence
+from typing import Any, overload
+
+from .messages import BaseMessage
+
+
+class ConversationBuffer(MutableSequence[BaseMessage]):
+    """
+    A message list that serializes each message to its wire dict once.
+
+    Providers read `to_wire()` instead of re-running `to_ollama_dict()` over the
+    whole history on every call, so a growing tool loop only pays for the new
+    messages. Messages are treated as immutable once added; to change one,
+    replace it (`buffer[i] = new_message`) so its dict is rebuilt.
+    """
+
+    def __init__(self, messages: Iterable[BaseMessage] = ()):
+        self._messages: list[BaseMessage] = []
+        self._wire: list[dict[str, Any]] = []
+        self.extend(messages)
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    @overload
+    def __getitem__(self, index: int) -> BaseMessage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[BaseMessage]: ...
+
+    def __getitem__(self, index: int | slice) -> BaseMessage | list[BaseMessage]:
+        return self._messages[index]
+
+    @overload
+    def __setitem__(self, index: int, value: BaseMessage) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[BaseMessage]) -> None: ...
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        if isinstance(index, slice):
+            # Reuse dicts for messages that survive the replacement, e.g. when a
+            # context manager drops or rewrites only part of the history.
+            cached = {id(msg): wire for msg, wire in zip(self._messages, self._wire)}
+            new_messages = list(value)
+            self._messages[index] = new_messages
+            self._wire[index] = [cached.get(id(msg)) or msg.to_ollama_dict() for msg in new_messages]
+        else:
+            self._messages[index] = value
+            self._wire[index] = value.to_ollama_dict()
+
+    def __delitem__(self, index: int | slice) -> None:
+        del self._messages[index]
+        del self._wire[index]
+
+    def insert(self, index: int, value: BaseMessage) -> None:
+        self._messages.insert(index, value)
+        self._wire.insert(index, value.to_ollama_dict())
+
+    def to_wire(self) -> list[dict[str, Any]]:
+        """The cached wire dicts. Shared with the buffer; do not mutate."""
+        return self._wire
+
+    def to_list(self) -> list[BaseMessage]:
+        return list(self._messages)
+
+
+__all__ = ["ConversationBuffer"]
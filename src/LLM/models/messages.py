@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
+from ..telemetry.metrics import CallMetrics
 from ..tools.base import ToolCall
 
 
@@ -50,6 +51,7 @@ class AssistantMessage(BaseMessage):
     model: str | None = None
     done: bool | None = None
     parsed: Any = None
+    metrics: CallMetrics | None = None
 
     @property
     def role(self) -> str:
@@ -74,6 +76,17 @@ class AssistantMessage(BaseMessage):
         return result
 
 
+@dataclass
+class AssistantMessageDelta(AssistantMessage):
+    """
+    One streamed piece of an assistant reply, meant for display.
+
+    Carries only the new content/thinking text. The complete message, with
+    tool calls and parsed output, is yielded as a plain AssistantMessage
+    once the stream ends.
+    """
+
+
 @dataclass
 class ToolMessage(BaseMessage):
     tool_call_id: str = ""
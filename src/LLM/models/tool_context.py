@@ -1,3 +1,4 @@
+from collections.abc import MutableSequence, Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -14,7 +15,9 @@ class ToolUsageContext:
 
 
 class ToolLoopMiddleware:
-    async def on_before_llm_call(self, messages: list, context: ToolUsageContext) -> None:
+    async def on_before_llm_call(
+        self, messages: "MutableSequence[BaseMessage]", context: ToolUsageContext
+    ) -> None:
         pass
 
     async def on_after_llm_call(self, assistant_msg: Any, context: ToolUsageContext) -> None:
@@ -32,6 +35,6 @@ class ToolLoopMiddleware:
         return True
 
     async def on_injections(
-        self, injections: list, context: ToolUsageContext
+        self, injections: "Sequence[BaseMessage]", context: ToolUsageContext
     ) -> "list[BaseMessage]":
         return []
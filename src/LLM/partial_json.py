@@ -0,0 +1,127 @@
+import json
+from dataclasses import dataclass
+from typing import Any
+
+JSONPath = tuple[str | int, ...]
+
+_WHITESPACE = " \t\r\n"
+_SCALAR_END = _WHITESPACE + ",:]}"
+
+
+@dataclass
+class _Container:
+    path: JSONPath
+    value: dict[str, Any] | list[Any]
+    key: str | None = None
+
+    def next_path(self) -> JSONPath:
+        if isinstance(self.value, dict):
+            return (*self.path, self.key or "")
+        return (*self.path, len(self.value))
+
+    def add(self, value: Any) -> JSONPath:
+        path = self.next_path()
+        if isinstance(self.value, dict):
+            self.value[self.key or ""] = value
+            self.key = None
+        else:
+            self.value.append(value)
+        return path
+
+
+@dataclass
+class ClosedValue:
+    path: JSONPath
+    value: Any
+
+
+class PartialJSONParser:
+    """
+    Incremental JSON parser for streamed model output.
+
+    feed() takes text as it arrives and returns every value that closed in it,
+    innermost first, with its path from the root (object keys and list
+    indexes). Strings and numbers are decoded by `json` once their last
+    character has arrived, so escapes split across chunks are handled. Work
+    is linear in the streamed text; nothing is re-parsed.
+    """
+
+    def __init__(self) -> None:
+        self.root: Any = None
+        self.done = False
+        self._stack: list[_Container] = []
+        self._token: list[str] = []
+        self._in_string = False
+        self._in_scalar = False
+        self._escaped = False
+        self._string_is_key = False
+
+    def feed(self, text: str) -> list[ClosedValue]:
+        closed: list[ClosedValue] = []
+        for char in text:
+            if self._in_string:
+                self._string_char(char, closed)
+                continue
+            if self._in_scalar:
+                if char not in _SCALAR_END:
+                    self._token.append(char)
+                    continue
+                self._in_scalar = False
+                self._close(json.loads("".join(self._token)), closed)
+            self._structural_char(char, closed)
+        return closed
+
+    def _string_char(self, char: str, closed: list[ClosedValue]) -> None:
+        if self._escaped:
+            self._escaped = False
+        elif char == "\\":
+            self._escaped = True
+        elif char == '"':
+            self._in_string = False
+            value = json.loads('"' + "".join(self._token) + '"')
+            if self._string_is_key:
+                self._stack[-1].key = value
+            else:
+                self._close(value, closed)
+            return
+        self._token.append(char)
+
+    def _structural_char(self, char: str, closed: list[ClosedValue]) -> None:
+        if char in _WHITESPACE or char in ",:":
+            return
+        if self.done:
+            raise ValueError(f"Unexpected {char!r} after the end of the JSON value")
+        if char in "{[":
+            path = self._stack[-1].next_path() if self._stack else ()
+            self._stack.append(_Container(path, {} if char == "{" else []))
+        elif char in "}]":
+            if not self._stack:
+                raise ValueError(f"Unexpected {char!r} outside of any object or list")
+            self._close(self._stack.pop().value, closed)
+        elif char == '"':
+            top = self._stack[-1] if self._stack else None
+            self._string_is_key = (
+                top is not None and isinstance(top.value, dict) and top.key is None
+            )
+            self._in_string = True
+            self._token = []
+        else:
+            self._in_scalar = True
+            self._token = [char]
+
+    def _close(self, value: Any, closed: list[ClosedValue]) -> None:
+        if not self._stack:
+            self.root = value
+            self.done = True
+            closed.append(ClosedValue((), value))
+            return
+        closed.append(ClosedValue(self._stack[-1].add(value), value))
+
+    def partial(self) -> Any:
+        """The value built so far; open objects and lists hold their closed members only."""
+        if self.done:
+            return self.root
+        return self._stack[0].value if self._stack else None
+
+
+__all__ = ["ClosedValue", "JSONPath", "PartialJSONParser"]
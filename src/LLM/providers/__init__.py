@@ -7,6 +7,10 @@ def get_provider(provider_type: str):
         from .impl.ollama import OllamaProvider
 
         return OllamaProvider
+    elif provider_type == "ollama_pool":
+        from .impl.ollama_balanced import BalancedOllamaProvider
+
+        return BalancedOllamaProvider
     elif provider_type == "openai":
         from .impl.openai import OpenAIProvider
 
@@ -1,4 +1,6 @@
 from .base import BaseProvider
+from .stream_accumulator import StreamAccumulator
 from .tool_usage import default_execute_tool_calls
+from .toolset import CompiledToolset
 
-__all__ = ["BaseProvider", "default_execute_tool_calls"]
+__all__ = ["BaseProvider", "CompiledToolset", "StreamAccumulator", "default_execute_tool_calls"]
@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Sequence
 from typing import TYPE_CHECKING
 
+from ...constants import DEFAULT_BATCH_CONCURRENCY
+
 if TYPE_CHECKING:
     from ...config import LLMConfig
     from ...models.messages import AssistantMessage, BaseMessage, ToolMessage
     from ...tools.base import AgentTool
+    from ..usage.batch import BatchProgress, BatchReport
+    from .toolset import CompiledToolset
 
 
 class BaseProvider(ABC):
@@ -14,15 +18,16 @@ class BaseProvider(ABC):
     @abstractmethod
     async def chat(
         self,
-        messages: list["BaseMessage"],
+        messages: "Sequence[BaseMessage]",
         llm_config: "LLMConfig | None" = None,
-        agent_tools: "list[AgentTool] | None" = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
     ) -> "tuple[AssistantMessage, list[ToolMessage]]":
         """
         Call the LLM and return the response.
 
         Provider handles message transformation, API calls, and tool execution.
-        Pass agent_tools to enable tool calling.
+        Pass agent_tools (or a CompiledToolset) to enable tool calling. A
+        ConversationBuffer is accepted as messages and reuses its cached dicts.
 
         Returns:
             tuple: (assistant_message, tool_messages)
@@ -32,12 +37,41 @@ class BaseProvider(ABC):
     @abstractmethod
     async def stream(
         self,
-        messages: list["BaseMessage"],
+        messages: "Sequence[BaseMessage]",
         llm_config: "LLMConfig | None" = None,
-        agent_tools: "list[AgentTool] | None" = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
     ) -> "AsyncGenerator[AssistantMessage | ToolMessage, None]":
         """
         Stream responses from the LLM.
-        Yields AssistantMessage chunks, then ToolMessages if tool calls executed.
+        Yields AssistantMessageDelta chunks, then the complete AssistantMessage,
+        then ToolMessages if tool calls executed.
         """
         yield  # type: ignore
+
+    async def embed(self, texts: "Sequence[str]") -> "list[list[float]]":
+        """
+        Embedding vectors for `texts`, in input order.
+        Not every backend supports embeddings; those raise NotImplementedError.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support embeddings")
+
+    async def chat_many(
+        self,
+        conversations: "Sequence[Sequence[BaseMessage]]",
+        llm_config: "LLMConfig | None" = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        on_progress: "Callable[[BatchProgress], None] | None" = None,
+    ) -> "BatchReport":
+        """
+        Answer many independent conversations (no tools) at bounded concurrency.
+        See usage.chat_many; results come back in input order with per-item errors.
+        """
+        from ..usage.batch import chat_many
+
+        return await chat_many(
+            self, conversations, llm_config, concurrency=concurrency, on_progress=on_progress
+        )
+
+    async def aclose(self) -> None:
+        """Release network resources held by the provider. No-op by default."""
+        return None
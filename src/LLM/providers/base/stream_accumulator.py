@@ -0,0 +1,120 @@
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from pydantic import BaseModel
+
+from ...models.messages import AssistantMessage, AssistantMessageDelta
+from ...tools.base import Tool
+from .utils import to_message
+
+
+@dataclass
+class _ToolCallFragment:
+    id: str = ""
+    name: str = ""
+    argument_parts: list[str] = field(default_factory=list)
+    arguments: dict[str, Any] = field(default_factory=dict)
+
+    def merge(self, raw_call: dict[str, Any]) -> None:
+        if raw_call.get("id"):
+            self.id = raw_call["id"]
+        function = raw_call.get("function") or {}
+        if function.get("name"):
+            self.name = function["name"]
+        arguments = function.get("arguments")
+        if isinstance(arguments, str):
+            self.argument_parts.append(arguments)
+        elif isinstance(arguments, dict):
+            self.arguments.update(arguments)
+
+    def to_raw(self) -> dict[str, Any]:
+        arguments: str | dict[str, Any] = (
+            "".join(self.argument_parts) if self.argument_parts else self.arguments
+        )
+        return {"id": self.id, "function": {"name": self.name, "arguments": arguments}}
+
+
+class StreamAccumulator:
+    """
+    Collect streamed chunks into one final AssistantMessage.
+
+    Content and thinking deltas are appended to lists and joined once at the end,
+    so building the final message is linear in the streamed bytes. Tool calls
+    that carry an `index` (OpenAI style) are merged fragment by fragment; calls
+    without one (Ollama style) arrive complete and are appended as they come.
+    """
+
+    def __init__(self) -> None:
+        self._content_parts: list[str] = []
+        self._thinking_parts: list[str] = []
+        self._tool_calls: dict[int, _ToolCallFragment] = {}
+        self.model: str | None = None
+        self.done: bool | None = None
+        self.chunk_count = 0
+        self.last_chunk: dict[str, Any] = {}
+
+    @property
+    def is_empty(self) -> bool:
+        return self.chunk_count == 0
+
+    def add(self, chunk: dict[str, Any]) -> AssistantMessageDelta:
+        """Record one raw chunk and return the lightweight delta for display."""
+        self.chunk_count += 1
+        self.last_chunk = chunk
+        message = chunk.get("message") or {}
+
+        content = message.get("content") or ""
+        if content:
+            self._content_parts.append(content)
+
+        thinking = message.get("thinking") or None
+        if thinking:
+            self._thinking_parts.append(thinking)
+
+        raw_tool_calls = message.get("tool_calls")
+        if raw_tool_calls:
+            self._merge_tool_calls(raw_tool_calls)
+
+        if chunk.get("model"):
+            self.model = chunk["model"]
+        self.done = chunk.get("done")
+
+        return AssistantMessageDelta(
+            content=content,
+            thinking=thinking,
+            model=self.model,
+            done=self.done,
+        )
+
+    def _merge_tool_calls(self, raw_tool_calls: list[dict[str, Any]]) -> None:
+        for raw_call in raw_tool_calls:
+            index = raw_call.get("index")
+            if index is None:
+                index = len(self._tool_calls)
+            fragment = self._tool_calls.get(index)
+            if fragment is None:
+                fragment = _ToolCallFragment()
+                self._tool_calls[index] = fragment
+            fragment.merge(raw_call)
+
+    def build(
+        self,
+        tools: list[Tool] | None = None,
+        format: type[BaseModel] | None = None,
+    ) -> AssistantMessage:
+        """Build the complete message. Tool calls and structured output are parsed once."""
+        message: dict[str, Any] = {
+            "role": "assistant",
+            "content": "".join(self._content_parts),
+            "thinking": "".join(self._thinking_parts) or None,
+        }
+        if self._tool_calls:
+            message["tool_calls"] = [
+                self._tool_calls[index].to_raw() for index in sorted(self._tool_calls)
+            ]
+        # The last chunk carries the server's timings (durations, token counts).
+        response = {**self.last_chunk, "model": self.model, "done": self.done, "message": message}
+        return cast(AssistantMessage, to_message(response, tools=tools, format=format))
+
+
+__all__ = ["StreamAccumulator"]
@@ -0,0 +1,70 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator, AsyncIterator
+from dataclasses import dataclass
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class _StreamEnd:
+    pass
+
+
+@dataclass
+class _StreamFailure:
+    error: BaseException
+
+
+_STREAM_END = _StreamEnd()
+
+
+async def buffered_stream(
+    source: AsyncIterator[T],
+    max_buffered: int,
+) -> AsyncGenerator[T, None]:
+    """
+    Read a stream in a background task and hand items over through a bounded queue.
+
+    Network reads keep going while the consumer processes earlier items, up to
+    max_buffered items ahead. A slow consumer fills its own queue, which pauses
+    only its producer; the event loop is never blocked. Closing the consumer
+    cancels the producer and with it the underlying request.
+    """
+    if max_buffered < 1:
+        raise ValueError(f"max_buffered must be at least 1, got {max_buffered}")
+
+    queue: asyncio.Queue[T | _StreamEnd | _StreamFailure] = asyncio.Queue(maxsize=max_buffered)
+
+    async def produce() -> None:
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(_StreamFailure(e))
+            return
+        finally:
+            # A cancelled producer leaves the source suspended at its last yield;
+            # close it now so its own cleanup (scheduler slot, HTTP response)
+            # runs here rather than whenever it is garbage collected.
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        await queue.put(_STREAM_END)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if isinstance(item, _StreamEnd):
+                break
+            if isinstance(item, _StreamFailure):
+                raise item.error
+            yield item
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+
+__all__ = ["buffered_stream"]
@@ -1,58 +1,76 @@
-import inspect
+import asyncio
 from typing import TYPE_CHECKING
 
+from ...constants import DEFAULT_TOOL_CONCURRENCY
+from .toolset import CompiledToolset, resolve_toolset
+
 if TYPE_CHECKING:
     from ...models.messages import AssistantMessage, ToolMessage
     from ...models.tool_context import ToolUsageContext
-    from ...tools.base import AgentTool
+    from ...tools.base import AgentTool, ToolCall
+
+
+def _split_into_batches(
+    tool_calls: "list[ToolCall]", toolset: CompiledToolset
+) -> "list[list[ToolCall]]":
+    """Group consecutive concurrency-safe calls; every unsafe call is its own batch."""
+    batches: list[list[ToolCall]] = []
+    for tc in tool_calls:
+        is_safe = toolset.is_concurrency_safe(tc.tool.name)
+        if is_safe and batches and toolset.is_concurrency_safe(batches[-1][-1].tool.name):
+            batches[-1].append(tc)
+        else:
+            batches.append([tc])
+    return batches
 
 
 async def default_execute_tool_calls(
     assistant_msg: "AssistantMessage",
-    agent_tools: "list[AgentTool]",
+    agent_tools: "list[AgentTool] | CompiledToolset",
     tool_usage_context: "ToolUsageContext | None" = None,
+    max_concurrency: int = DEFAULT_TOOL_CONCURRENCY,
 ) -> list["ToolMessage"]:
     """
     Execute tool calls from an assistant message.
     Provider calls this after getting LLM response.
+
+    Consecutive calls to tools marked `concurrency_safe` run together, at most
+    `max_concurrency` at a time; any other call waits for everything before it.
+    Tool messages and usage counts always follow the order of the calls.
     """
     from ...models.messages import ToolMessage
     from ...models.tool_context import ToolUsageContext
 
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
     tool_calls = assistant_msg.tool_calls or []
-    if not tool_calls:
+    toolset = resolve_toolset(agent_tools)
+    if not tool_calls or toolset is None:
         return []
 
     ctx = tool_usage_context or ToolUsageContext()
-    tool_messages: list[ToolMessage] = []
+    slots = asyncio.Semaphore(max_concurrency)
 
-    handlers = {tool.name: tool.execute for tool in agent_tools}
+    async def run_limited(tc: "ToolCall") -> str:
+        async with slots:
+            return await toolset.dispatch(tc, ctx)
 
-    for tc in tool_calls:
-        result_str = ""
-        if tc.tool.name in handlers:
-            handler = handlers[tc.tool.name]
-            try:
-                sig = inspect.signature(handler)
-                kwargs = tc.arguments.copy()
-                if "context" in sig.parameters:
-                    kwargs["context"] = ctx
-
-                result = await handler(**kwargs)
-                if result is not None:
-                    result_str = str(result)
-            except Exception as e:
-                result_str = f"Error: {str(e)}"
+    tool_messages: list[ToolMessage] = []
+    for batch in _split_into_batches(tool_calls, toolset):
+        if len(batch) == 1:
+            results = [await toolset.dispatch(batch[0], ctx)]
         else:
-            result_str = f"Error: Unknown tool '{tc.tool.name}'"
-
-        ctx.register_tool_used(tc.tool.name)
+            results = await asyncio.gather(*(run_limited(tc) for tc in batch))
 
-        tool_msg = ToolMessage(
-            content=result_str,
-            tool_call_id=tc.id,
-            tool_name=tc.tool.name,
-        )
-        tool_messages.append(tool_msg)
+        for tc, result_str in zip(batch, results):
+            ctx.register_tool_used(tc.tool.name)
+            tool_messages.append(
+                ToolMessage(
+                    content=result_str,
+                    tool_call_id=tc.id,
+                    tool_name=tc.tool.name,
+                )
+            )
 
     return tool_messages
@@ -0,0 +1,91 @@
+import inspect
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ...tools.base import Tool
+from ...tools.coercion import ArgumentCoercer, build_argument_coercer
+from .utils import build_tools_for_chat_format
+
+if TYPE_CHECKING:
+    from ...models.tool_context import ToolUsageContext
+    from ...tools.base import AgentTool, ToolCall
+
+
+@dataclass(frozen=True)
+class CompiledTool:
+    """Dispatch data for one tool, resolved once instead of on every call."""
+
+    handler: Callable[..., Awaitable[Any]]
+    accepts_context: bool
+    concurrency_safe: bool
+    coerce_arguments: ArgumentCoercer
+
+    @classmethod
+    def compile(cls, agent_tool: "AgentTool") -> "CompiledTool":
+        handler = agent_tool.execute
+        return cls(
+            handler=handler,
+            accepts_context="context" in inspect.signature(handler).parameters,
+            concurrency_safe=agent_tool.concurrency_safe,
+            coerce_arguments=build_argument_coercer(agent_tool.parameters),
+        )
+
+
+@dataclass(frozen=True)
+class CompiledToolset:
+    """
+    Tool data derived once from a list of AgentTools and reused for every
+    request of a tool loop: definitions, wire schema and the dispatch table.
+    """
+
+    agent_tools: "list[AgentTool]"
+    tools: list[Tool]
+    wire_tools: list[dict[str, Any]]
+    dispatch_table: dict[str, CompiledTool]
+
+    @classmethod
+    def compile(cls, agent_tools: "list[AgentTool]") -> "CompiledToolset":
+        tools = [agent_tool.to_tool() for agent_tool in agent_tools]
+        return cls(
+            agent_tools=list(agent_tools),
+            tools=tools,
+            wire_tools=build_tools_for_chat_format(tools) or [],
+            dispatch_table={
+                agent_tool.name: CompiledTool.compile(agent_tool) for agent_tool in agent_tools
+            },
+        )
+
+    def is_concurrency_safe(self, tool_name: str) -> bool:
+        compiled = self.dispatch_table.get(tool_name)
+        return compiled is not None and compiled.concurrency_safe
+
+    async def dispatch(self, tool_call: "ToolCall", context: "ToolUsageContext") -> str:
+        """Run one tool call. Errors are returned as text for the model to read."""
+        compiled = self.dispatch_table.get(tool_call.tool.name)
+        if compiled is None:
+            return f"Error: Unknown tool '{tool_call.tool.name}'"
+
+        try:
+            kwargs = compiled.coerce_arguments(tool_call.arguments)
+            if compiled.accepts_context:
+                kwargs["context"] = context
+
+            result = await compiled.handler(**kwargs)
+            return str(result) if result is not None else ""
+        except Exception as e:
+            return f"Error: {str(e)}"
+
+
+def resolve_toolset(
+    agent_tools: "list[AgentTool] | CompiledToolset | None",
+) -> CompiledToolset | None:
+    """Accept either raw AgentTools or an already compiled toolset."""
+    if not agent_tools:
+        return None
+    if isinstance(agent_tools, CompiledToolset):
+        return agent_tools
+    return CompiledToolset.compile(agent_tools)
+
+
+__all__ = ["CompiledTool", "CompiledToolset", "resolve_toolset"]
@@ -1,4 +1,5 @@
 import json
+from collections.abc import Sequence
 from typing import Any
 
 from pydantic import BaseModel
@@ -11,15 +12,19 @@ from ...constants import (
     DEFAULT_TEMPERATURE,
     DEFAULT_TOP_K,
     DEFAULT_TOP_P,
+    QUEUE_DURATION_FIELD,
 )
+from ...models.conversation_buffer import ConversationBuffer
 from ...models.messages import AssistantMessage, BaseMessage, ToolMessage
+from ...structured_format import format_schema, parse_structured
+from ...telemetry.metrics import CallMetrics
 from ...tools.base import Tool, ToolCall
 
 
 def build_format(format: type[BaseModel] | None) -> dict[str, Any] | None:
     if format is None:
         return None
-    return format.model_json_schema()
+    return format_schema(format)
 
 
 def build_options(
@@ -148,13 +153,8 @@ def to_message(
     raw_tool_calls = message.get("tool_calls")
     tool_calls = parse_tool_calls(raw_tool_calls, tools) if raw_tool_calls else None
 
-    parsed: BaseModel | None = None
     content = message.get("content", "")
-    if format and content:
-        try:
-            parsed = format.model_validate_json(content)
-        except Exception:
-            pass
+    parsed = parse_structured(format, content) if format and content else None
 
     return AssistantMessage(
         content=content,
@@ -163,12 +163,27 @@ def to_message(
         model=response.get("model"),
         done=response.get("done"),
         parsed=parsed,
+        metrics=CallMetrics.from_response(response),
     )
 
 
+def to_raw_response(message: AssistantMessage) -> dict[str, Any]:
+    """The raw chat-response shape of a message, as `to_message` reads it back."""
+    return {"model": message.model, "done": message.done, "message": message.to_ollama_dict()}
+
+
+def tag_queue_wait(response: dict[str, Any], waited: float) -> dict[str, Any]:
+    """Record the scheduler wait on the final response, where CallMetrics reads it."""
+    if response.get("done"):
+        response[QUEUE_DURATION_FIELD] = round(waited * 1_000_000_000)
+    return response
+
+
 def to_openai_dict(message: BaseMessage) -> dict[str, Any]:
     return message.to_ollama_dict()
 
 
-def transform_messages(messages: list[BaseMessage]) -> list[dict[str, Any]]:
+def transform_messages(messages: Sequence[BaseMessage]) -> list[dict[str, Any]]:
+    if isinstance(messages, ConversationBuffer):
+        return messages.to_wire()
     return [msg.to_ollama_dict() for msg in messages]
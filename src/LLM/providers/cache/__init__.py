@@ -0,0 +1,18 @@
+from .config import DEFAULT_RESPONSE_CACHE_CONFIG, CacheMode, ResponseCacheConfig
+from .key import CacheKeyParts, build_cache_key, request_key
+from .provider import CachingProvider, with_response_cache
+from .response_cache import CacheStats, ResponseCache, get_shared_response_cache
+
+__all__ = [
+    "CacheKeyParts",
+    "CacheMode",
+    "CacheStats",
+    "CachingProvider",
+    "DEFAULT_RESPONSE_CACHE_CONFIG",
+    "ResponseCache",
+    "ResponseCacheConfig",
+    "build_cache_key",
+    "get_shared_response_cache",
+    "request_key",
+    "with_response_cache",
+]
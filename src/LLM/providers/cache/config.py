@@ -0,0 +1,68 @@
+import os
+from dataclasses import dataclass, replace
+from enum import Enum
+
+from ...config import LLMConfig
+from ...constants import (
+    DEFAULT_RESPONSE_CACHE_DISK_ENTRIES,
+    DEFAULT_RESPONSE_CACHE_MEMORY_ENTRIES,
+    DEFAULT_RESPONSE_CACHE_TTL_SECONDS,
+    RESPONSE_CACHE_MODE_ENV,
+    RESPONSE_CACHE_PATH,
+)
+
+
+class CacheMode(Enum):
+    OFF = "off"
+    DETERMINISTIC = "deterministic"
+    ALL = "all"
+
+    def allows(self, llm_config: LLMConfig) -> bool:
+        if self is CacheMode.OFF:
+            return False
+        if self is CacheMode.ALL:
+            return True
+        return llm_config.seed is not None or llm_config.temperature == 0
+
+
+@dataclass(frozen=True)
+class ResponseCacheConfig:
+    """
+    Settings for the two-tier response cache.
+
+    DETERMINISTIC only caches seeded or temperature-0 calls; ALL caches every
+    call, which is useful while iterating on a pipeline with fixed inputs.
+    A TTL of None keeps entries until they are evicted by size.
+    """
+
+    path: str = RESPONSE_CACHE_PATH
+    memory_max_entries: int = DEFAULT_RESPONSE_CACHE_MEMORY_ENTRIES
+    disk_max_entries: int = DEFAULT_RESPONSE_CACHE_DISK_ENTRIES
+    ttl_seconds: float | None = DEFAULT_RESPONSE_CACHE_TTL_SECONDS
+    mode: CacheMode = CacheMode.DETERMINISTIC
+
+    def __post_init__(self) -> None:
+        if self.memory_max_entries < 1 or self.disk_max_entries < 1:
+            raise ValueError("Cache entry limits must be at least 1")
+        if self.ttl_seconds is not None and self.ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {self.ttl_seconds}")
+
+    def with_env_mode(self) -> "ResponseCacheConfig":
+        """Apply the mode from AI_FUN_LLM_CACHE (off / deterministic / all) if it is set."""
+        value = os.getenv(RESPONSE_CACHE_MODE_ENV)
+        if not value:
+            return self
+        try:
+            mode = CacheMode(value.strip().lower())
+        except ValueError:
+            choices = ", ".join(m.value for m in CacheMode)
+            raise ValueError(
+                f"{RESPONSE_CACHE_MODE_ENV}={value!r} is not one of: {choices}"
+            ) from None
+        return replace(self, mode=mode)
+
+
+DEFAULT_RESPONSE_CACHE_CONFIG = ResponseCacheConfig()
+
+
+__all__ = ["CacheMode", "DEFAULT_RESPONSE_CACHE_CONFIG", "ResponseCacheConfig"]
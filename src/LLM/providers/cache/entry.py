@@ -0,0 +1,28 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class CachedResponse:
+    """
+    A recorded model response.
+
+    `final` is the complete assistant message in the raw chat-response shape
+    that `to_message` reads. `chunks` are the raw stream chunks (empty when the
+    response was recorded from a non-streaming call).
+    """
+
+    final: dict[str, Any]
+    chunks: list[dict[str, Any]] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps({"final": self.final, "chunks": self.chunks})
+
+    @classmethod
+    def from_json(cls, payload: str) -> "CachedResponse":
+        data = json.loads(payload)
+        return cls(final=data["final"], chunks=data.get("chunks") or [])
+
+
+__all__ = ["CachedResponse"]
@@ -0,0 +1,81 @@
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from ...config import LLMConfig
+from ...models.messages import BaseMessage
+from ..base.toolset import CompiledToolset
+from ..base.utils import transform_messages
+
+
+@dataclass(frozen=True)
+class CacheKeyParts:
+    """Everything that determines a model's response to a request."""
+
+    provider: str
+    model: str
+    messages: list[dict[str, Any]]
+    options: dict[str, Any]
+    tools: list[dict[str, Any]] | None
+    format: dict[str, Any] | None
+
+
+def _fingerprint_image(image: Any) -> str:
+    if isinstance(image, bytes):
+        return hashlib.sha256(image).hexdigest()
+    # Image paths are read by the client at request time, so hash the file
+    # contents: a regenerated frame at the same path must not hit.
+    if isinstance(image, str) and os.path.isfile(image):
+        with open(image, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    return str(image)
+
+
+def _normalize_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    normalized = []
+    for message in messages:
+        images = message.get("images")
+        if images:
+            message = {**message, "images": [_fingerprint_image(img) for img in images]}
+        normalized.append(message)
+    return normalized
+
+
+def build_cache_key(parts: CacheKeyParts) -> str:
+    """Stable sha256 over the request; dict ordering does not affect the key."""
+    payload = {
+        "provider": parts.provider,
+        "model": parts.model,
+        "messages": _normalize_messages(parts.messages),
+        "options": parts.options,
+        "tools": parts.tools,
+        "format": parts.format,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def request_key(
+    provider: str,
+    model: str,
+    messages: Sequence[BaseMessage],
+    config: LLMConfig,
+    toolset: CompiledToolset | None,
+) -> str:
+    """Cache key of a provider request."""
+    return build_cache_key(
+        CacheKeyParts(
+            provider=provider,
+            model=model,
+            messages=transform_messages(messages),
+            options=config.to_options_dict(),
+            tools=toolset.wire_tools if toolset else None,
+            format=config.get_format_schema(),
+        )
+    )
+
+
+__all__ = ["CacheKeyParts", "build_cache_key", "request_key"]
@@ -0,0 +1,45 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .entry import CachedResponse
+
+
+@dataclass
+class _MemoryEntry:
+    response: CachedResponse
+    stored_at: float
+
+
+class MemoryLRU:
+    """Bounded in-process LRU in front of the disk store."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float | None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, _MemoryEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self.ttl_seconds is not None and time.time() - entry.stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.response
+
+    def put(self, key: str, response: CachedResponse, stored_at: float | None = None) -> None:
+        self._entries[key] = _MemoryEntry(response, stored_at or time.time())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+__all__ = ["MemoryLRU"]
@@ -0,0 +1,150 @@
+from collections.abc import AsyncGenerator, Sequence
+from typing import TYPE_CHECKING, Any, cast
+
+from ...config import LLMConfig
+from ...models.messages import (
+    AssistantMessage,
+    AssistantMessageDelta,
+    BaseMessage,
+    ToolMessage,
+)
+from ..base import BaseProvider
+from ..base.stream_accumulator import StreamAccumulator
+from ..base.tool_usage import default_execute_tool_calls
+from ..base.toolset import CompiledToolset, resolve_toolset
+from ..base.utils import build_llm_config, to_message, to_raw_response
+from .config import DEFAULT_RESPONSE_CACHE_CONFIG, ResponseCacheConfig
+from .entry import CachedResponse
+from .key import request_key
+from .response_cache import CacheStats, get_shared_response_cache
+
+if TYPE_CHECKING:
+    from ...tools.base import AgentTool
+
+
+class CachingProvider(BaseProvider):
+    """
+    Wrap any provider with the two-tier response cache.
+
+    Only the assistant message is cached; tool calls in a cached response are
+    executed again on every hit, so tools keep their side effects. Set
+    `bypass` to skip the cache (lookups and stores) for this wrapper.
+    """
+
+    def __init__(
+        self,
+        inner: BaseProvider,
+        config: ResponseCacheConfig = DEFAULT_RESPONSE_CACHE_CONFIG,
+        bypass: bool = False,
+    ):
+        self.inner = inner
+        self.model = inner.model
+        self.config = config
+        self.bypass = bypass
+        self.cache = get_shared_response_cache(config)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        return await self.inner.embed(texts)
+
+    def _cache_key(
+        self,
+        messages: Sequence[BaseMessage],
+        config: LLMConfig,
+        toolset: CompiledToolset | None,
+    ) -> str | None:
+        if self.bypass or not self.config.mode.allows(config):
+            self.cache.record_bypass()
+            return None
+        return request_key(type(self.inner).__name__, self.inner.model, messages, config, toolset)
+
+    def _restore(
+        self, cached: CachedResponse, config: LLMConfig, toolset: CompiledToolset | None
+    ) -> AssistantMessage:
+        tools = toolset.tools if toolset else None
+        return cast(AssistantMessage, to_message(cached.final, tools=tools, format=config.format))
+
+    async def _execute_tools(
+        self, assistant_msg: AssistantMessage, toolset: CompiledToolset | None
+    ) -> list[ToolMessage]:
+        if not toolset or not assistant_msg.tool_calls:
+            return []
+        return await default_execute_tool_calls(
+            assistant_msg=assistant_msg,
+            agent_tools=toolset,
+        )
+
+    async def chat(
+        self,
+        messages: Sequence[BaseMessage],
+        llm_config: LLMConfig | None = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
+    ) -> tuple[AssistantMessage, list[ToolMessage]]:
+        config = build_llm_config(llm_config)
+        toolset = resolve_toolset(agent_tools)
+        key = self._cache_key(messages, config, toolset)
+
+        if key is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                assistant_msg = self._restore(cached, config, toolset)
+                return assistant_msg, await self._execute_tools(assistant_msg, toolset)
+
+        assistant_msg, tool_messages = await self.inner.chat(messages, config, toolset)
+        if key is not None:
+            await self.cache.put(key, CachedResponse(final=to_raw_response(assistant_msg)))
+        return assistant_msg, tool_messages
+
+    async def stream(
+        self,
+        messages: Sequence[BaseMessage],
+        llm_config: LLMConfig | None = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
+    ) -> AsyncGenerator[AssistantMessage | ToolMessage, None]:
+        config = build_llm_config(llm_config)
+        toolset = resolve_toolset(agent_tools)
+        key = self._cache_key(messages, config, toolset)
+
+        if key is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                accumulator = StreamAccumulator()
+                for chunk in cached.chunks or [cached.final]:
+                    yield accumulator.add(chunk)
+                assistant_msg = self._restore(cached, config, toolset)
+                yield assistant_msg
+                for tm in await self._execute_tools(assistant_msg, toolset):
+                    yield tm
+                return
+
+        chunks: list[dict[str, Any]] = []
+        async for msg in self.inner.stream(messages, config, toolset):
+            if isinstance(msg, AssistantMessageDelta):
+                chunks.append(to_raw_response(msg))
+            elif isinstance(msg, AssistantMessage) and key is not None:
+                await self.cache.put(
+                    key, CachedResponse(final=to_raw_response(msg), chunks=chunks)
+                )
+            yield msg
+
+
+def with_response_cache(
+    provider: BaseProvider,
+    config: ResponseCacheConfig = DEFAULT_RESPONSE_CACHE_CONFIG,
+) -> BaseProvider:
+    """
+    Wrap a provider in a CachingProvider unless it already is one.
+    The AI_FUN_LLM_CACHE environment variable overrides the config's mode.
+    """
+    if isinstance(provider, CachingProvider):
+        return provider
+    return CachingProvider(provider, config.with_env_mode())
+
+
+__all__ = ["CachingProvider", "with_response_cache"]
@@ -0,0 +1,81 @@
+import asyncio
+from dataclasses import dataclass
+
+from .config import ResponseCacheConfig
+from .entry import CachedResponse
+from .memory_store import MemoryLRU
+from .sqlite_store import SQLiteResponseStore
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    stores: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """
+    Memory LRU in front of a SQLite store. Disk hits are promoted into memory;
+    disk I/O runs in a worker thread so lookups never block the event loop.
+    """
+
+    def __init__(self, config: ResponseCacheConfig):
+        self.config = config
+        self.stats = CacheStats()
+        self.memory = MemoryLRU(config.memory_max_entries, config.ttl_seconds)
+        self.disk = SQLiteResponseStore(config.path, config.disk_max_entries, config.ttl_seconds)
+
+    async def get(self, key: str) -> CachedResponse | None:
+        response = self.memory.get(key)
+        if response is not None:
+            self.stats.memory_hits += 1
+            return response
+
+        stored = await asyncio.to_thread(self.disk.get, key)
+        if stored is None:
+            self.stats.misses += 1
+            return None
+
+        response, created_at = stored
+        self.memory.put(key, response, stored_at=created_at)
+        self.stats.disk_hits += 1
+        return response
+
+    async def put(self, key: str, response: CachedResponse) -> None:
+        self.memory.put(key, response)
+        await asyncio.to_thread(self.disk.put, key, response)
+        self.stats.stores += 1
+
+    def record_bypass(self) -> None:
+        self.stats.bypassed += 1
+
+    async def clear(self) -> None:
+        self.memory.clear()
+        await asyncio.to_thread(self.disk.clear)
+
+
+_shared_caches: dict[ResponseCacheConfig, ResponseCache] = {}
+
+
+def get_shared_response_cache(config: ResponseCacheConfig) -> ResponseCache:
+    """One cache (and one SQLite connection) per config, shared by all wrappers."""
+    cache = _shared_caches.get(config)
+    if cache is None:
+        cache = ResponseCache(config)
+        _shared_caches[config] = cache
+    return cache
+
+
+__all__ = ["CacheStats", "ResponseCache", "get_shared_response_cache"]
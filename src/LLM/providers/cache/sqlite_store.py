@@ -0,0 +1,104 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .entry import CachedResponse
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+_LAST_USED_INDEX = "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+
+
+class SQLiteResponseStore:
+    """
+    On-disk response store. Methods are blocking; the async cache calls them
+    through asyncio.to_thread, so one connection is shared under a lock.
+    """
+
+    def __init__(self, path: str, max_entries: int, ttl_seconds: float | None):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute(_SCHEMA)
+            connection.execute(_LAST_USED_INDEX)
+            connection.commit()
+            self._connection = connection
+            self._purge_expired(connection)
+        return self._connection
+
+    def _purge_expired(self, connection: sqlite3.Connection) -> None:
+        if self.ttl_seconds is None:
+            return
+        connection.execute(
+            "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+        )
+        connection.commit()
+
+    def get(self, key: str) -> tuple[CachedResponse, float] | None:
+        """Return the response and its creation time, or None if missing or expired."""
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            payload, created_at = row
+            now = time.time()
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                connection.commit()
+                return None
+            connection.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            connection.commit()
+        return CachedResponse.from_json(payload), created_at
+
+    def put(self, key: str, response: CachedResponse) -> None:
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, created_at, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, response.to_json(), now, now),
+            )
+            connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            connection.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            row = self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()
+        return int(row[0])
+
+    def clear(self) -> None:
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM responses")
+            connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+__all__ = ["SQLiteResponseStore"]
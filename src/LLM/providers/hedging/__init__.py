@@ -0,0 +1,14 @@
+from .config import DEFAULT_HEDGE_POLICY, HedgePolicy
+from .provider import HedgedProvider
+from .race import RaceResult, hedged_race
+from .stats import HedgeStats, LatencyWindow
+
+__all__ = [
+    "DEFAULT_HEDGE_POLICY",
+    "HedgePolicy",
+    "HedgeStats",
+    "HedgedProvider",
+    "LatencyWindow",
+    "RaceResult",
+    "hedged_race",
+]
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+
+from ...constants import (
+    DEFAULT_HEDGE_INITIAL_DELAY_SECONDS,
+    DEFAULT_HEDGE_MAX_DELAY_SECONDS,
+    DEFAULT_HEDGE_MIN_DELAY_SECONDS,
+    DEFAULT_HEDGE_MIN_SAMPLES,
+    DEFAULT_HEDGE_PERCENTILE,
+)
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    When to send a duplicate request.
+
+    The hedge fires once a request has been outstanding longer than the
+    `percentile` of recent latencies, clamped to [min_delay, max_delay].
+    Until `min_samples` latencies are known, `initial_delay` is used.
+    """
+
+    percentile: float = DEFAULT_HEDGE_PERCENTILE
+    initial_delay: float = DEFAULT_HEDGE_INITIAL_DELAY_SECONDS
+    min_delay: float = DEFAULT_HEDGE_MIN_DELAY_SECONDS
+    max_delay: float = DEFAULT_HEDGE_MAX_DELAY_SECONDS
+    min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES
+
+    def __post_init__(self) -> None:
+        if not 0 < self.percentile < 1:
+            raise ValueError(f"percentile must be between 0 and 1, got {self.percentile}")
+        if not 0 <= self.min_delay <= self.max_delay:
+            raise ValueError("Hedge delays must satisfy 0 <= min_delay <= max_delay")
+        if self.min_samples < 1:
+            raise ValueError(f"min_samples must be at least 1, got {self.min_samples}")
+
+
+DEFAULT_HEDGE_POLICY = HedgePolicy()
+
+
+__all__ = ["DEFAULT_HEDGE_POLICY", "HedgePolicy"]
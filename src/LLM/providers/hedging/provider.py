@@ -0,0 +1,147 @@
+import time
+from collections.abc import AsyncGenerator, Sequence
+from typing import TYPE_CHECKING
+
+from ...config import LLMConfig
+from ...models.messages import AssistantMessage, AssistantMessageDelta, BaseMessage, ToolMessage
+from ..base import BaseProvider
+from ..base.tool_usage import default_execute_tool_calls
+from ..base.toolset import CompiledToolset, resolve_toolset
+from ..base.utils import build_llm_config
+from .config import DEFAULT_HEDGE_POLICY, HedgePolicy
+from .race import hedged_race
+from .stats import HedgeStats
+
+if TYPE_CHECKING:
+    from ...tools.base import AgentTool
+
+StreamItem = AssistantMessage | ToolMessage
+
+
+async def _first_item(
+    stream: AsyncGenerator[StreamItem, None],
+) -> tuple[AsyncGenerator[StreamItem, None], StreamItem]:
+    try:
+        first = await anext(stream)
+    except BaseException:
+        await stream.aclose()
+        raise
+    return stream, first
+
+
+async def _close_stream(started: tuple[AsyncGenerator[StreamItem, None], StreamItem]) -> None:
+    await started[0].aclose()
+
+
+class HedgedProvider(BaseProvider):
+    """
+    Send a duplicate request to `backup` when `primary` is slow, and keep
+    whichever answers first.
+
+    `backup` can be another model, another host, or the same load-balanced
+    provider (its pool sends the duplicate to a different host). Tool calls
+    never run twice: chat() races the responses only and executes the tools of
+    the winner afterwards, and stream() commits to the first stream that
+    produces output.
+    """
+
+    def __init__(
+        self,
+        primary: BaseProvider,
+        backup: BaseProvider,
+        policy: HedgePolicy = DEFAULT_HEDGE_POLICY,
+    ):
+        self.primary = primary
+        self.backup = backup
+        self.model = primary.model
+        self.policy = policy
+        self.stats = HedgeStats()
+
+    async def aclose(self) -> None:
+        await self.primary.aclose()
+        if self.backup is not self.primary:
+            await self.backup.aclose()
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        # Embeddings are cached and cheap; hedging them would only add load.
+        return await self.primary.embed(texts)
+
+    async def _response_only(
+        self,
+        provider: BaseProvider,
+        messages: Sequence[BaseMessage],
+        config: LLMConfig,
+        toolset: CompiledToolset | None,
+    ) -> AssistantMessage:
+        # Providers yield the complete message before running any tool, so
+        # closing the stream there leaves tool execution to the winner.
+        stream = provider.stream(messages, config, toolset)
+        try:
+            async for msg in stream:
+                if isinstance(msg, AssistantMessage) and not isinstance(msg, AssistantMessageDelta):
+                    return msg
+        finally:
+            await stream.aclose()
+        raise RuntimeError(f"{type(provider).__name__} returned no response")
+
+    async def chat(
+        self,
+        messages: Sequence[BaseMessage],
+        llm_config: LLMConfig | None = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
+    ) -> tuple[AssistantMessage, list[ToolMessage]]:
+        config = build_llm_config(llm_config)
+        toolset = resolve_toolset(agent_tools)
+
+        start = time.perf_counter()
+        result = await hedged_race(
+            primary=lambda: self._response_only(self.primary, messages, config, toolset),
+            backup=lambda: self._response_only(self.backup, messages, config, toolset),
+            delay=self.stats.chat_latency.hedge_delay(self.policy),
+        )
+        self.stats.chat_latency.record(time.perf_counter() - start)
+        self._record(result.hedged, result.backup_won)
+
+        assistant_msg = result.value
+        tool_messages: list[ToolMessage] = []
+        if toolset and assistant_msg.tool_calls:
+            tool_messages = await default_execute_tool_calls(
+                assistant_msg=assistant_msg,
+                agent_tools=toolset,
+            )
+        return assistant_msg, tool_messages
+
+    async def stream(
+        self,
+        messages: Sequence[BaseMessage],
+        llm_config: LLMConfig | None = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
+    ) -> AsyncGenerator[AssistantMessage | ToolMessage, None]:
+        config = build_llm_config(llm_config)
+        toolset = resolve_toolset(agent_tools)
+
+        start = time.perf_counter()
+        result = await hedged_race(
+            primary=lambda: _first_item(self.primary.stream(messages, config, toolset)),
+            backup=lambda: _first_item(self.backup.stream(messages, config, toolset)),
+            delay=self.stats.first_chunk_latency.hedge_delay(self.policy),
+            discard=_close_stream,
+        )
+        self.stats.first_chunk_latency.record(time.perf_counter() - start)
+        self._record(result.hedged, result.backup_won)
+
+        winner, first = result.value
+        try:
+            yield first
+            async for msg in winner:
+                yield msg
+        finally:
+            await winner.aclose()
+
+    def _record(self, hedged: bool, backup_won: bool) -> None:
+        self.stats.requests += 1
+        self.stats.hedged += int(hedged)
+        self.stats.backup_wins += int(backup_won)
+
+
+__all__ = ["HedgedProvider"]
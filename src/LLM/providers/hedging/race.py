@@ -0,0 +1,77 @@
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+Attempt = Callable[[], Coroutine[Any, Any, T]]
+
+
+@dataclass
+class RaceResult(Generic[T]):
+    value: T
+    hedged: bool
+    backup_won: bool
+
+
+async def hedged_race(
+    primary: Attempt[T],
+    backup: Attempt[T],
+    delay: float,
+    discard: Callable[[T], Awaitable[None]] | None = None,
+) -> RaceResult[T]:
+    """
+    Run `primary`; if it has not finished after `delay` seconds (or fails
+    sooner), start `backup` too and return whichever succeeds first.
+
+    The loser is cancelled. A loser that finished anyway is handed to `discard`
+    so it can release what it holds. If both attempts fail, the primary's
+    error is raised.
+    """
+    primary_task = asyncio.create_task(primary())
+    backup_task: asyncio.Task[T] | None = None
+    try:
+        await asyncio.wait({primary_task}, timeout=delay)
+        if primary_task.done() and primary_task.exception() is None:
+            return RaceResult(primary_task.result(), hedged=False, backup_won=False)
+
+        backup_task = asyncio.create_task(backup())
+        pending: set[asyncio.Task[T]] = {primary_task, backup_task}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Prefer the primary when both land in the same wakeup.
+            for task in (primary_task, backup_task):
+                if task in done and task.exception() is None:
+                    return RaceResult(task.result(), hedged=True, backup_won=task is backup_task)
+        raise primary_task.exception() or RuntimeError("Hedged request failed")
+    finally:
+        for attempt in (primary_task, backup_task):
+            if attempt is None:
+                continue
+            if not attempt.done():
+                attempt.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await attempt
+        await _discard_losers(primary_task, backup_task, discard)
+
+
+async def _discard_losers(
+    primary_task: "asyncio.Task[T]",
+    backup_task: "asyncio.Task[T] | None",
+    discard: Callable[[T], Awaitable[None]] | None,
+) -> None:
+    if discard is None or backup_task is None:
+        return
+    finished = [
+        task
+        for task in (primary_task, backup_task)
+        if task.done() and not task.cancelled() and task.exception() is None
+    ]
+    # With both finished, the one returned is the primary (see above).
+    for task in finished[1:]:
+        await discard(task.result())
+
+
+__all__ = ["RaceResult", "hedged_race"]
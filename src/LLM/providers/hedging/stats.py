@@ -0,0 +1,50 @@
+from collections import deque
+from dataclasses import dataclass, field
+
+from ...constants import HEDGE_LATENCY_SAMPLE_SIZE
+from ..scheduling import percentile
+from .config import HedgePolicy
+
+
+@dataclass
+class LatencyWindow:
+    """Recent latencies of one kind of request, used to pick the hedge delay."""
+
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=HEDGE_LATENCY_SAMPLE_SIZE))
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def hedge_delay(self, policy: HedgePolicy) -> float:
+        if len(self.samples) < policy.min_samples:
+            return policy.initial_delay
+        delay = percentile(list(self.samples), policy.percentile)
+        return min(max(delay, policy.min_delay), policy.max_delay)
+
+
+@dataclass
+class HedgeStats:
+    requests: int = 0
+    hedged: int = 0
+    backup_wins: int = 0
+    chat_latency: LatencyWindow = field(default_factory=LatencyWindow)
+    first_chunk_latency: LatencyWindow = field(default_factory=LatencyWindow)
+
+    @property
+    def hedge_rate(self) -> float:
+        """Share of requests that sent a duplicate."""
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Share of hedged requests answered by the duplicate."""
+        return self.backup_wins / self.hedged if self.hedged else 0.0
+
+    def format_report(self) -> str:
+        return (
+            f"Hedging: {self.hedged}/{self.requests} requests hedged "
+            f"({self.hedge_rate:.0%}), duplicate won {self.backup_wins} ({self.win_rate:.0%})."
+        )
+
+
+__all__ = ["HedgeStats", "LatencyWindow"]
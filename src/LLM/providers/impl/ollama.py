@@ -1,76 +1,147 @@
-import asyncio
-from collections.abc import AsyncGenerator
-from enum import Enum
+from collections.abc import AsyncGenerator, Sequence
 from typing import Any, cast
 
 import ollama
 
 from ...config import LLMConfig
+from ...constants import (
+    DEFAULT_EMBEDDING_MODEL,
+    DEFAULT_STREAM_BUFFER_SIZE,
+    EMBEDDING_CACHE_DIR,
+)
+from ...embeddings import embed_in_batches, embedding_cache_enabled, get_shared_embedding_cache
 from ...models.messages import AssistantMessage, BaseMessage, ToolMessage
+from ...models.ollama_models import OllamaModels
+from ...telemetry import get_telemetry_registry
 from ...tools.base import AgentTool
 from ..base import BaseProvider
+from ..base.stream_accumulator import StreamAccumulator
+from ..base.stream_bridge import buffered_stream
 from ..base.tool_usage import default_execute_tool_calls
+from ..base.toolset import CompiledToolset, resolve_toolset
 from ..base.utils import (
     build_llm_config,
-    build_tools_for_chat_format,
+    tag_queue_wait,
     to_message,
     transform_messages,
 )
-
-
-class OllamaModels(Enum):
-    QWEN_8B = "qwen3:8b"
-    QWEN_3_5_4B = "qwen3.5:4b"
-    QWEN_3_5_9B = "qwen3.5:9b"
-    GLM_4_7_FLASH = "glm-4.7-flash"
-    GEMMA_1B = "gemma3:1b"
-    GEMMA_4B = "gemma3:4b"
-
-    def to_ollama_name(self) -> str:
-        return self.value
-
-
-DEFAULT_MODEL = OllamaModels.GLM_4_7_FLASH
-
-
-def get_model(model_name: str) -> OllamaModels:
-    for m in OllamaModels:
-        if m.to_ollama_name() == model_name:
-            return m
-    for m in OllamaModels:
-        if model_name.lower() in m.to_ollama_name().lower():
-            return m
-    print(f"ERROR - Model '{model_name}' not found, using default: {DEFAULT_MODEL.value}")
-    return DEFAULT_MODEL
+from ..scheduling import (
+    DEFAULT_SCHEDULER_CONFIG,
+    RequestScheduler,
+    SchedulerConfig,
+    get_shared_scheduler,
+)
+from .ollama_client import (
+    DEFAULT_OLLAMA_CLIENT_CONFIG,
+    OllamaClientConfig,
+    close_shared_client,
+    get_shared_client,
+)
 
 
 class OllamaProvider(BaseProvider):
-    def __init__(self, model: str | OllamaModels):
+    # The model behind embed(), independent of the chat model, and where its vectors are kept.
+    embedding_model: str = DEFAULT_EMBEDDING_MODEL
+    embedding_cache_dir: str = EMBEDDING_CACHE_DIR
+
+    def __init__(
+        self,
+        model: str | OllamaModels,
+        client_config: OllamaClientConfig = DEFAULT_OLLAMA_CLIENT_CONFIG,
+        stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+        scheduler_config: SchedulerConfig | None = None,
+    ):
         if isinstance(model, OllamaModels):
             self.model = model.to_ollama_name()
         else:
             self.model = model
+        self.client_config = client_config
+        self.stream_buffer_size = stream_buffer_size
+        # Unlimited unless the caller passes caps or sets them in the environment.
+        self.scheduler_config = (
+            DEFAULT_SCHEDULER_CONFIG.with_env_limits()
+            if scheduler_config is None
+            else scheduler_config
+        )
 
-    async def _chat_raw(
+    @property
+    def client(self) -> ollama.AsyncClient:
+        return get_shared_client(self.client_config)
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """Shared by every provider on the same host, whatever its model."""
+        backend = f"ollama:{self.client_config.host or 'default'}"
+        return get_shared_scheduler(backend, self.scheduler_config)
+
+    async def aclose(self) -> None:
+        """Close the pooled client. Other providers sharing the config reopen it lazily."""
+        await close_shared_client(self.client_config)
+
+    async def _chat_on(
         self,
+        client: ollama.AsyncClient,
         messages: list[dict[str, Any]],
         options: dict[str, Any],
         tools: list[dict[str, Any]] | None,
         format: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        def _call_ollama() -> dict[str, Any]:
-            return cast(
-                dict[str, Any],
-                ollama.chat(
-                    model=self.model,
-                    messages=messages,
-                    options=options,
-                    tools=tools,
-                    format=format,
-                ),
-            )
+        response = await client.chat(
+            model=self.model,
+            messages=messages,
+            options=options,
+            tools=tools,
+            format=format,
+        )
+        return response.model_dump()
 
-        return await asyncio.to_thread(_call_ollama)
+    async def _chat_raw(
+        self,
+        messages: list[dict[str, Any]],
+        options: dict[str, Any],
+        tools: list[dict[str, Any]] | None,
+        format: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        async with self.scheduler.slot(self.model) as waited:
+            response = await self._chat_on(self.client, messages, options, tools, format)
+        return tag_queue_wait(response, waited)
+
+    async def _embed_on(self, client: ollama.AsyncClient, texts: list[str]) -> list[list[float]]:
+        response = await client.embed(model=self.embedding_model, input=texts)
+        return [list(vector) for vector in response.embeddings]
+
+    async def _embed_raw(self, texts: list[str]) -> list[list[float]]:
+        async with self.scheduler.slot(self.embedding_model):
+            return await self._embed_on(self.client, texts)
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """
+        Batched `/api/embed` calls. Vectors are kept in the shared on-disk
+        embedding cache, so a text is only embedded once per embedding model.
+        """
+        if not embedding_cache_enabled():
+            return await embed_in_batches(texts, self._embed_raw)
+        cache = get_shared_embedding_cache(self.embedding_cache_dir)
+        return await cache.embed(self.embedding_model, texts, self._embed_raw)
+
+    async def _read_stream(
+        self,
+        client: ollama.AsyncClient,
+        messages: list[dict[str, Any]],
+        options: dict[str, Any],
+        tools: list[dict[str, Any]] | None,
+        format: dict[str, Any] | None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        stream = await client.chat(
+            model=self.model,
+            messages=messages,
+            options=options,
+            tools=tools,
+            format=format,
+            stream=True,
+        )
+        async for chunk in stream:
+            yield chunk.model_dump()
 
     async def _stream_raw(
         self,
@@ -79,37 +150,25 @@ class OllamaProvider(BaseProvider):
         tools: list[dict[str, Any]] | None,
         format: dict[str, Any] | None,
     ) -> AsyncGenerator[dict[str, Any], None]:
-        def _call_ollama_stream():
-            return ollama.chat(
-                model=self.model,
-                messages=messages,
-                options=options,
-                tools=tools,
-                format=format,
-                stream=True,
-            )
-
-        stream_sync = cast(Any, await asyncio.to_thread(_call_ollama_stream))
-        for chunk in stream_sync:
-            yield chunk.model_dump()
+        async with self.scheduler.slot(self.model) as waited:
+            source = self._read_stream(self.client, messages, options, tools, format)
+            async for chunk in buffered_stream(source, self.stream_buffer_size):
+                yield tag_queue_wait(chunk, waited)
 
     async def chat(
         self,
-        messages: list[BaseMessage],
+        messages: Sequence[BaseMessage],
         llm_config: LLMConfig | None = None,
-        agent_tools: list[AgentTool] | None = None,
+        agent_tools: list[AgentTool] | CompiledToolset | None = None,
     ) -> tuple[AssistantMessage, list[ToolMessage]]:
         config = build_llm_config(llm_config)
 
-        tools = None
-        if agent_tools:
-            from ...tools import agent_tools_to_tools_and_handlers
-
-            tools, _ = agent_tools_to_tools_and_handlers(agent_tools)
+        toolset = resolve_toolset(agent_tools)
+        tools = toolset.tools if toolset else None
 
         raw_messages = transform_messages(messages)
         options = config.to_options_dict()
-        tools_formatted = build_tools_for_chat_format(tools)
+        tools_formatted = toolset.wire_tools if toolset else None
         format_schema = config.get_format_schema()
 
         response = await self._chat_raw(
@@ -122,56 +181,53 @@ class OllamaProvider(BaseProvider):
         assistant_msg = cast(
             AssistantMessage, to_message(response, tools=tools, format=config.format)
         )
+        get_telemetry_registry().record(assistant_msg.metrics)
 
         tool_messages: list[ToolMessage] = []
-        if agent_tools and assistant_msg.tool_calls:
+        if toolset and assistant_msg.tool_calls:
             tool_messages = await default_execute_tool_calls(
                 assistant_msg=assistant_msg,
-                agent_tools=agent_tools,
+                agent_tools=toolset,
             )
 
         return assistant_msg, tool_messages
 
     async def stream(
         self,
-        messages: list[BaseMessage],
+        messages: Sequence[BaseMessage],
         llm_config: LLMConfig | None = None,
-        agent_tools: list[AgentTool] | None = None,
+        agent_tools: list[AgentTool] | CompiledToolset | None = None,
     ) -> AsyncGenerator[AssistantMessage | ToolMessage, None]:
         config = build_llm_config(llm_config)
 
-        tools = None
-        if agent_tools:
-            from ...tools import agent_tools_to_tools_and_handlers
-
-            tools, _ = agent_tools_to_tools_and_handlers(agent_tools)
+        toolset = resolve_toolset(agent_tools)
+        tools = toolset.tools if toolset else None
 
         raw_messages = transform_messages(messages)
         options = config.to_options_dict()
-        tools_formatted = build_tools_for_chat_format(tools)
+        tools_formatted = toolset.wire_tools if toolset else None
         format_schema = config.get_format_schema()
 
-        last_chunk: dict[str, Any] = {}
-        assistant_msg: AssistantMessage | None = None
+        accumulator = StreamAccumulator()
         async for chunk in self._stream_raw(
             messages=raw_messages,
             options=options,
             tools=tools_formatted,
             format=format_schema,
         ):
-            last_chunk = chunk
-            assistant_msg = cast(
-                AssistantMessage, to_message(chunk, tools=tools, format=config.format)
-            )
-            yield assistant_msg
+            yield accumulator.add(chunk)
 
-        if not last_chunk or not assistant_msg:
+        if accumulator.is_empty:
             return
 
-        if agent_tools and assistant_msg.tool_calls:
+        assistant_msg = accumulator.build(tools=tools, format=config.format)
+        get_telemetry_registry().record(assistant_msg.metrics)
+        yield assistant_msg
+
+        if toolset and assistant_msg.tool_calls:
             tool_messages = await default_execute_tool_calls(
                 assistant_msg=assistant_msg,
-                agent_tools=agent_tools,
+                agent_tools=toolset,
             )
             for tm in tool_messages:
                 yield tm
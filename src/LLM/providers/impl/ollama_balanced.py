@@ -0,0 +1,139 @@
+import os
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from ...constants import DEFAULT_STREAM_BUFFER_SIZE, OLLAMA_HOSTS_ENV
+from ..base.stream_bridge import buffered_stream
+from ..base.utils import tag_queue_wait
+from ..scheduling import (
+    RequestScheduler,
+    SchedulerConfig,
+    get_shared_scheduler,
+)
+from .ollama import OllamaModels, OllamaProvider
+from .ollama_client import OllamaClientConfig
+from .ollama_pool import OllamaEndpointPool, OllamaPoolConfig, get_shared_pool, is_failover_error
+
+
+class BalancedOllamaProvider(OllamaProvider):
+    """
+    OllamaProvider spread over several hosts.
+
+    Each request goes to the best-ranked host in the pool and fails over to the
+    next one on connection or server errors. A stream stays on one host once
+    its first chunk has arrived; it only fails over before that.
+    """
+
+    def __init__(
+        self,
+        model: str | OllamaModels,
+        pool_config: OllamaPoolConfig,
+        stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+        scheduler_config: SchedulerConfig | None = None,
+    ):
+        super().__init__(
+            model,
+            client_config=pool_config.client_config,
+            stream_buffer_size=stream_buffer_size,
+            scheduler_config=scheduler_config,
+        )
+        self.pool_config = pool_config
+
+    @property
+    def pool(self) -> OllamaEndpointPool:
+        return get_shared_pool(self.pool_config)
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        backend = "ollama-pool:" + ",".join(self.pool_config.hosts)
+        return get_shared_scheduler(backend, self.scheduler_config)
+
+    async def aclose(self) -> None:
+        """Stop the health probes and close the per-host clients."""
+        await self.pool.aclose()
+
+    def _all_failed(self, model: str, error: BaseException | None) -> ConnectionError:
+        hosts = ", ".join(self.pool_config.hosts)
+        return ConnectionError(f"All Ollama hosts failed for '{model}' ({hosts}): {error}")
+
+    async def _chat_raw(
+        self,
+        messages: list[dict[str, Any]],
+        options: dict[str, Any],
+        tools: list[dict[str, Any]] | None,
+        format: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        pool = self.pool
+        last_error: BaseException | None = None
+        async with self.scheduler.slot(self.model) as waited:
+            for endpoint in await pool.ranked(self.model):
+                try:
+                    async with pool.track(endpoint, self.model):
+                        response = await self._chat_on(
+                            endpoint.client, messages, options, tools, format
+                        )
+                        return tag_queue_wait(response, waited)
+                except Exception as e:
+                    if not is_failover_error(e):
+                        raise
+                    last_error = e
+        raise self._all_failed(self.model, last_error) from last_error
+
+    async def _embed_raw(self, texts: list[str]) -> list[list[float]]:
+        pool = self.pool
+        last_error: BaseException | None = None
+        async with self.scheduler.slot(self.embedding_model):
+            for endpoint in await pool.ranked(self.embedding_model):
+                try:
+                    async with pool.track(endpoint, self.embedding_model):
+                        return await self._embed_on(endpoint.client, texts)
+                except Exception as e:
+                    if not is_failover_error(e):
+                        raise
+                    last_error = e
+        raise self._all_failed(self.embedding_model, last_error) from last_error
+
+    async def _stream_raw(
+        self,
+        messages: list[dict[str, Any]],
+        options: dict[str, Any],
+        tools: list[dict[str, Any]] | None,
+        format: dict[str, Any] | None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        pool = self.pool
+        last_error: BaseException | None = None
+        async with self.scheduler.slot(self.model) as waited:
+            for endpoint in await pool.ranked(self.model):
+                started = False
+                try:
+                    async with pool.track(endpoint, self.model):
+                        source = self._read_stream(
+                            endpoint.client, messages, options, tools, format
+                        )
+                        async for chunk in buffered_stream(source, self.stream_buffer_size):
+                            started = True
+                            yield tag_queue_wait(chunk, waited)
+                    return
+                except Exception as e:
+                    # Chunks already handed to the caller cannot be taken back.
+                    if started or not is_failover_error(e):
+                        raise
+                    last_error = e
+        raise self._all_failed(self.model, last_error) from last_error
+
+
+def build_ollama_provider(model: str | OllamaModels) -> OllamaProvider:
+    """
+    Provider for `model` on the hosts listed in AI_FUN_OLLAMA_HOSTS
+    (comma-separated). Several hosts are load-balanced; none falls back to
+    the library's default host (OLLAMA_HOST).
+    """
+    hosts = tuple(h.strip() for h in os.getenv(OLLAMA_HOSTS_ENV, "").split(",") if h.strip())
+    if len(hosts) > 1:
+        return BalancedOllamaProvider(model, OllamaPoolConfig(hosts=hosts))
+    if hosts:
+        return OllamaProvider(model, OllamaClientConfig(host=hosts[0]))
+    return OllamaProvider(model)
+
+
+__all__ = ["BalancedOllamaProvider", "build_ollama_provider"]
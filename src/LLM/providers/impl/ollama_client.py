@@ -0,0 +1,88 @@
+import asyncio
+from dataclasses import dataclass
+
+import httpx
+import ollama
+
+from ...constants import (
+    DEFAULT_OLLAMA_KEEPALIVE_EXPIRY_SECONDS,
+    DEFAULT_OLLAMA_MAX_CONNECTIONS,
+    DEFAULT_OLLAMA_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_OLLAMA_TIMEOUT_SECONDS,
+)
+
+
+@dataclass(frozen=True)
+class OllamaClientConfig:
+    """
+    Connection settings for a pooled Ollama HTTP client.
+
+    Each config talks to a single host, so the connection limits are per host.
+    Providers created with equal configs share one client.
+    """
+
+    host: str | None = None
+    max_connections: int = DEFAULT_OLLAMA_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_OLLAMA_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = DEFAULT_OLLAMA_KEEPALIVE_EXPIRY_SECONDS
+    timeout: float | None = DEFAULT_OLLAMA_TIMEOUT_SECONDS
+
+    def build_client(self) -> ollama.AsyncClient:
+        return ollama.AsyncClient(
+            host=self.host,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        )
+
+
+DEFAULT_OLLAMA_CLIENT_CONFIG = OllamaClientConfig()
+
+
+@dataclass
+class _SharedClient:
+    client: ollama.AsyncClient
+    loop: asyncio.AbstractEventLoop
+
+
+_shared_clients: dict[OllamaClientConfig, _SharedClient] = {}
+
+
+def get_shared_client(config: OllamaClientConfig) -> ollama.AsyncClient:
+    """
+    Return the pooled client for a config, creating it on first use.
+
+    httpx connections are bound to the event loop that opened them, so a client
+    created under a previous loop (e.g. an earlier asyncio.run) is replaced.
+    """
+    loop = asyncio.get_running_loop()
+    shared = _shared_clients.get(config)
+    if shared is None or shared.loop is not loop or shared.loop.is_closed():
+        shared = _SharedClient(client=config.build_client(), loop=loop)
+        _shared_clients[config] = shared
+    return shared.client
+
+
+async def close_shared_client(config: OllamaClientConfig) -> None:
+    shared = _shared_clients.pop(config, None)
+    if shared is None:
+        return
+    if shared.loop is asyncio.get_running_loop():
+        await shared.client.close()
+
+
+async def close_all_shared_clients() -> None:
+    for config in list(_shared_clients):
+        await close_shared_client(config)
+
+
+__all__ = [
+    "DEFAULT_OLLAMA_CLIENT_CONFIG",
+    "OllamaClientConfig",
+    "close_all_shared_clients",
+    "close_shared_client",
+    "get_shared_client",
+]
@@ -0,0 +1,193 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+
+import httpx
+import ollama
+
+from ...constants import (
+    DEFAULT_OLLAMA_OVERFLOW_IN_FLIGHT,
+    DEFAULT_OLLAMA_PROBE_INTERVAL_SECONDS,
+    DEFAULT_OLLAMA_PROBE_TIMEOUT_SECONDS,
+)
+from .ollama_client import (
+    DEFAULT_OLLAMA_CLIENT_CONFIG,
+    OllamaClientConfig,
+    close_shared_client,
+    get_shared_client,
+)
+
+
+@dataclass(frozen=True)
+class OllamaPoolConfig:
+    """
+    A set of Ollama hosts serving the same models.
+
+    Each host gets its own pooled client built from `client_config` (whose host
+    is ignored). Hosts are probed via /api/ps every `probe_interval` seconds.
+    A host with the model loaded is preferred until it has `overflow_in_flight`
+    requests in flight; past that, hosts without the model take the overflow.
+    """
+
+    hosts: tuple[str, ...]
+    client_config: OllamaClientConfig = DEFAULT_OLLAMA_CLIENT_CONFIG
+    probe_interval: float = DEFAULT_OLLAMA_PROBE_INTERVAL_SECONDS
+    probe_timeout: float = DEFAULT_OLLAMA_PROBE_TIMEOUT_SECONDS
+    overflow_in_flight: int = DEFAULT_OLLAMA_OVERFLOW_IN_FLIGHT
+
+    def __post_init__(self) -> None:
+        if not self.hosts:
+            raise ValueError("OllamaPoolConfig needs at least one host")
+        if self.probe_interval <= 0 or self.probe_timeout <= 0:
+            raise ValueError("Probe interval and timeout must be positive")
+        if self.overflow_in_flight < 1:
+            raise ValueError(
+                f"overflow_in_flight must be at least 1, got {self.overflow_in_flight}"
+            )
+
+
+def is_failover_error(error: BaseException) -> bool:
+    """
+    True for errors another host may not have: connection failures, server
+    errors and a model missing on this host. Bad requests are not retried.
+    """
+    if isinstance(error, (ConnectionError, httpx.TransportError, asyncio.TimeoutError)):
+        return True
+    if isinstance(error, ollama.ResponseError):
+        return error.status_code >= 500 or error.status_code == 404
+    return False
+
+
+@dataclass
+class OllamaEndpoint:
+    client_config: OllamaClientConfig
+    healthy: bool = True
+    in_flight: int = 0
+    loaded_models: set[str] = field(default_factory=set)
+    failures: int = 0
+    last_error: str | None = None
+
+    @property
+    def host(self) -> str:
+        return self.client_config.host or "default"
+
+    @property
+    def client(self) -> ollama.AsyncClient:
+        return get_shared_client(self.client_config)
+
+    def mark_failed(self, error: BaseException) -> None:
+        self.healthy = False
+        self.failures += 1
+        self.last_error = str(error) or type(error).__name__
+
+
+class OllamaEndpointPool:
+    """
+    Health and load bookkeeping for a set of Ollama hosts.
+
+    `ranked` orders hosts for a request: healthy before unhealthy, hosts with
+    the model already loaded and below the overflow threshold first, then
+    fewest requests in flight, so an idle host without the model takes over
+    once the loaded ones are busy. Unhealthy hosts stay in the list as a last
+    resort and are re-probed in the background.
+    """
+
+    def __init__(self, config: OllamaPoolConfig):
+        self.config = config
+        self.endpoints = [
+            OllamaEndpoint(replace(config.client_config, host=host)) for host in config.hosts
+        ]
+        self._probe_task: asyncio.Task[None] | None = None
+        self._first_probe: asyncio.Task[None] | None = None
+
+    async def ranked(self, model: str) -> list[OllamaEndpoint]:
+        await self._ensure_probing()
+        overflow = self.config.overflow_in_flight
+
+        def rank(e: OllamaEndpoint) -> tuple[bool, bool, int]:
+            warm = model in e.loaded_models and e.in_flight < overflow
+            return not e.healthy, not warm, e.in_flight
+
+        # sorted() is stable, so ties keep the configured host order.
+        return sorted(self.endpoints, key=rank)
+
+    @asynccontextmanager
+    async def track(self, endpoint: OllamaEndpoint, model: str) -> AsyncIterator[None]:
+        """Count a request against `endpoint` and record how it ended."""
+        endpoint.in_flight += 1
+        try:
+            yield
+        except Exception as e:
+            if is_failover_error(e):
+                endpoint.loaded_models.discard(model)
+                missing_model = isinstance(e, ollama.ResponseError) and e.status_code == 404
+                if not missing_model:
+                    endpoint.mark_failed(e)
+            raise
+        finally:
+            endpoint.in_flight -= 1
+        endpoint.healthy = True
+        endpoint.loaded_models.add(model)
+
+    async def probe(self, endpoint: OllamaEndpoint) -> None:
+        try:
+            response = await asyncio.wait_for(endpoint.client.ps(), self.config.probe_timeout)
+        except Exception as e:
+            endpoint.mark_failed(e)
+            return
+        endpoint.healthy = True
+        names = {name for m in response.models for name in (m.model, m.name) if name}
+        endpoint.loaded_models = names | {name.removesuffix(":latest") for name in names}
+
+    async def probe_all(self) -> None:
+        await asyncio.gather(*(self.probe(endpoint) for endpoint in self.endpoints))
+
+    async def _probe_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.probe_interval)
+            await self.probe_all()
+
+    async def _ensure_probing(self) -> None:
+        # The probe tasks belong to one event loop; start over whenever the
+        # pool is used under a new loop. Every request waits for the first
+        # round, so the first burst is not routed blind.
+        task = self._probe_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._first_probe = asyncio.create_task(self.probe_all())
+            self._probe_task = asyncio.create_task(self._probe_forever())
+        if self._first_probe is not None:
+            await asyncio.shield(self._first_probe)
+
+    async def aclose(self) -> None:
+        task = self._probe_task
+        self._probe_task = None
+        self._first_probe = None
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        for endpoint in self.endpoints:
+            await close_shared_client(endpoint.client_config)
+
+
+_shared_pools: dict[OllamaPoolConfig, OllamaEndpointPool] = {}
+
+
+def get_shared_pool(config: OllamaPoolConfig) -> OllamaEndpointPool:
+    """One pool (and one set of health probes) per config, shared by all providers."""
+    pool = _shared_pools.get(config)
+    if pool is None:
+        pool = OllamaEndpointPool(config)
+        _shared_pools[config] = pool
+    return pool
+
+
+__all__ = [
+    "OllamaEndpoint",
+    "OllamaEndpointPool",
+    "OllamaPoolConfig",
+    "get_shared_pool",
+    "is_failover_error",
+]
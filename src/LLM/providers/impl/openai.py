@@ -1,22 +1,33 @@
 import asyncio
 import os
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, Sequence
 from enum import Enum
 from typing import Any, cast
 
 from openai import AsyncOpenAI
 
 from ...config import LLMConfig
+from ...constants import DEFAULT_OPENAI_MAX_CONCURRENT_REQUESTS
 from ...models.messages import AssistantMessage, BaseMessage, ToolMessage
+from ...telemetry import get_telemetry_registry
 from ...tools.base import AgentTool
 from ..base import BaseProvider
+from ..base.stream_accumulator import StreamAccumulator
 from ..base.tool_usage import default_execute_tool_calls
+from ..base.toolset import CompiledToolset, resolve_toolset
 from ..base.utils import (
     build_llm_config,
-    build_tools_for_chat_format,
+    tag_queue_wait,
     to_message,
     transform_messages,
 )
+from ..scheduling import (
+    UNLIMITED_SCHEDULER_CONFIG,
+    RequestScheduler,
+    SchedulerConfig,
+    get_shared_scheduler,
+)
 
 
 class OpenAIModels(Enum):
@@ -32,24 +43,75 @@ class OpenAIModels(Enum):
 DEFAULT_OPENAI_MODEL = OpenAIModels.GPT_4O
 
 
+def _completion_to_chat_response(completion: dict[str, Any]) -> dict[str, Any]:
+    """Reshape an OpenAI completion into the Ollama-style dict that to_message reads."""
+    choices = completion.get("choices") or [{}]
+    message = dict(choices[0].get("message") or {})
+    message["content"] = message.get("content") or ""
+    usage = completion.get("usage") or {}
+    return {
+        "model": completion.get("model"),
+        "message": message,
+        "done": True,
+        "prompt_eval_count": usage.get("prompt_tokens"),
+        "eval_count": usage.get("completion_tokens"),
+    }
+
+
+def _stream_chunk_to_chat_response(chunk: dict[str, Any]) -> dict[str, Any]:
+    """Reshape an OpenAI stream chunk into the Ollama-style chunk StreamAccumulator reads."""
+    choices = chunk.get("choices") or [{}]
+    delta = choices[0].get("delta") or {}
+    return {
+        "model": chunk.get("model"),
+        "message": {
+            "role": "assistant",
+            "content": delta.get("content") or "",
+            "tool_calls": delta.get("tool_calls"),
+        },
+        "done": choices[0].get("finish_reason") is not None,
+    }
+
+
 class OpenAIProvider(BaseProvider):
     def __init__(
         self,
         model: str | OpenAIModels,
         api_key: str | None = None,
         base_url: str | None = None,
+        max_concurrent_requests: int = DEFAULT_OPENAI_MAX_CONCURRENT_REQUESTS,
+        scheduler_config: SchedulerConfig = UNLIMITED_SCHEDULER_CONFIG,
     ):
         if isinstance(model, OpenAIModels):
             self.model = model.to_openai_name()
         else:
             self.model = model
 
+        if max_concurrent_requests < 1:
+            raise ValueError(
+                f"max_concurrent_requests must be at least 1, got {max_concurrent_requests}"
+            )
+
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.base_url = base_url
+        self.max_concurrent_requests = max_concurrent_requests
+        self.scheduler_config = scheduler_config
         self._client: AsyncOpenAI | None = None
+        self._request_slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _bind_to_running_loop(self) -> None:
+        # The pooled client and the semaphore belong to one event loop; start
+        # fresh when the provider is reused under a new loop.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._client = None
+            self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
 
     @property
     def client(self) -> AsyncOpenAI:
+        self._bind_to_running_loop()
         if self._client is None:
             self._client = AsyncOpenAI(
                 api_key=self.api_key,
@@ -57,38 +119,62 @@ class OpenAIProvider(BaseProvider):
             )
         return self._client
 
+    @property
+    def request_slots(self) -> asyncio.Semaphore:
+        self._bind_to_running_loop()
+        return cast(asyncio.Semaphore, self._request_slots)
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """
+        Shared per endpoint. Unlimited by default, so it only records queue
+        waits; pass a capped config to order concurrent callers by priority.
+        """
+        return get_shared_scheduler(f"openai:{self.base_url or 'default'}", self.scheduler_config)
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.close()
+        self._client = None
+
+    def _request_kwargs(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+    ) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {"model": self.model, "messages": messages}
+        if tools:
+            kwargs["tools"] = tools
+        return kwargs
+
     async def _chat_raw(
         self,
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]] | None,
     ) -> dict[str, Any]:
-        def _call_openai() -> dict[str, Any]:
-            return cast(
-                dict[str, Any],
-                asyncio.run(
-                    self.client.chat.completions.create(
-                        model=self.model,
-                        messages=messages,
-                        tools=tools,
-                    )
-                ),
+        async with self.scheduler.slot(self.model) as waited, self.request_slots:
+            start = time.perf_counter()
+            completion = await self.client.chat.completions.create(
+                **self._request_kwargs(messages, tools)
             )
-
-        return await asyncio.to_thread(_call_openai)
+            elapsed = time.perf_counter() - start
+        response = _completion_to_chat_response(completion.model_dump())
+        # OpenAI reports no server timings; the round trip stands in for them.
+        response["total_duration"] = round(elapsed * 1_000_000_000)
+        return tag_queue_wait(response, waited)
 
     async def _stream_raw(
         self,
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]] | None,
     ) -> AsyncGenerator[dict[str, Any], None]:
-        stream = await self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            tools=tools,
-            stream=True,
-        )
-        async for chunk in stream:
-            yield chunk.model_dump()
+        async with self.scheduler.slot(self.model) as waited, self.request_slots:
+            stream = await self.client.chat.completions.create(
+                **self._request_kwargs(messages, tools),
+                stream=True,
+            )
+            async for chunk in stream:
+                yield tag_queue_wait(_stream_chunk_to_chat_response(chunk.model_dump()), waited)
 
     def _to_openai_options(self, config: LLMConfig) -> dict[str, Any]:
         options: dict[str, Any] = {
@@ -99,20 +185,17 @@ class OpenAIProvider(BaseProvider):
 
     async def chat(
         self,
-        messages: list[BaseMessage],
+        messages: Sequence[BaseMessage],
         llm_config: LLMConfig | None = None,
-        agent_tools: list[AgentTool] | None = None,
+        agent_tools: list[AgentTool] | CompiledToolset | None = None,
     ) -> tuple[AssistantMessage, list[ToolMessage]]:
         config = build_llm_config(llm_config)
 
-        tools = None
-        if agent_tools:
-            from ...tools import agent_tools_to_tools_and_handlers
-
-            tools, _ = agent_tools_to_tools_and_handlers(agent_tools)
+        toolset = resolve_toolset(agent_tools)
+        tools = toolset.tools if toolset else None
 
         raw_messages = transform_messages(messages)
-        tools_formatted = build_tools_for_chat_format(tools)
+        tools_formatted = toolset.wire_tools if toolset else None
 
         response = await self._chat_raw(
             messages=raw_messages,
@@ -122,52 +205,49 @@ class OpenAIProvider(BaseProvider):
         assistant_msg = cast(
             AssistantMessage, to_message(response, tools=tools, format=config.format)
         )
+        get_telemetry_registry().record(assistant_msg.metrics)
 
         tool_messages: list[ToolMessage] = []
-        if agent_tools and assistant_msg.tool_calls:
+        if toolset and assistant_msg.tool_calls:
             tool_messages = await default_execute_tool_calls(
                 assistant_msg=assistant_msg,
-                agent_tools=agent_tools,
+                agent_tools=toolset,
             )
 
         return assistant_msg, tool_messages
 
     async def stream(
         self,
-        messages: list[BaseMessage],
+        messages: Sequence[BaseMessage],
         llm_config: LLMConfig | None = None,
-        agent_tools: list[AgentTool] | None = None,
+        agent_tools: list[AgentTool] | CompiledToolset | None = None,
     ) -> AsyncGenerator[AssistantMessage | ToolMessage, None]:
         config = build_llm_config(llm_config)
 
-        tools = None
-        if agent_tools:
-            from ...tools import agent_tools_to_tools_and_handlers
-
-            tools, _ = agent_tools_to_tools_and_handlers(agent_tools)
+        toolset = resolve_toolset(agent_tools)
+        tools = toolset.tools if toolset else None
 
         raw_messages = transform_messages(messages)
-        tools_formatted = build_tools_for_chat_format(tools)
+        tools_formatted = toolset.wire_tools if toolset else None
 
-        last_chunk: dict[str, Any] = {}
-        assistant_msg: AssistantMessage | None = None
+        accumulator = StreamAccumulator()
         async for chunk in self._stream_raw(
             messages=raw_messages,
             tools=tools_formatted,
         ):
-            last_chunk = chunk
-            assistant_msg = cast(
-                AssistantMessage, to_message(chunk, tools=tools, format=config.format)
-            )
-            yield assistant_msg
+            yield accumulator.add(chunk)
 
-        if not last_chunk or not assistant_msg:
+        if accumulator.is_empty:
             return
 
-        if agent_tools and assistant_msg.tool_calls:
+        assistant_msg = accumulator.build(tools=tools, format=config.format)
+        get_telemetry_registry().record(assistant_msg.metrics)
+        yield assistant_msg
+
+        if toolset and assistant_msg.tool_calls:
             tool_messages = await default_execute_tool_calls(
                 assistant_msg=assistant_msg,
-                agent_tools=agent_tools,
+                agent_tools=toolset,
             )
             for tm in tool_messages:
                 yield tm
@@ -0,0 +1,16 @@
+from .config import DEFAULT_REPLAY_CONFIG, ReplayConfig, ReplayMatch, ReplayTiming
+from .provider import RecordingProvider, ReplayMiss, ReplayProvider
+from .recording import RecordedCall, append_recording, load_recording
+
+__all__ = [
+    "DEFAULT_REPLAY_CONFIG",
+    "RecordedCall",
+    "RecordingProvider",
+    "ReplayConfig",
+    "ReplayMatch",
+    "ReplayMiss",
+    "ReplayProvider",
+    "ReplayTiming",
+    "append_recording",
+    "load_recording",
+]
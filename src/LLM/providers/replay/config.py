@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class ReplayTiming(Enum):
+    # Sleep the recorded gaps between chunks (divided by `speed`).
+    ORIGINAL = "original"
+    # No sleeping: only framework time is left.
+    INSTANT = "instant"
+
+
+class ReplayMatch(Enum):
+    # Serve the recording made for the same request (model, messages, options,
+    # tools, format). Repeated requests get their recordings in order.
+    REQUEST = "request"
+    # Serve recordings in the order they were made, whatever was asked.
+    ORDER = "order"
+
+
+@dataclass(frozen=True)
+class ReplayConfig:
+    timing: ReplayTiming = ReplayTiming.ORIGINAL
+    speed: float = 1.0
+    match: ReplayMatch = ReplayMatch.REQUEST
+
+    def __post_init__(self) -> None:
+        if self.speed <= 0:
+            raise ValueError(f"speed must be positive, got {self.speed}")
+
+    def scale(self, seconds: float) -> float:
+        if self.timing is ReplayTiming.INSTANT:
+            return 0.0
+        return seconds / self.speed
+
+
+DEFAULT_REPLAY_CONFIG = ReplayConfig()
+
+
+__all__ = ["DEFAULT_REPLAY_CONFIG", "ReplayConfig", "ReplayMatch", "ReplayTiming"]
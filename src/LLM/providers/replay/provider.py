@@ -0,0 +1,210 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from ...config import LLMConfig
+from ...models.messages import (
+    AssistantMessage,
+    AssistantMessageDelta,
+    BaseMessage,
+    ToolMessage,
+)
+from ..base import BaseProvider
+from ..base.stream_accumulator import StreamAccumulator
+from ..base.tool_usage import default_execute_tool_calls
+from ..base.toolset import CompiledToolset, resolve_toolset
+from ..base.utils import build_llm_config, to_message, to_raw_response
+from ..cache.key import request_key
+from .config import DEFAULT_REPLAY_CONFIG, ReplayConfig, ReplayMatch
+from .recording import RecordedCall, append_recording, load_recording
+
+if TYPE_CHECKING:
+    from ...tools.base import AgentTool
+
+# Recordings are matched on the request alone, not on which provider made them.
+_KEY_PROVIDER = "recorded"
+
+
+class ReplayMiss(LookupError):
+    """No recorded call matches a request."""
+
+
+class RecordingProvider(BaseProvider):
+    """
+    Pass calls through to `inner` and append each one to a recording file.
+
+    Calls are always made as streams, so one recording replays as either a
+    chat or a stream. Only the model's side is recorded; tool calls are part of
+    the recorded message and tools run again on replay.
+    """
+
+    def __init__(self, inner: BaseProvider, path: str | Path):
+        self.inner = inner
+        self.model = inner.model
+        self.path = Path(path)
+        self.calls = 0
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        return await self.inner.embed(texts)
+
+    async def chat(
+        self,
+        messages: Sequence[BaseMessage],
+        llm_config: LLMConfig | None = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
+    ) -> tuple[AssistantMessage, list[ToolMessage]]:
+        assistant_msg: AssistantMessage | None = None
+        tool_messages: list[ToolMessage] = []
+        async for msg in self.stream(messages, llm_config, agent_tools):
+            if isinstance(msg, ToolMessage):
+                tool_messages.append(msg)
+            elif not isinstance(msg, AssistantMessageDelta):
+                assistant_msg = msg
+        if assistant_msg is None:
+            raise RuntimeError(f"{type(self.inner).__name__} returned no response")
+        return assistant_msg, tool_messages
+
+    async def stream(
+        self,
+        messages: Sequence[BaseMessage],
+        llm_config: LLMConfig | None = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
+    ) -> AsyncGenerator[AssistantMessage | ToolMessage, None]:
+        config = build_llm_config(llm_config)
+        toolset = resolve_toolset(agent_tools)
+        call = RecordedCall(
+            key=request_key(_KEY_PROVIDER, self.model, messages, config, toolset),
+            model=self.model,
+            final={},
+        )
+
+        last = time.perf_counter()
+        async for msg in self.inner.stream(messages, config, toolset):
+            now = time.perf_counter()
+            if isinstance(msg, AssistantMessageDelta):
+                call.chunks.append((now - last, to_raw_response(msg)))
+                last = now
+            elif isinstance(msg, AssistantMessage):
+                call.final = to_raw_response(msg)
+                call.final_delay = now - last
+                await asyncio.to_thread(append_recording, self.path, call)
+                self.calls += 1
+            yield msg
+
+
+class ReplayProvider(BaseProvider):
+    """
+    Serve recorded calls instead of a model.
+
+    With ReplayTiming.ORIGINAL the recorded gaps between chunks are slept
+    again, so a run takes as long as the recorded one; with INSTANT only the
+    framework's own time is left. Tools in a replayed response are executed
+    for real. A request with no recording raises ReplayMiss.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        config: ReplayConfig = DEFAULT_REPLAY_CONFIG,
+        model: str | None = None,
+    ):
+        self.config = config
+        self.recorded = load_recording(path)
+        if not self.recorded and model is None:
+            raise ValueError(f"Recording {path} is empty")
+        self.model = model or self.recorded[0].model
+        self.replayed = 0
+        self._next = 0
+        self._by_key: dict[str, deque[RecordedCall]] = {}
+        for call in self.recorded:
+            self._by_key.setdefault(call.key, deque()).append(call)
+
+    def _take(
+        self,
+        messages: Sequence[BaseMessage],
+        config: LLMConfig,
+        toolset: CompiledToolset | None,
+    ) -> RecordedCall:
+        if self.config.match is ReplayMatch.ORDER:
+            if self._next >= len(self.recorded):
+                raise ReplayMiss(f"All {len(self.recorded)} recorded calls were replayed")
+            call = self.recorded[self._next]
+            self._next += 1
+        else:
+            key = request_key(_KEY_PROVIDER, self.model, messages, config, toolset)
+            queue = self._by_key.get(key)
+            if not queue:
+                raise ReplayMiss(f"No recorded call for this request to {self.model} ({key[:12]})")
+            # Keep the last recording for requests repeated more often than recorded.
+            call = queue.popleft() if len(queue) > 1 else queue[0]
+        self.replayed += 1
+        return call
+
+    async def _sleep_until(self, deadline: float, seconds: float) -> float:
+        """
+        Sleep until `seconds` (scaled) after `deadline` and return the new one.
+        Sleeping to deadlines rather than for each gap keeps timer overshoot
+        from adding up over a long stream.
+        """
+        delay = self.config.scale(seconds)
+        if delay <= 0:
+            return deadline
+        deadline += delay
+        remaining = deadline - time.perf_counter()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        return deadline
+
+    async def _execute_tools(
+        self, assistant_msg: AssistantMessage, toolset: CompiledToolset | None
+    ) -> list[ToolMessage]:
+        if not toolset or not assistant_msg.tool_calls:
+            return []
+        return await default_execute_tool_calls(assistant_msg=assistant_msg, agent_tools=toolset)
+
+    async def chat(
+        self,
+        messages: Sequence[BaseMessage],
+        llm_config: LLMConfig | None = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
+    ) -> tuple[AssistantMessage, list[ToolMessage]]:
+        config = build_llm_config(llm_config)
+        toolset = resolve_toolset(agent_tools)
+        call = self._take(messages, config, toolset)
+
+        await self._sleep_until(time.perf_counter(), call.model_seconds)
+        tools = toolset.tools if toolset else None
+        assistant_msg = cast(AssistantMessage, to_message(call.final, tools, config.format))
+        return assistant_msg, await self._execute_tools(assistant_msg, toolset)
+
+    async def stream(
+        self,
+        messages: Sequence[BaseMessage],
+        llm_config: LLMConfig | None = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
+    ) -> AsyncGenerator[AssistantMessage | ToolMessage, None]:
+        config = build_llm_config(llm_config)
+        toolset = resolve_toolset(agent_tools)
+        call = self._take(messages, config, toolset)
+
+        accumulator = StreamAccumulator()
+        deadline = time.perf_counter()
+        for delay, chunk in call.chunks:
+            deadline = await self._sleep_until(deadline, delay)
+            yield accumulator.add(chunk)
+        await self._sleep_until(deadline, call.final_delay)
+
+        tools = toolset.tools if toolset else None
+        assistant_msg = cast(AssistantMessage, to_message(call.final, tools, config.format))
+        yield assistant_msg
+        for tm in await self._execute_tools(assistant_msg, toolset):
+            yield tm
+
+
+__all__ = ["RecordingProvider", "ReplayMiss", "ReplayProvider"]
@@ -0,0 +1,72 @@
+import gzip
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, cast
+
+
+@dataclass
+class RecordedCall:
+    """
+    One provider call: the raw stream chunks, each with the seconds since the
+    previous one (or since the request for the first), and the final message
+    in the raw chat-response shape `to_message` reads.
+    """
+
+    key: str
+    model: str
+    final: dict[str, Any]
+    chunks: list[tuple[float, dict[str, Any]]] = field(default_factory=list)
+    final_delay: float = 0.0
+
+    @property
+    def model_seconds(self) -> float:
+        return sum(delay for delay, _ in self.chunks) + self.final_delay
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "key": self.key,
+                "model": self.model,
+                "chunks": [[round(delay, 6), chunk] for delay, chunk in self.chunks],
+                "final_delay": round(self.final_delay, 6),
+                "final": self.final,
+            },
+            separators=(",", ":"),
+            default=str,
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> "RecordedCall":
+        data = json.loads(line)
+        return cls(
+            key=data["key"],
+            model=data["model"],
+            final=data["final"],
+            chunks=[(delay, chunk) for delay, chunk in data.get("chunks") or []],
+            final_delay=data.get("final_delay", 0.0),
+        )
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    # A .gz recording is gzip-compressed; appending adds a gzip member, which
+    # readers treat as one continuous stream.
+    if path.suffix == ".gz":
+        return cast(IO[str], gzip.open(path, mode + "t", encoding="utf-8"))
+    return open(path, mode, encoding="utf-8")
+
+
+def append_recording(path: str | Path, call: RecordedCall) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _open(path, "a") as f:
+        f.write(call.to_json() + "\n")
+
+
+def load_recording(path: str | Path) -> list[RecordedCall]:
+    """Recorded calls in the order they were made (JSON lines, optionally gzipped)."""
+    with _open(Path(path), "r") as f:
+        return [RecordedCall.from_json(line) for line in f if line.strip()]
+
+
+__all__ = ["RecordedCall", "append_recording", "load_recording"]
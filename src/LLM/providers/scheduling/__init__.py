@@ -0,0 +1,18 @@
+from .config import DEFAULT_SCHEDULER_CONFIG, UNLIMITED_SCHEDULER_CONFIG, SchedulerConfig
+from .priority import RequestPriority, current_request_priority, request_priority
+from .scheduler import RequestScheduler, get_shared_scheduler
+from .stats import QueueWaitStats, SchedulerStats, percentile
+
+__all__ = [
+    "DEFAULT_SCHEDULER_CONFIG",
+    "QueueWaitStats",
+    "RequestPriority",
+    "RequestScheduler",
+    "SchedulerConfig",
+    "SchedulerStats",
+    "UNLIMITED_SCHEDULER_CONFIG",
+    "current_request_priority",
+    "get_shared_scheduler",
+    "percentile",
+    "request_priority",
+]
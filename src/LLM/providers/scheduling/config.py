@@ -0,0 +1,91 @@
+import os
+from dataclasses import dataclass, replace
+
+from ...constants import (
+    DEFAULT_SCHEDULER_MAX_CONCURRENT,
+    DEFAULT_SCHEDULER_MAX_CONCURRENT_PER_MODEL,
+    DEFAULT_SCHEDULER_RESERVED_INTERACTIVE_SLOTS,
+    SCHEDULER_MAX_CONCURRENT_ENV,
+    SCHEDULER_MAX_CONCURRENT_PER_MODEL_ENV,
+)
+
+
+def _env_limit(name: str) -> int | None:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name}={value!r} is not a whole number") from None
+
+
+@dataclass(frozen=True)
+class SchedulerConfig:
+    """
+    Concurrency caps for the requests sent to one backend.
+
+    `max_concurrent` bounds all in-flight requests and `max_concurrent_per_model`
+    bounds each model; `model_limits` overrides the per-model cap for specific
+    models, e.g. `(("qwen3.5:9b", 1),)`. `max_active_models` bounds how many
+    distinct models may run at once, which stops a shared Ollama host from
+    swapping models in and out. `reserved_interactive_slots` keeps part of the
+    global cap free for interactive calls. None means unlimited, which is the
+    default: callers opt into caps, here or with `with_env_limits`.
+    """
+
+    max_concurrent: int | None = DEFAULT_SCHEDULER_MAX_CONCURRENT
+    max_concurrent_per_model: int | None = DEFAULT_SCHEDULER_MAX_CONCURRENT_PER_MODEL
+    model_limits: tuple[tuple[str, int], ...] = ()
+    max_active_models: int | None = None
+    reserved_interactive_slots: int = DEFAULT_SCHEDULER_RESERVED_INTERACTIVE_SLOTS
+
+    def __post_init__(self) -> None:
+        limits = [self.max_concurrent, self.max_concurrent_per_model, self.max_active_models]
+        limits += [limit for _, limit in self.model_limits]
+        if any(limit is not None and limit < 1 for limit in limits):
+            raise ValueError("Scheduler limits must be at least 1")
+        if self.reserved_interactive_slots < 0:
+            raise ValueError(
+                f"reserved_interactive_slots must not be negative, got {self.reserved_interactive_slots}"
+            )
+        if self.max_concurrent is not None and self.reserved_interactive_slots >= self.max_concurrent:
+            raise ValueError("reserved_interactive_slots must leave room for other priorities")
+
+    def limit_for(self, model: str) -> int | None:
+        for name, limit in self.model_limits:
+            if name == model:
+                return limit
+        return self.max_concurrent_per_model
+
+    def with_env_limits(self) -> "SchedulerConfig":
+        """
+        Apply the caps from AI_FUN_MAX_CONCURRENT and AI_FUN_MAX_CONCURRENT_PER_MODEL
+        if they are set.
+        """
+        max_concurrent = _env_limit(SCHEDULER_MAX_CONCURRENT_ENV)
+        max_per_model = _env_limit(SCHEDULER_MAX_CONCURRENT_PER_MODEL_ENV)
+        config = self
+        if max_concurrent is not None:
+            config = replace(
+                config,
+                max_concurrent=max_concurrent,
+                reserved_interactive_slots=min(
+                    config.reserved_interactive_slots, max(0, max_concurrent - 1)
+                ),
+            )
+        if max_per_model is not None:
+            config = replace(config, max_concurrent_per_model=max_per_model)
+        return config
+
+
+DEFAULT_SCHEDULER_CONFIG = SchedulerConfig()
+
+UNLIMITED_SCHEDULER_CONFIG = SchedulerConfig(
+    max_concurrent=None,
+    max_concurrent_per_model=None,
+    reserved_interactive_slots=0,
+)
+
+
+__all__ = ["DEFAULT_SCHEDULER_CONFIG", "UNLIMITED_SCHEDULER_CONFIG", "SchedulerConfig"]
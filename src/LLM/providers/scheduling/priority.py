@@ -0,0 +1,39 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+
+
+class RequestPriority(Enum):
+    """Scheduling class of a provider call; lower values are served first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+    BACKGROUND = 2
+
+
+_current_priority: ContextVar[RequestPriority] = ContextVar(
+    "request_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+def current_request_priority() -> RequestPriority:
+    return _current_priority.get()
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """
+    Run the provider calls made inside the block at `priority`.
+
+    The value lives in a context variable, so tasks created inside the block
+    (e.g. parallel tool calls) inherit it. Calls default to INTERACTIVE.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+__all__ = ["RequestPriority", "current_request_priority", "request_priority"]
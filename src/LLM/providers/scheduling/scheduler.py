@@ -0,0 +1,159 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from .config import DEFAULT_SCHEDULER_CONFIG, SchedulerConfig
+from .priority import RequestPriority, current_request_priority
+from .stats import SchedulerStats
+
+
+@dataclass(eq=False)
+class _Waiter:
+    model: str
+    priority: RequestPriority
+    future: "asyncio.Future[None]"
+
+
+class RequestScheduler:
+    """
+    Admission control for provider calls to one backend.
+
+    Waiting calls are served strictly by priority class and FIFO within a
+    class; a waiter whose model is at its cap does not hold up calls for other
+    models behind it. Slots are held for the whole call, including streaming.
+    """
+
+    def __init__(self, config: SchedulerConfig = DEFAULT_SCHEDULER_CONFIG):
+        self.config = config
+        self.stats = SchedulerStats()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queues: dict[RequestPriority, deque[_Waiter]] = {}
+        self._in_flight = 0
+        self._in_flight_by_model: dict[str, int] = {}
+        self._bind_to_running_loop()
+
+    def _bind_to_running_loop(self) -> None:
+        # Waiter futures belong to one event loop; start fresh when the
+        # scheduler is reused under a new loop (e.g. a later asyncio.run).
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None and self._loop is loop:
+            return
+        self._loop = loop
+        self._queues = {priority: deque() for priority in RequestPriority}
+        self._in_flight = 0
+        self._in_flight_by_model = {}
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _global_limit(self, priority: RequestPriority) -> int | None:
+        limit = self.config.max_concurrent
+        if limit is None or priority is RequestPriority.INTERACTIVE:
+            return limit
+        return limit - self.config.reserved_interactive_slots
+
+    def _can_start(self, waiter: _Waiter) -> bool:
+        global_limit = self._global_limit(waiter.priority)
+        if global_limit is not None and self._in_flight >= global_limit:
+            return False
+        running = self._in_flight_by_model.get(waiter.model, 0)
+        model_limit = self.config.limit_for(waiter.model)
+        if model_limit is not None and running >= model_limit:
+            return False
+        max_models = self.config.max_active_models
+        if max_models is not None and running == 0:
+            return len(self._in_flight_by_model) < max_models
+        return True
+
+    def _start(self, model: str) -> None:
+        self._in_flight += 1
+        self._in_flight_by_model[model] = self._in_flight_by_model.get(model, 0) + 1
+
+    def _release(self, model: str) -> None:
+        self._in_flight -= 1
+        remaining = self._in_flight_by_model[model] - 1
+        if remaining:
+            self._in_flight_by_model[model] = remaining
+        else:
+            del self._in_flight_by_model[model]
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        for priority in RequestPriority:
+            queue = self._queues[priority]
+            for waiter in list(queue):
+                if waiter.future.done():
+                    # Cancelled while queued; drop it so it never takes a slot.
+                    queue.remove(waiter)
+                elif self._can_start(waiter):
+                    queue.remove(waiter)
+                    self._start(waiter.model)
+                    waiter.future.set_result(None)
+
+    async def _acquire(self, model: str, priority: RequestPriority) -> None:
+        self._bind_to_running_loop()
+        waiter = _Waiter(model, priority, asyncio.get_running_loop().create_future())
+        self._queues[priority].append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.cancelled():
+                if waiter in self._queues[priority]:
+                    self._queues[priority].remove(waiter)
+            else:
+                # Granted just before the cancellation landed; hand the slot on.
+                self._release(model)
+            raise
+
+    @asynccontextmanager
+    async def slot(
+        self, model: str, priority: RequestPriority | None = None
+    ) -> AsyncIterator[float]:
+        """
+        Hold a request slot for `model` and yield the seconds spent queued.
+
+        The priority defaults to the one set with `request_priority`.
+        """
+        if priority is None:
+            priority = current_request_priority()
+        start = time.perf_counter()
+        await self._acquire(model, priority)
+        wait_seconds = time.perf_counter() - start
+        self.stats.record(priority, wait_seconds)
+        try:
+            yield wait_seconds
+        finally:
+            self._release(model)
+
+
+_shared_schedulers: dict[tuple[str, SchedulerConfig], RequestScheduler] = {}
+
+
+def get_shared_scheduler(
+    backend: str, config: SchedulerConfig = DEFAULT_SCHEDULER_CONFIG
+) -> RequestScheduler:
+    """
+    One scheduler per backend and config, shared by every provider that talks
+    to that backend, so unrelated callers are coordinated.
+    """
+    key = (backend, config)
+    scheduler = _shared_schedulers.get(key)
+    if scheduler is None:
+        scheduler = RequestScheduler(config)
+        _shared_schedulers[key] = scheduler
+    return scheduler
+
+
+__all__ = ["RequestScheduler", "get_shared_scheduler"]
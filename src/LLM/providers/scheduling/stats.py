@@ -0,0 +1,62 @@
+from collections import deque
+from dataclasses import dataclass, field
+
+from ...constants import SCHEDULER_WAIT_SAMPLE_SIZE
+from .priority import RequestPriority
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of `samples`; 0.0 when there are none."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(int(len(ordered) * fraction), len(ordered) - 1)
+    return ordered[index]
+
+
+@dataclass
+class QueueWaitStats:
+    """Queue-wait bookkeeping for one priority class; keeps the most recent waits."""
+
+    requests: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    recent_waits: deque[float] = field(
+        default_factory=lambda: deque(maxlen=SCHEDULER_WAIT_SAMPLE_SIZE)
+    )
+
+    def record(self, wait_seconds: float) -> None:
+        self.requests += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+        self.recent_waits.append(wait_seconds)
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.requests if self.requests else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        return percentile(list(self.recent_waits), fraction)
+
+
+@dataclass
+class SchedulerStats:
+    by_priority: dict[RequestPriority, QueueWaitStats] = field(
+        default_factory=lambda: {priority: QueueWaitStats() for priority in RequestPriority}
+    )
+
+    def record(self, priority: RequestPriority, wait_seconds: float) -> None:
+        self.by_priority[priority].record(wait_seconds)
+
+    def format_report(self) -> str:
+        lines = [f"{'priority':>12} {'requests':>9} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9}"]
+        for priority, stats in self.by_priority.items():
+            lines.append(
+                f"{priority.name.lower():>12} {stats.requests:>9} "
+                f"{stats.mean_wait_seconds * 1000:>9.1f} {stats.percentile(0.95) * 1000:>9.1f} "
+                f"{stats.max_wait_seconds * 1000:>9.1f}"
+            )
+        return "\n".join(lines)
+
+
+__all__ = ["QueueWaitStats", "SchedulerStats", "percentile"]
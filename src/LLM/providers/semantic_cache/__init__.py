@@ -0,0 +1,15 @@
+from .config import DEFAULT_SEMANTIC_CACHE_CONFIG, SemanticCacheConfig
+from .index import SemanticCacheStats, SemanticIndex, get_shared_semantic_index
+from .matrix import HAS_NUMPY
+from .provider import SemanticCachingProvider, with_semantic_cache
+
+__all__ = [
+    "DEFAULT_SEMANTIC_CACHE_CONFIG",
+    "HAS_NUMPY",
+    "SemanticCacheConfig",
+    "SemanticCacheStats",
+    "SemanticCachingProvider",
+    "SemanticIndex",
+    "get_shared_semantic_index",
+    "with_semantic_cache",
+]
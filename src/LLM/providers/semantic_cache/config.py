@@ -0,0 +1,61 @@
+import os
+from dataclasses import dataclass, replace
+
+from ...constants import (
+    DEFAULT_SEMANTIC_CACHE_AUDIT_RATE,
+    DEFAULT_SEMANTIC_CACHE_MAX_ENTRIES,
+    DEFAULT_SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_ENV,
+)
+
+
+@dataclass(frozen=True)
+class SemanticCacheConfig:
+    """
+    Settings for the semantic response cache.
+
+    A request is answered from the cache when the cosine similarity of its
+    final turn to a cached one reaches `threshold`. `audit_rate` of the hits
+    are also sent to the model and compared, to estimate how often a hit
+    returns the wrong answer. At most `max_entries` requests are kept, least
+    recently used first out.
+    """
+
+    enabled: bool = False
+    threshold: float = DEFAULT_SEMANTIC_CACHE_THRESHOLD
+    max_entries: int = DEFAULT_SEMANTIC_CACHE_MAX_ENTRIES
+    audit_rate: float = DEFAULT_SEMANTIC_CACHE_AUDIT_RATE
+
+    def __post_init__(self) -> None:
+        if not 0 < self.threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {self.threshold}")
+        if self.max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {self.max_entries}")
+        if not 0 <= self.audit_rate <= 1:
+            raise ValueError(f"audit_rate must be in [0, 1], got {self.audit_rate}")
+
+    def with_env(self) -> "SemanticCacheConfig":
+        """
+        Apply AI_FUN_SEMANTIC_CACHE if it is set: "on" enables the cache, "off"
+        disables it, and a number enables it with that similarity threshold.
+        """
+        value = os.getenv(SEMANTIC_CACHE_ENV, "").strip().lower()
+        if not value:
+            return self
+        if value in ("on", "1", "true"):
+            return replace(self, enabled=True)
+        if value in ("off", "0", "false"):
+            return replace(self, enabled=False)
+        try:
+            threshold = float(value)
+        except ValueError:
+            raise ValueError(
+                f"{SEMANTIC_CACHE_ENV}={value!r} is not on, off or a similarity threshold"
+            ) from None
+        return replace(self, enabled=True, threshold=threshold)
+
+
+DEFAULT_SEMANTIC_CACHE_CONFIG = SemanticCacheConfig()
+
+
+__all__ = ["DEFAULT_SEMANTIC_CACHE_CONFIG", "SemanticCacheConfig"]
@@ -0,0 +1,163 @@
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from .config import SemanticCacheConfig
+from .matrix import new_matrix, normalize
+
+
+@dataclass
+class SemanticCacheStats:
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    stores: int = 0
+    evictions: int = 0
+    audits: int = 0
+    false_hits: int = 0
+    # (score, cached final turn, new final turn) of the latest false hits, for tuning the threshold.
+    false_hit_samples: list[tuple[float, str, str]] = field(default_factory=list)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def false_hit_rate(self) -> float:
+        """Share of audited hits whose fresh answer disagreed with the cached one."""
+        return self.false_hits / self.audits if self.audits else 0.0
+
+    def format_report(self) -> str:
+        lines = [
+            f"semantic cache: {self.hits} hits, {self.misses} misses ({self.hit_rate:.0%}), "
+            f"{self.bypassed} bypassed, {self.evictions} evicted",
+            f"audited {self.audits} hits, {self.false_hits} false ({self.false_hit_rate:.0%})",
+        ]
+        for score, cached, asked in self.false_hit_samples:
+            lines.append(f"  {score:.3f}: {cached[:60]!r} answered {asked[:60]!r}")
+        return "\n".join(lines)
+
+
+@dataclass
+class SemanticMatch:
+    entry_id: int
+    score: float
+    text: str
+    final: dict[str, Any]
+
+
+class _Scope:
+    """Entries for one model, config and conversation prefix."""
+
+    def __init__(self, dim: int):
+        self.matrix = new_matrix(dim)
+        self.ids: list[int] = []
+        self.texts: list[str] = []
+        self.finals: list[dict[str, Any]] = []
+        self.row_of: dict[int, int] = {}
+
+    def add(self, entry_id: int, vector: list[float], text: str, final: dict[str, Any]) -> None:
+        self.row_of[entry_id] = len(self.ids)
+        self.matrix.append(vector)
+        self.ids.append(entry_id)
+        self.texts.append(text)
+        self.finals.append(final)
+
+    def remove(self, entry_id: int) -> None:
+        # Move the last row into the gap so the matrix stays dense.
+        row, last = self.row_of.pop(entry_id), len(self.ids) - 1
+        if row != last:
+            self.matrix.move(last, row)
+            self.ids[row], self.texts[row], self.finals[row] = (
+                self.ids[last],
+                self.texts[last],
+                self.finals[last],
+            )
+            self.row_of[self.ids[row]] = row
+        self.matrix.pop()
+        del self.ids[last], self.texts[last], self.finals[last]
+
+
+class SemanticIndex:
+    """
+    Cached responses searchable by the similarity of their final turn.
+
+    Entries are grouped by scope (an exact fingerprint of everything but the
+    final turn); each scope keeps its unit vectors in one dense matrix, so a
+    lookup is a single matrix-vector product. The least recently used entry
+    across all scopes is evicted once `max_entries` is reached.
+    """
+
+    def __init__(self, config: SemanticCacheConfig):
+        self.config = config
+        self.stats = SemanticCacheStats()
+        self._scopes: dict[str, _Scope] = {}
+        self._lru: OrderedDict[int, str] = OrderedDict()
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def search(self, scope: str, vector: Sequence[float]) -> SemanticMatch | None:
+        """The closest entry at or above the threshold, marked as recently used."""
+        entries = self._scopes.get(scope)
+        if entries is None or not entries.ids:
+            return None
+        row, score = entries.matrix.best(normalize(vector))
+        if score < self.config.threshold:
+            return None
+        entry_id = entries.ids[row]
+        self._lru.move_to_end(entry_id)
+        return SemanticMatch(entry_id, score, entries.texts[row], entries.finals[row])
+
+    def add(self, scope: str, vector: Sequence[float], text: str, final: dict[str, Any]) -> None:
+        entries = self._scopes.get(scope)
+        if entries is None:
+            entries = _Scope(len(vector))
+            self._scopes[scope] = entries
+        entry_id = self._next_id
+        self._next_id += 1
+        entries.add(entry_id, normalize(vector), text, final)
+        self._lru[entry_id] = scope
+        self.stats.stores += 1
+        while len(self._lru) > self.config.max_entries:
+            self._evict()
+
+    def replace(self, scope: str, entry_id: int, final: dict[str, Any]) -> None:
+        entries = self._scopes.get(scope)
+        if entries is not None and entry_id in entries.row_of:
+            entries.finals[entries.row_of[entry_id]] = final
+
+    def _evict(self) -> None:
+        entry_id, scope = self._lru.popitem(last=False)
+        entries = self._scopes[scope]
+        entries.remove(entry_id)
+        if not entries.ids:
+            del self._scopes[scope]
+        self.stats.evictions += 1
+
+    def record_false_hit(self, score: float, cached: str, asked: str) -> None:
+        self.stats.false_hits += 1
+        self.stats.false_hit_samples = [*self.stats.false_hit_samples[-9:], (score, cached, asked)]
+
+
+_shared_indexes: dict[SemanticCacheConfig, SemanticIndex] = {}
+
+
+def get_shared_semantic_index(config: SemanticCacheConfig) -> SemanticIndex:
+    """One index per config, shared by every wrapper that uses it."""
+    index = _shared_indexes.get(config)
+    if index is None:
+        index = SemanticIndex(config)
+        _shared_indexes[config] = index
+    return index
+
+
+__all__ = [
+    "SemanticCacheStats",
+    "SemanticIndex",
+    "SemanticMatch",
+    "get_shared_semantic_index",
+]
@@ -0,0 +1,81 @@
+import importlib.util
+import math
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+# numpy is optional (`pip install ai-fun[semantic]`); without it rows are scanned in Python.
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def normalize(vector: Sequence[float]) -> list[float]:
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+class _ArrayMatrix:
+    """Unit vectors in one flat float32 array, scored by a scan."""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.rows = 0
+        self._data = array("f")
+
+    def append(self, vector: Sequence[float]) -> None:
+        self._data.extend(vector)
+        self.rows += 1
+
+    def move(self, source: int, target: int) -> None:
+        dim = self.dim
+        self._data[target * dim : (target + 1) * dim] = self._data[source * dim : (source + 1) * dim]
+
+    def pop(self) -> None:
+        del self._data[(self.rows - 1) * self.dim :]
+        self.rows -= 1
+
+    def best(self, query: Sequence[float]) -> tuple[int, float]:
+        data, dim = self._data, self.dim
+        best_row, best_score = -1, -2.0
+        for row in range(self.rows):
+            score = sum(map(float.__mul__, query, data[row * dim : (row + 1) * dim]))
+            if score > best_score:
+                best_row, best_score = row, score
+        return best_row, best_score
+
+
+class _NumpyMatrix:
+    """Unit vectors in a preallocated float32 matrix, scored with one matrix-vector product."""
+
+    def __init__(self, dim: int):
+        import numpy
+
+        self._np: Any = numpy
+        self.dim = dim
+        self.rows = 0
+        self._data = numpy.empty((16, dim), dtype=numpy.float32)
+
+    def append(self, vector: Sequence[float]) -> None:
+        if self.rows == len(self._data):
+            grown = self._np.empty((2 * len(self._data), self.dim), dtype=self._np.float32)
+            grown[: self.rows] = self._data
+            self._data = grown
+        self._data[self.rows] = vector
+        self.rows += 1
+
+    def move(self, source: int, target: int) -> None:
+        self._data[target] = self._data[source]
+
+    def pop(self) -> None:
+        self.rows -= 1
+
+    def best(self, query: Sequence[float]) -> tuple[int, float]:
+        scores = self._data[: self.rows] @ self._np.asarray(query, dtype=self._np.float32)
+        row = int(scores.argmax())
+        return row, float(scores[row])
+
+
+def new_matrix(dim: int) -> "_ArrayMatrix | _NumpyMatrix":
+    return _NumpyMatrix(dim) if HAS_NUMPY else _ArrayMatrix(dim)
+
+
+__all__ = ["HAS_NUMPY", "new_matrix", "normalize"]
@@ -0,0 +1,183 @@
+import random
+from collections.abc import AsyncGenerator, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast
+
+from ...config import LLMConfig
+from ...models.messages import (
+    AssistantMessage,
+    AssistantMessageDelta,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from ..base import BaseProvider
+from ..base.stream_accumulator import StreamAccumulator
+from ..base.toolset import CompiledToolset, resolve_toolset
+from ..base.utils import build_llm_config, to_message, to_raw_response, transform_messages
+from ..cache.key import CacheKeyParts, build_cache_key
+from .config import DEFAULT_SEMANTIC_CACHE_CONFIG, SemanticCacheConfig
+from .index import SemanticCacheStats, SemanticIndex, SemanticMatch, get_shared_semantic_index
+from .matrix import normalize
+
+if TYPE_CHECKING:
+    from ...tools.base import AgentTool
+
+
+@dataclass
+class _Lookup:
+    scope: str
+    text: str
+    vector: list[float]
+    match: SemanticMatch | None
+
+
+class SemanticCachingProvider(BaseProvider):
+    """
+    Answer near-duplicate requests from earlier responses.
+
+    The final turn is embedded and compared with cached final turns that share
+    the same model, options, format and everything before it (the system
+    prompt and earlier turns, matched exactly). Calls with tools or images
+    always reach the model. Unlike the exact response cache this also
+    answers sampled calls from the cache, so it is opt-in.
+    """
+
+    def __init__(
+        self,
+        inner: BaseProvider,
+        config: SemanticCacheConfig = DEFAULT_SEMANTIC_CACHE_CONFIG,
+        embedder: BaseProvider | None = None,
+    ):
+        self.inner = inner
+        self.model = inner.model
+        self.config = config
+        self.embedder = embedder or inner
+        self.index: SemanticIndex = get_shared_semantic_index(config)
+
+    @property
+    def stats(self) -> SemanticCacheStats:
+        return self.index.stats
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        return await self.embedder.embed(texts)
+
+    def _scope(self, messages: Sequence[BaseMessage], config: LLMConfig) -> str:
+        return build_cache_key(
+            CacheKeyParts(
+                provider="semantic",
+                model=self.inner.model,
+                messages=transform_messages(messages[:-1]),
+                options=config.to_options_dict(),
+                tools=None,
+                format=config.get_format_schema(),
+            )
+        )
+
+    async def _lookup(
+        self,
+        messages: Sequence[BaseMessage],
+        config: LLMConfig,
+        toolset: CompiledToolset | None,
+    ) -> _Lookup | None:
+        final = messages[-1] if messages else None
+        if (
+            not self.config.enabled
+            or toolset
+            or not isinstance(final, (HumanMessage, SystemMessage))
+            or (isinstance(final, HumanMessage) and final.images)
+        ):
+            self.stats.bypassed += 1
+            return None
+        try:
+            (vector,) = await self.embedder.embed([final.content])
+        except NotImplementedError:
+            self.stats.bypassed += 1
+            return None
+
+        scope = self._scope(messages, config)
+        match = self.index.search(scope, vector)
+        if match is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return _Lookup(scope, final.content, vector, match)
+
+    def _should_audit(self) -> bool:
+        if random.random() >= self.config.audit_rate:
+            return False
+        self.stats.audits += 1
+        return True
+
+    async def _store(self, lookup: _Lookup | None, response: AssistantMessage) -> None:
+        if lookup is None:
+            return
+        if lookup.match is None:
+            self.index.add(lookup.scope, lookup.vector, lookup.text, to_raw_response(response))
+            return
+        cached = lookup.match.final.get("message", {}).get("content", "")
+        if cached != response.content:
+            cached_vector, fresh_vector = await self.embedder.embed([cached, response.content])
+            agreement = sum(a * b for a, b in zip(normalize(cached_vector), normalize(fresh_vector)))
+            if agreement < self.config.threshold:
+                self.index.record_false_hit(lookup.match.score, lookup.match.text, lookup.text)
+        self.index.replace(lookup.scope, lookup.match.entry_id, to_raw_response(response))
+
+    def _restore(self, match: SemanticMatch, config: LLMConfig) -> AssistantMessage:
+        return cast(AssistantMessage, to_message(match.final, format=config.format))
+
+    async def chat(
+        self,
+        messages: Sequence[BaseMessage],
+        llm_config: LLMConfig | None = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
+    ) -> tuple[AssistantMessage, list[ToolMessage]]:
+        config = build_llm_config(llm_config)
+        toolset = resolve_toolset(agent_tools)
+        lookup = await self._lookup(messages, config, toolset)
+        if lookup is not None and lookup.match is not None and not self._should_audit():
+            return self._restore(lookup.match, config), []
+
+        assistant_msg, tool_messages = await self.inner.chat(messages, config, toolset)
+        await self._store(lookup, assistant_msg)
+        return assistant_msg, tool_messages
+
+    async def stream(
+        self,
+        messages: Sequence[BaseMessage],
+        llm_config: LLMConfig | None = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
+    ) -> AsyncGenerator[AssistantMessage | ToolMessage, None]:
+        config = build_llm_config(llm_config)
+        toolset = resolve_toolset(agent_tools)
+        lookup = await self._lookup(messages, config, toolset)
+        if lookup is not None and lookup.match is not None and not self._should_audit():
+            yield StreamAccumulator().add(lookup.match.final)
+            yield self._restore(lookup.match, config)
+            return
+
+        async for msg in self.inner.stream(messages, config, toolset):
+            if isinstance(msg, AssistantMessage) and not isinstance(msg, AssistantMessageDelta):
+                await self._store(lookup, msg)
+            yield msg
+
+
+def with_semantic_cache(
+    provider: BaseProvider,
+    config: SemanticCacheConfig = DEFAULT_SEMANTIC_CACHE_CONFIG,
+) -> BaseProvider:
+    """
+    Wrap a provider in a SemanticCachingProvider if AI_FUN_SEMANTIC_CACHE (or
+    the config) enables it; otherwise return it unchanged.
+    """
+    config = config.with_env()
+    if not config.enabled or isinstance(provider, SemanticCachingProvider):
+        return provider
+    return SemanticCachingProvider(provider, config)
+
+
+__all__ = ["SemanticCachingProvider", "with_semantic_cache"]
@@ -1,11 +1,17 @@
+from .batch import BatchItem, BatchProgress, BatchReport, chat_many
 from .non_stream import chat_non_stream, chat_non_stream_no_tool
-from .stream import chat_stream, chat_stream_no_tool
+from .stream import chat_stream, chat_stream_no_tool, chat_stream_structured
 from .tool_loop import chat_tool
 
 __all__ = [
+    "BatchItem",
+    "BatchProgress",
+    "BatchReport",
+    "chat_many",
     "chat_non_stream",
     "chat_non_stream_no_tool",
     "chat_stream",
     "chat_stream_no_tool",
+    "chat_stream_structured",
     "chat_tool",
 ]
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from ...config import LLMConfig
+from ...constants import DEFAULT_BATCH_CONCURRENCY
+from ...models.messages import AssistantMessage, BaseMessage
+from ...providers import BaseProvider
+from ..scheduling import RequestPriority, request_priority
+
+
+@dataclass
+class BatchItem:
+    """The outcome of one conversation: its response, or the error it raised."""
+
+    index: int
+    response: AssistantMessage | None = None
+    error: Exception | None = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchProgress:
+    """Passed to `on_progress` after every finished conversation."""
+
+    item: BatchItem
+    done: int
+    failed: int
+    total: int
+    elapsed: float
+
+
+@dataclass
+class BatchReport:
+    """Results in input order, with the batch's throughput."""
+
+    items: list[BatchItem] = field(default_factory=list)
+    elapsed: float = 0.0
+    concurrency: int = 0
+
+    @property
+    def responses(self) -> list[AssistantMessage | None]:
+        return [item.response for item in self.items]
+
+    @property
+    def failed(self) -> list[BatchItem]:
+        return [item for item in self.items if not item.ok]
+
+    @property
+    def requests_per_second(self) -> float:
+        return len(self.items) / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def output_tokens(self) -> int:
+        return sum(
+            item.response.metrics.eval_count or 0
+            for item in self.items
+            if item.response is not None and item.response.metrics is not None
+        )
+
+    def format_report(self) -> str:
+        latencies = sorted(item.seconds for item in self.items if item.ok)
+        mean = sum(latencies) / len(latencies) if latencies else 0.0
+        lines = [
+            f"{len(self.items)} conversations, {len(self.failed)} failed, "
+            f"concurrency {self.concurrency}, {self.elapsed:.2f} s",
+            f"{self.requests_per_second:.1f} requests/s, "
+            f"{self.output_tokens / self.elapsed if self.elapsed > 0 else 0.0:.1f} output tokens/s, "
+            f"mean latency {mean * 1000:.0f} ms",
+        ]
+        for item in self.failed:
+            lines.append(f"  #{item.index}: {type(item.error).__name__}: {item.error}")
+        return "\n".join(lines)
+
+
+async def chat_many(
+    provider: BaseProvider,
+    conversations: Sequence[Sequence[BaseMessage]],
+    llm_config: LLMConfig | None = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    priority: RequestPriority = RequestPriority.BATCH,
+    on_progress: Callable[[BatchProgress], None] | None = None,
+) -> BatchReport:
+    """
+    Run many independent conversations without tools and collect the answers.
+
+    At most `concurrency` calls are in flight; the provider's scheduler still
+    applies its per-host and per-model caps on top, and `priority` (BATCH by
+    default) keeps the batch from crowding out interactive calls. A failing
+    conversation is reported on its item instead of stopping the batch.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    total = len(conversations)
+    report = BatchReport(
+        items=[BatchItem(index) for index in range(total)],
+        concurrency=min(concurrency, total),
+    )
+    pending = iter(report.items)
+    done = failed = 0
+    start = time.perf_counter()
+
+    async def worker() -> None:
+        nonlocal done, failed
+        for item in pending:
+            call_start = time.perf_counter()
+            try:
+                item.response, _ = await provider.chat(conversations[item.index], llm_config)
+            except Exception as exc:
+                item.error = exc
+                failed += 1
+            item.seconds = time.perf_counter() - call_start
+            done += 1
+            if on_progress is not None:
+                on_progress(BatchProgress(item, done, failed, total, time.perf_counter() - start))
+
+    with request_priority(priority):
+        await asyncio.gather(*(worker() for _ in range(report.concurrency)))
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+__all__ = ["BatchItem", "BatchProgress", "BatchReport", "chat_many"]
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from ...config import LLMConfig
@@ -6,11 +7,12 @@ from ...providers import BaseProvider
 
 if TYPE_CHECKING:
     from ...tools.base import AgentTool
+    from ..base.toolset import CompiledToolset
 
 
 async def chat_non_stream_no_tool(
     provider: BaseProvider,
-    messages: list[BaseMessage],
+    messages: Sequence[BaseMessage],
     llm_config: LLMConfig | None = None,
 ) -> AssistantMessage:
     """Call LLM without tools. Returns just the AssistantMessage."""
@@ -24,9 +26,9 @@ async def chat_non_stream_no_tool(
 
 async def chat_non_stream(
     provider: BaseProvider,
-    messages: list[BaseMessage],
+    messages: Sequence[BaseMessage],
     llm_config: LLMConfig | None = None,
-    agent_tools: "list[AgentTool] | None" = None,
+    agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
 ) -> tuple[AssistantMessage, list[ToolMessage]]:
     """Call LLM with optional tool support."""
     return await provider.chat(
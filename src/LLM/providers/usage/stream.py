@@ -1,20 +1,25 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from typing import TYPE_CHECKING
 
 from ...config import LLMConfig
-from ...models.messages import AssistantMessage, BaseMessage, ToolMessage
+from ...models.messages import AssistantMessage, AssistantMessageDelta, BaseMessage, ToolMessage
 from ...providers import BaseProvider
+from ...structured_stream import StructuredStreamParser, StructuredUpdate
 
 if TYPE_CHECKING:
     from ...tools.base import AgentTool
+    from ..base.toolset import CompiledToolset
 
 
 async def chat_stream_no_tool(
     provider: BaseProvider,
-    messages: list[BaseMessage],
+    messages: Sequence[BaseMessage],
     llm_config: LLMConfig | None = None,
 ) -> AsyncGenerator[AssistantMessage, None]:
-    """Stream from LLM without tools. Yields assistant message chunks."""
+    """
+    Stream from LLM without tools.
+    Yields AssistantMessageDelta chunks, then the complete AssistantMessage.
+    """
     async for msg in provider.stream(
         messages=messages,
         llm_config=llm_config,
@@ -24,11 +29,39 @@ async def chat_stream_no_tool(
             yield msg
 
 
+async def chat_stream_structured(
+    provider: BaseProvider,
+    messages: Sequence[BaseMessage],
+    llm_config: LLMConfig,
+) -> AsyncGenerator[StructuredUpdate | AssistantMessage, None]:
+    """
+    Stream a structured response without tools.
+    Yields a StructuredUpdate for each top-level field and each list item of
+    `llm_config.format` as soon as it closes, then the complete AssistantMessage.
+    """
+    if llm_config.format is None:
+        raise ValueError("chat_stream_structured needs llm_config.format")
+
+    parser: StructuredStreamParser | None = StructuredStreamParser(llm_config.format)
+    async for msg in chat_stream_no_tool(provider, messages, llm_config):
+        if not isinstance(msg, AssistantMessageDelta):
+            yield msg
+        elif parser is not None and msg.content:
+            try:
+                updates = parser.feed(msg.content)
+            except ValueError:
+                # Not JSON after all; the final message reports what came back.
+                parser = None
+                continue
+            for update in updates:
+                yield update
+
+
 async def chat_stream(
     provider: BaseProvider,
-    messages: list[BaseMessage],
+    messages: Sequence[BaseMessage],
     llm_config: LLMConfig | None = None,
-    agent_tools: "list[AgentTool] | None" = None,
+    agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
 ) -> AsyncGenerator[AssistantMessage | ToolMessage, None]:
     """Stream from LLM with optional tool support."""
     async for msg in provider.stream(
@@ -1,9 +1,16 @@
 from typing import TYPE_CHECKING
 
 from ...config import LLMConfig
-from ...models.messages import AssistantMessage, BaseMessage, ToolMessage
+from ...models.conversation_buffer import ConversationBuffer
+from ...models.messages import (
+    AssistantMessage,
+    AssistantMessageDelta,
+    BaseMessage,
+    ToolMessage,
+)
 from ...models.tool_context import ToolLoopMiddleware, ToolUsageContext
 from ...providers import BaseProvider
+from ..base.toolset import CompiledToolset
 from .non_stream import chat_non_stream
 from .stream import chat_stream
 
@@ -23,12 +30,15 @@ async def chat_tool(
     """
     Main tool loop - repeatedly calls LLM until no more tool calls.
     Middleware observes tool execution via callbacks after provider returns.
+    History is kept in a ConversationBuffer and tools are compiled once, so each
+    iteration only serializes the messages it added.
     """
     if middleware is None:
         middleware = []
 
     tool_usage_context = ToolUsageContext()
-    current_messages = list(messages)
+    current_messages = ConversationBuffer(messages)
+    toolset = CompiledToolset.compile(agent_tools)
     new_messages: list[BaseMessage] = []
 
     for iteration in range(max_tool_calls):
@@ -43,8 +53,10 @@ async def chat_tool(
                 provider=provider,
                 messages=current_messages,
                 llm_config=llm_config,
-                agent_tools=agent_tools,
+                agent_tools=toolset,
             ):
+                if isinstance(msg, AssistantMessageDelta):
+                    continue
                 if isinstance(msg, AssistantMessage):
                     assistant_msg = msg
                 else:
@@ -57,7 +69,7 @@ async def chat_tool(
                 provider=provider,
                 messages=current_messages,
                 llm_config=llm_config,
-                agent_tools=agent_tools,
+                agent_tools=toolset,
             )
 
         for mw in middleware:
@@ -0,0 +1,25 @@
+from .config import (
+    DEFAULT_LATENCY_BUDGETS,
+    DEFAULT_ROUTE_CANDIDATES,
+    DEFAULT_ROUTING_CONFIG,
+    CallType,
+    RoutingConfig,
+)
+from .latency import LatencyTracker, prompt_bucket
+from .provider import RoutedProvider, routed_or_fixed
+from .router import ModelRouter, RouteDecision, get_shared_router
+
+__all__ = [
+    "CallType",
+    "DEFAULT_LATENCY_BUDGETS",
+    "DEFAULT_ROUTE_CANDIDATES",
+    "DEFAULT_ROUTING_CONFIG",
+    "LatencyTracker",
+    "ModelRouter",
+    "RouteDecision",
+    "RoutedProvider",
+    "RoutingConfig",
+    "get_shared_router",
+    "prompt_bucket",
+    "routed_or_fixed",
+]
@@ -0,0 +1,90 @@
+from dataclasses import dataclass, field
+from enum import Enum
+
+from ..constants import DEFAULT_ROUTING_EWMA_ALPHA, DEFAULT_ROUTING_EXPLORE_EVERY
+from ..models.ollama_models import OllamaModels
+
+
+class CallType(Enum):
+    # Short structured output read off existing text (e.g. info-book fallback).
+    STRUCTURED_EXTRACTION = "structured_extraction"
+    # Open-ended conversation, usually with tools.
+    FREE_CHAT = "free_chat"
+    # Long structured reasoning (e.g. the animation frame plan).
+    PLANNING = "planning"
+    # Requests with images attached.
+    VISION = "vision"
+
+
+# Candidates per call type, most capable first. The router takes the first one
+# expected to meet the latency budget.
+DEFAULT_ROUTE_CANDIDATES: dict[CallType, tuple[OllamaModels, ...]] = {
+    CallType.STRUCTURED_EXTRACTION: (
+        OllamaModels.QWEN_3_5_4B,
+        OllamaModels.GEMMA_4B,
+        OllamaModels.GEMMA_1B,
+    ),
+    CallType.FREE_CHAT: (
+        OllamaModels.GLM_4_7_FLASH,
+        OllamaModels.QWEN_8B,
+        OllamaModels.QWEN_3_5_4B,
+        OllamaModels.GEMMA_4B,
+    ),
+    CallType.PLANNING: (
+        OllamaModels.QWEN_3_5_9B,
+        OllamaModels.QWEN_8B,
+        OllamaModels.QWEN_3_5_4B,
+    ),
+    CallType.VISION: (
+        OllamaModels.QWEN_3_5_4B,
+        OllamaModels.GEMMA_4B,
+    ),
+}
+
+DEFAULT_LATENCY_BUDGETS: dict[CallType, float] = {
+    CallType.STRUCTURED_EXTRACTION: 5.0,
+    CallType.FREE_CHAT: 15.0,
+    CallType.PLANNING: 90.0,
+    CallType.VISION: 30.0,
+}
+
+
+@dataclass(frozen=True)
+class RoutingConfig:
+    """
+    Model choices and latency budgets per call type.
+
+    Latencies are learned as an EWMA per model and prompt-size bucket. Every
+    `explore_every` decisions the router retries the most capable candidate
+    even if it was too slow before, so a model that got faster is noticed.
+    """
+
+    candidates: dict[CallType, tuple[OllamaModels, ...]] = field(
+        default_factory=lambda: dict(DEFAULT_ROUTE_CANDIDATES)
+    )
+    latency_budgets: dict[CallType, float] = field(
+        default_factory=lambda: dict(DEFAULT_LATENCY_BUDGETS)
+    )
+    ewma_alpha: float = DEFAULT_ROUTING_EWMA_ALPHA
+    explore_every: int = DEFAULT_ROUTING_EXPLORE_EVERY
+
+    def __post_init__(self) -> None:
+        if not 0 < self.ewma_alpha <= 1:
+            raise ValueError(f"ewma_alpha must be in (0, 1], got {self.ewma_alpha}")
+        if self.explore_every < 1:
+            raise ValueError(f"explore_every must be at least 1, got {self.explore_every}")
+        missing = [t.value for t in CallType if not self.candidates.get(t)]
+        if missing:
+            raise ValueError(f"No candidate models for: {', '.join(missing)}")
+
+
+DEFAULT_ROUTING_CONFIG = RoutingConfig()
+
+
+__all__ = [
+    "CallType",
+    "DEFAULT_LATENCY_BUDGETS",
+    "DEFAULT_ROUTE_CANDIDATES",
+    "DEFAULT_ROUTING_CONFIG",
+    "RoutingConfig",
+]
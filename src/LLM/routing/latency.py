@@ -0,0 +1,38 @@
+import math
+
+from ..constants import ROUTING_PROMPT_BUCKET_TOKENS
+
+
+def prompt_bucket(prompt_tokens: int) -> int:
+    """Power-of-two size class: 0 up to 512 tokens, 1 up to 1024, and so on."""
+    return max(0, math.ceil(math.log2(max(prompt_tokens, 1) / ROUTING_PROMPT_BUCKET_TOKENS)))
+
+
+class LatencyTracker:
+    """Exponentially weighted mean latency per (model, prompt-size bucket)."""
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self._ewma: dict[tuple[str, int], float] = {}
+
+    def record(self, model: str, prompt_tokens: int, seconds: float) -> None:
+        key = (model, prompt_bucket(prompt_tokens))
+        previous = self._ewma.get(key)
+        self._ewma[key] = (
+            seconds if previous is None else previous + self.alpha * (seconds - previous)
+        )
+
+    def predict(self, model: str, prompt_tokens: int) -> float | None:
+        """
+        Expected latency, or None when the model has not been seen yet. An
+        unseen bucket borrows the nearest smaller one, scaled by the size ratio.
+        """
+        bucket = prompt_bucket(prompt_tokens)
+        for smaller in range(bucket, -1, -1):
+            seconds = self._ewma.get((model, smaller))
+            if seconds is not None:
+                return seconds * 2.0 ** (bucket - smaller)
+        return None
+
+
+__all__ = ["LatencyTracker", "prompt_bucket"]
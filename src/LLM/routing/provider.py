@@ -0,0 +1,153 @@
+import time
+from collections.abc import AsyncGenerator, Sequence
+from typing import TYPE_CHECKING
+
+import ollama
+
+from ..config import LLMConfig
+from ..constants import AUTO_MODEL
+from ..context_window.token_estimator import TokenEstimator
+from ..models.messages import (
+    AssistantMessage,
+    AssistantMessageDelta,
+    BaseMessage,
+    HumanMessage,
+    ToolMessage,
+)
+from ..models.ollama_models import OllamaModels
+from ..providers.base import BaseProvider
+from ..providers.base.toolset import CompiledToolset, resolve_toolset
+from ..providers.base.utils import build_llm_config
+from ..providers.impl.ollama_balanced import build_ollama_provider
+from .config import CallType
+from .router import ModelRouter, RouteDecision, get_shared_router
+
+if TYPE_CHECKING:
+    from ..tools.base import AgentTool
+
+StreamItem = AssistantMessage | ToolMessage
+
+
+def _is_missing_model(error: BaseException) -> bool:
+    return isinstance(error, ollama.ResponseError) and error.status_code == 404
+
+
+def _has_images(messages: Sequence[BaseMessage]) -> bool:
+    return any(isinstance(m, HumanMessage) and m.images for m in messages)
+
+
+class RoutedProvider(BaseProvider):
+    """
+    Ollama provider that picks the model per call.
+
+    The router chooses among the candidates for `call_type` from the prompt
+    size and the latency budget, and learns from the time each call takes to
+    produce its complete response (tool execution is not counted). Calls with
+    images are routed as VISION whatever `call_type` says.
+    """
+
+    def __init__(
+        self,
+        call_type: CallType,
+        latency_budget: float | None = None,
+        router: ModelRouter | None = None,
+    ):
+        self.call_type = call_type
+        self.latency_budget = latency_budget
+        self.router = router or get_shared_router()
+        self.model = f"{AUTO_MODEL}:{call_type.value}"
+        self.last_decision: RouteDecision | None = None
+        self._estimator = TokenEstimator()
+        self._providers: dict[OllamaModels, BaseProvider] = {}
+
+    def _provider_for(self, model: OllamaModels) -> BaseProvider:
+        provider = self._providers.get(model)
+        if provider is None:
+            provider = build_ollama_provider(model)
+            self._providers[model] = provider
+        return provider
+
+    async def aclose(self) -> None:
+        for provider in self._providers.values():
+            await provider.aclose()
+        self._providers.clear()
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        # The embedding model does not depend on the routed chat model.
+        candidate = self.router.config.candidates[self.call_type][0]
+        return await self._provider_for(candidate).embed(texts)
+
+    async def _start(
+        self,
+        messages: Sequence[BaseMessage],
+        config: LLMConfig,
+        toolset: CompiledToolset | None,
+    ) -> tuple[RouteDecision, AsyncGenerator[StreamItem, None], StreamItem, float]:
+        call_type = CallType.VISION if _has_images(messages) else self.call_type
+        prompt_tokens = sum(self._estimator.estimate(m) for m in messages)
+        while True:
+            decision = self.router.choose(call_type, prompt_tokens, self.latency_budget)
+            start = time.perf_counter()
+            stream = self._provider_for(decision.model).stream(messages, config, toolset)
+            try:
+                first = await anext(stream)
+            except Exception as exc:
+                await stream.aclose()
+                if not _is_missing_model(exc):
+                    raise
+                # Not pulled on this server: route around it from now on.
+                self.router.mark_unavailable(decision.model)
+                continue
+            self.last_decision = decision
+            return decision, stream, first, start
+
+    async def chat(
+        self,
+        messages: Sequence[BaseMessage],
+        llm_config: LLMConfig | None = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
+    ) -> tuple[AssistantMessage, list[ToolMessage]]:
+        assistant_msg: AssistantMessage | None = None
+        tool_messages: list[ToolMessage] = []
+        async for msg in self.stream(messages, llm_config, agent_tools):
+            if isinstance(msg, ToolMessage):
+                tool_messages.append(msg)
+            elif not isinstance(msg, AssistantMessageDelta):
+                assistant_msg = msg
+        if assistant_msg is None:
+            raise RuntimeError(f"{self.model} returned no response")
+        return assistant_msg, tool_messages
+
+    async def stream(
+        self,
+        messages: Sequence[BaseMessage],
+        llm_config: LLMConfig | None = None,
+        agent_tools: "list[AgentTool] | CompiledToolset | None" = None,
+    ) -> AsyncGenerator[AssistantMessage | ToolMessage, None]:
+        config = build_llm_config(llm_config)
+        toolset = resolve_toolset(agent_tools)
+        decision, stream, first, start = await self._start(messages, config, toolset)
+
+        def observe(msg: StreamItem) -> StreamItem:
+            if isinstance(msg, AssistantMessage) and not isinstance(msg, AssistantMessageDelta):
+                self.router.record(
+                    decision.model, decision.prompt_tokens, time.perf_counter() - start
+                )
+            return msg
+
+        try:
+            yield observe(first)
+            async for msg in stream:
+                yield observe(msg)
+        finally:
+            await stream.aclose()
+
+
+def routed_or_fixed(model: OllamaModels | None, call_type: CallType) -> BaseProvider:
+    """A provider for `model`, or a RoutedProvider for `call_type` when it is None."""
+    if model is None:
+        return RoutedProvider(call_type)
+    return build_ollama_provider(model)
+
+
+__all__ = ["RoutedProvider", "routed_or_fixed"]
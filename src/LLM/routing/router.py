@@ -0,0 +1,94 @@
+from collections import Counter
+from dataclasses import dataclass
+
+from ..context_window.config import DEFAULT_CONTEXT_WINDOW_CONFIG
+from ..models.ollama_models import OllamaModels
+from .config import DEFAULT_ROUTING_CONFIG, CallType, RoutingConfig
+from .latency import LatencyTracker
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    model: OllamaModels
+    call_type: CallType
+    prompt_tokens: int
+    budget: float
+    predicted_seconds: float | None
+    reason: str
+
+
+class ModelRouter:
+    """
+    Pick a model for a call from its type, prompt size and latency budget.
+
+    Candidates whose context window cannot hold the prompt are skipped. Of the
+    rest, the most capable one expected to finish within the budget wins; a
+    model without history is assumed to fit, so it gets measured. When nothing
+    fits, the fastest known candidate is used. Models the server reported
+    missing are skipped for the rest of the process.
+    """
+
+    def __init__(self, config: RoutingConfig = DEFAULT_ROUTING_CONFIG):
+        self.config = config
+        self.latencies = LatencyTracker(config.ewma_alpha)
+        self.decisions: Counter[tuple[CallType, OllamaModels]] = Counter()
+        self.unavailable: set[OllamaModels] = set()
+        self._decision_count = 0
+
+    def _fitting_candidates(self, call_type: CallType, prompt_tokens: int) -> list[OllamaModels]:
+        candidates = [m for m in self.config.candidates[call_type] if m not in self.unavailable]
+        if not candidates:
+            raise RuntimeError(f"No available model for {call_type.value} calls")
+        fitting = [
+            model
+            for model in candidates
+            if DEFAULT_CONTEXT_WINDOW_CONFIG.budget_for(model.value) >= prompt_tokens
+        ]
+        if fitting:
+            return fitting
+        # Nothing holds the prompt; the largest window loses the least.
+        return [max(candidates, key=lambda m: DEFAULT_CONTEXT_WINDOW_CONFIG.budget_for(m.value))]
+
+    def choose(
+        self, call_type: CallType, prompt_tokens: int, budget: float | None = None
+    ) -> RouteDecision:
+        budget = budget if budget is not None else self.config.latency_budgets[call_type]
+        candidates = self._fitting_candidates(call_type, prompt_tokens)
+        self._decision_count += 1
+
+        def decide(model: OllamaModels, predicted: float | None, reason: str) -> RouteDecision:
+            self.decisions[(call_type, model)] += 1
+            return RouteDecision(model, call_type, prompt_tokens, budget, predicted, reason)
+
+        predictions = [(m, self.latencies.predict(m.value, prompt_tokens)) for m in candidates]
+        if self._decision_count % self.config.explore_every == 0:
+            model, predicted = predictions[0]
+            return decide(model, predicted, "explore")
+        for model, predicted in predictions:
+            if predicted is None:
+                return decide(model, predicted, "unmeasured")
+            if predicted <= budget:
+                return decide(model, predicted, "within budget")
+        model, predicted = min(predictions, key=lambda p: p[1] or 0.0)
+        return decide(model, predicted, "fastest, over budget")
+
+    def record(self, model: OllamaModels, prompt_tokens: int, seconds: float) -> None:
+        self.latencies.record(model.value, prompt_tokens, seconds)
+
+    def mark_unavailable(self, model: OllamaModels) -> None:
+        """Stop routing to a model the server does not have (not pulled)."""
+        self.unavailable.add(model)
+
+
+_shared_router: ModelRouter | None = None
+
+
+def get_shared_router() -> ModelRouter:
+    """The process-wide router, so every RoutedProvider learns from every call."""
+    global _shared_router
+    if _shared_router is None:
+        _shared_router = ModelRouter()
+    return _shared_router
+
+
+__all__ = ["ModelRouter", "RouteDecision", "get_shared_router"]
@@ -0,0 +1,32 @@
+import weakref
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+_schemas: "weakref.WeakKeyDictionary[type[BaseModel], dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+def format_schema(format: type[BaseModel]) -> dict[str, Any]:
+    """
+    JSON schema for a structured-output model, generated once per class.
+
+    The dict is shared by every request with that format, so treat it as
+    read-only. Entries go away with the class, so models built on the fly do
+    not pile up.
+    """
+    schema = _schemas.get(format)
+    if schema is None:
+        schema = format.model_json_schema()
+        _schemas[format] = schema
+    return schema
+
+
+def parse_structured(format: type[BaseModel], content: str) -> BaseModel | None:
+    """Validate the complete response content, or None if it does not match."""
+    try:
+        return format.model_validate_json(content)
+    except ValidationError:
+        return None
+
+
+__all__ = ["format_schema", "parse_structured"]
@@ -0,0 +1,93 @@
+import weakref
+from dataclasses import dataclass
+from typing import Annotated, Any, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from .partial_json import ClosedValue, PartialJSONParser
+
+
+@dataclass
+class StructuredUpdate:
+    """A top-level field (index None) or one item of a list field, validated."""
+
+    field: str
+    value: Any
+    index: int | None = None
+
+
+@dataclass
+class _FieldValidators:
+    value: TypeAdapter[Any]
+    item: TypeAdapter[Any] | None
+
+
+_validators: "weakref.WeakKeyDictionary[type[BaseModel], dict[str, _FieldValidators]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _field_validators(format: type[BaseModel]) -> dict[str, _FieldValidators]:
+    validators = _validators.get(format)
+    if validators is not None:
+        return validators
+    validators = {}
+    for name, info in format.model_fields.items():
+        annotation: Any = info.annotation
+        constrained: Any = annotation
+        if info.metadata:
+            constrained = Annotated[tuple([annotation, *info.metadata])]
+        item_type = get_args(annotation)[0] if get_origin(annotation) is list else None
+        validators[info.alias or name] = _FieldValidators(
+            value=TypeAdapter(constrained),
+            item=TypeAdapter(item_type) if item_type is not None else None,
+        )
+    _validators[format] = validators
+    return validators
+
+
+class StructuredStreamParser:
+    """
+    Turn the streamed text of a structured response into validated pieces.
+
+    Each top-level field of `format` is reported once its JSON value closes,
+    and each item of a list field as soon as that item closes, so a consumer
+    can act on the first frames of a plan while later ones are generated.
+    Pieces that fail validation are skipped; the final message's `parsed`
+    remains the authority on the whole response.
+    """
+
+    def __init__(self, format: type[BaseModel]):
+        self.format = format
+        self.fields: dict[str, Any] = {}
+        self._validators = _field_validators(format)
+        self._json = PartialJSONParser()
+
+    def feed(self, text: str) -> list[StructuredUpdate]:
+        updates = []
+        for closed in self._json.feed(text):
+            update = self._validate(closed)
+            if update is not None:
+                updates.append(update)
+        return updates
+
+    def _validate(self, closed: ClosedValue) -> StructuredUpdate | None:
+        path = closed.path
+        if not path or not isinstance(path[0], str) or path[0] not in self._validators:
+            return None
+        validators = self._validators[path[0]]
+        try:
+            if len(path) == 1:
+                value = validators.value.validate_python(closed.value)
+                self.fields[path[0]] = value
+                return StructuredUpdate(path[0], value)
+            if len(path) == 2 and validators.item is not None and isinstance(path[1], int):
+                return StructuredUpdate(
+                    path[0], validators.item.validate_python(closed.value), path[1]
+                )
+        except ValidationError:
+            return None
+        return None
+
+
+__all__ = ["StructuredStreamParser", "StructuredUpdate"]
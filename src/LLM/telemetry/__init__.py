@@ -0,0 +1,17 @@
+from .histogram import Histogram
+from .metrics import CallMetrics
+from .registry import (
+    ModelTelemetry,
+    TelemetryRegistry,
+    export_telemetry_from_env,
+    get_telemetry_registry,
+)
+
+__all__ = [
+    "CallMetrics",
+    "Histogram",
+    "ModelTelemetry",
+    "TelemetryRegistry",
+    "export_telemetry_from_env",
+    "get_telemetry_registry",
+]
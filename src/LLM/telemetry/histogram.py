@@ -0,0 +1,38 @@
+import bisect
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Histogram:
+    """Fixed-bucket histogram in the Prometheus layout (cumulative on export)."""
+
+    bounds: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            # One slot per bound plus the +Inf overflow.
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """(le label, count) pairs including "+Inf", as Prometheus expects."""
+        running = 0
+        pairs = []
+        for bound, count in zip((*self.bounds, float("inf")), self.counts):
+            running += count
+            pairs.append(("+Inf" if bound == float("inf") else f"{bound:g}", running))
+        return pairs
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+
+__all__ = ["Histogram"]
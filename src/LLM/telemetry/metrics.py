@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import Any
+
+from ..constants import COLD_LOAD_THRESHOLD_SECONDS, QUEUE_DURATION_FIELD
+
+_NANOSECONDS = 1_000_000_000
+
+
+def _seconds(response: dict[str, Any], field: str) -> float | None:
+    value = response.get(field)
+    return value / _NANOSECONDS if isinstance(value, (int, float)) else None
+
+
+def _count(response: dict[str, Any], field: str) -> int | None:
+    value = response.get(field)
+    return int(value) if isinstance(value, (int, float)) else None
+
+
+@dataclass(frozen=True)
+class CallMetrics:
+    """
+    Timings of one model call, from the fields Ollama sends with its final
+    response. Durations are in seconds; anything the backend did not report
+    is None. `queue_seconds` is the time spent waiting for a scheduler slot.
+    """
+
+    model: str | None = None
+    total_seconds: float | None = None
+    load_seconds: float | None = None
+    prompt_eval_count: int | None = None
+    prompt_eval_seconds: float | None = None
+    eval_count: int | None = None
+    eval_seconds: float | None = None
+    queue_seconds: float | None = None
+
+    @classmethod
+    def from_response(cls, response: dict[str, Any]) -> "CallMetrics | None":
+        metrics = cls(
+            model=response.get("model"),
+            total_seconds=_seconds(response, "total_duration"),
+            load_seconds=_seconds(response, "load_duration"),
+            prompt_eval_count=_count(response, "prompt_eval_count"),
+            prompt_eval_seconds=_seconds(response, "prompt_eval_duration"),
+            eval_count=_count(response, "eval_count"),
+            eval_seconds=_seconds(response, "eval_duration"),
+            queue_seconds=_seconds(response, QUEUE_DURATION_FIELD),
+        )
+        return None if metrics.is_empty else metrics
+
+    @property
+    def is_empty(self) -> bool:
+        return all(
+            value is None
+            for value in (
+                self.total_seconds,
+                self.load_seconds,
+                self.prompt_eval_count,
+                self.eval_count,
+                self.queue_seconds,
+            )
+        )
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        if not self.eval_count or not self.eval_seconds:
+            return None
+        return self.eval_count / self.eval_seconds
+
+    @property
+    def prompt_tokens_per_second(self) -> float | None:
+        if not self.prompt_eval_count or not self.prompt_eval_seconds:
+            return None
+        return self.prompt_eval_count / self.prompt_eval_seconds
+
+    @property
+    def cold_load(self) -> bool:
+        """True when the model had to be loaded for this call."""
+        return (self.load_seconds or 0.0) >= COLD_LOAD_THRESHOLD_SECONDS
+
+
+__all__ = ["CallMetrics"]
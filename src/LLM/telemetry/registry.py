@@ -0,0 +1,191 @@
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..constants import TELEMETRY_FILE_ENV, TELEMETRY_RATE_BUCKETS, TELEMETRY_SECONDS_BUCKETS
+from .histogram import Histogram
+from .metrics import CallMetrics
+
+_PREFIX = "ai_fun_llm"
+
+
+def _rate_histogram() -> Histogram:
+    return Histogram(TELEMETRY_RATE_BUCKETS)
+
+
+def _seconds_histogram() -> Histogram:
+    return Histogram(TELEMETRY_SECONDS_BUCKETS)
+
+
+@dataclass
+class ModelTelemetry:
+    calls: int = 0
+    cold_loads: int = 0
+    prompt_tokens: int = 0
+    generated_tokens: int = 0
+    generation_tokens_per_second: Histogram = field(default_factory=_rate_histogram)
+    prompt_tokens_per_second: Histogram = field(default_factory=_rate_histogram)
+    load_seconds: Histogram = field(default_factory=_seconds_histogram)
+    queue_seconds: Histogram = field(default_factory=_seconds_histogram)
+    total_seconds: Histogram = field(default_factory=_seconds_histogram)
+
+    def record(self, metrics: CallMetrics) -> None:
+        self.calls += 1
+        self.cold_loads += int(metrics.cold_load)
+        self.prompt_tokens += metrics.prompt_eval_count or 0
+        self.generated_tokens += metrics.eval_count or 0
+        for histogram, value in (
+            (self.generation_tokens_per_second, metrics.tokens_per_second),
+            (self.prompt_tokens_per_second, metrics.prompt_tokens_per_second),
+            (self.load_seconds, metrics.load_seconds),
+            (self.queue_seconds, metrics.queue_seconds),
+            (self.total_seconds, metrics.total_seconds),
+        ):
+            if value is not None:
+                histogram.observe(value)
+
+    def histograms(self) -> dict[str, Histogram]:
+        return {
+            "generation_tokens_per_second": self.generation_tokens_per_second,
+            "prompt_tokens_per_second": self.prompt_tokens_per_second,
+            "load_seconds": self.load_seconds,
+            "queue_seconds": self.queue_seconds,
+            "total_seconds": self.total_seconds,
+        }
+
+    def counters(self) -> dict[str, int]:
+        return {
+            "calls_total": self.calls,
+            "cold_loads_total": self.cold_loads,
+            "prompt_tokens_total": self.prompt_tokens,
+            "generated_tokens_total": self.generated_tokens,
+        }
+
+
+_HELP = {
+    "calls_total": "Model calls that reported timings.",
+    "cold_loads_total": "Calls that had to load the model first.",
+    "prompt_tokens_total": "Prompt tokens evaluated.",
+    "generated_tokens_total": "Tokens generated.",
+    "generation_tokens_per_second": "Generation speed per call.",
+    "prompt_tokens_per_second": "Prompt evaluation speed per call.",
+    "load_seconds": "Model load time per call.",
+    "queue_seconds": "Time spent waiting for a scheduler slot.",
+    "total_seconds": "Server-side duration per call.",
+}
+
+
+class TelemetryRegistry:
+    """
+    Per-model call telemetry for the whole process.
+
+    Providers record the CallMetrics of every response here. Export it with
+    to_prometheus() (text exposition format, e.g. for node_exporter's textfile
+    collector) or snapshot() for JSON.
+    """
+
+    def __init__(self) -> None:
+        self.models: dict[str, ModelTelemetry] = {}
+
+    def record(self, metrics: CallMetrics | None) -> None:
+        if metrics is None:
+            return
+        model = metrics.model or "unknown"
+        telemetry = self.models.get(model)
+        if telemetry is None:
+            telemetry = ModelTelemetry()
+            self.models[model] = telemetry
+        telemetry.record(metrics)
+
+    def reset(self) -> None:
+        self.models.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            model: {
+                **telemetry.counters(),
+                **{
+                    name: {
+                        "count": histogram.count,
+                        "sum": histogram.total,
+                        "buckets": dict(histogram.cumulative()),
+                    }
+                    for name, histogram in telemetry.histograms().items()
+                },
+            }
+            for model, telemetry in sorted(self.models.items())
+        }
+
+    def to_prometheus(self) -> str:
+        models = sorted(self.models.items())
+        if not models:
+            return ""
+        lines: list[str] = []
+        for name in models[0][1].counters():
+            lines.append(f"# HELP {_PREFIX}_{name} {_HELP[name]}")
+            lines.append(f"# TYPE {_PREFIX}_{name} counter")
+            for model, telemetry in models:
+                lines.append(f'{_PREFIX}_{name}{{model="{model}"}} {telemetry.counters()[name]}')
+        for name in models[0][1].histograms():
+            lines.append(f"# HELP {_PREFIX}_{name} {_HELP[name]}")
+            lines.append(f"# TYPE {_PREFIX}_{name} histogram")
+            for model, telemetry in models:
+                histogram = telemetry.histograms()[name]
+                for le, count in histogram.cumulative():
+                    lines.append(f'{_PREFIX}_{name}_bucket{{model="{model}",le="{le}"}} {count}')
+                lines.append(f'{_PREFIX}_{name}_sum{{model="{model}"}} {histogram.total:g}')
+                lines.append(f'{_PREFIX}_{name}_count{{model="{model}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | Path) -> Path:
+        """Write a JSON snapshot (for .json paths) or Prometheus text, atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".json":
+            text = json.dumps(self.snapshot(), indent=2)
+        else:
+            text = self.to_prometheus()
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(path)
+        return path
+
+    def format_report(self) -> str:
+        def mean(histogram: Histogram, scale: float = 1.0, unit: str = "") -> str:
+            value = histogram.mean
+            return "n/a" if value is None else f"{value * scale:.1f}{unit}"
+
+        lines = []
+        for model, telemetry in sorted(self.models.items()):
+            lines.append(
+                f"{model}: {telemetry.calls} calls, {telemetry.cold_loads} cold loads, "
+                f"gen {mean(telemetry.generation_tokens_per_second, unit=' tok/s')}, "
+                f"prompt {mean(telemetry.prompt_tokens_per_second, unit=' tok/s')}, "
+                f"queue {mean(telemetry.queue_seconds, 1000, ' ms')} avg"
+            )
+        return "\n".join(lines) or "No model calls recorded."
+
+
+_registry = TelemetryRegistry()
+
+
+def get_telemetry_registry() -> TelemetryRegistry:
+    return _registry
+
+
+def export_telemetry_from_env() -> Path | None:
+    """Write the registry to the file named by AI_FUN_METRICS_FILE, if set."""
+    target = os.getenv(TELEMETRY_FILE_ENV)
+    if not target:
+        return None
+    return _registry.write(target)
+
+
+__all__ = [
+    "ModelTelemetry",
+    "TelemetryRegistry",
+    "export_telemetry_from_env",
+    "get_telemetry_registry",
+]
@@ -102,6 +102,9 @@ def _get_annotated_description(param: inspect.Parameter) -> str | None:
 
 class AgentTool(ABC):
     _parameters: dict = {}
+    # Tools that only touch in-process state or do independent I/O can set this,
+    # so several calls in one turn run concurrently. Interactive tools stay serial.
+    concurrency_safe: bool = False
 
     def __init_subclass__(cls, **kwargs: Any):
         super().__init_subclass__(**kwargs)
@@ -178,11 +181,7 @@ class AgentTool(ABC):
 
     def get_handler(self) -> Callable[..., Awaitable[str]]:
         """Return a callable handler for this tool."""
-
-        async def handler(*args: Any, **kwargs: Any) -> str:
-            return await self.execute(*args, **kwargs)
-
-        return handler
+        return self.execute
 
     def to_tool(self) -> "Tool":
         return Tool(
@@ -0,0 +1,82 @@
+from collections.abc import Callable
+from typing import Any
+
+ArgumentCoercer = Callable[[dict[str, Any]], dict[str, Any]]
+
+_TRUE_STRINGS = {"true", "yes", "1"}
+_FALSE_STRINGS = {"false", "no", "0"}
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"Cannot interpret {value!r} as a boolean")
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        return int(value.strip())
+    raise ValueError(f"Cannot interpret {value!r} as an integer")
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, (int, str)) and not isinstance(value, bool):
+        return float(value)
+    raise ValueError(f"Cannot interpret {value!r} as a number")
+
+
+def _to_str(value: Any) -> str:
+    if isinstance(value, (int, float, bool)):
+        return str(value)
+    raise ValueError(f"Cannot interpret {value!r} as a string")
+
+
+# (expected python types, converter) per JSON schema type.
+_CONVERTERS: dict[str, tuple[tuple[type, ...], Callable[[Any], Any]]] = {
+    "string": ((str,), _to_str),
+    "integer": ((int,), _to_int),
+    "number": ((int, float), _to_float),
+    "boolean": ((bool,), _to_bool),
+}
+
+
+def build_argument_coercer(parameters: dict[str, Any]) -> ArgumentCoercer:
+    """
+    Build a function that fixes common type slips in model-supplied arguments,
+    such as "3" for an integer or 5 for a string. Values that are already the
+    right type, cannot be converted, or are not in the schema pass through.
+    Always returns a new dict.
+    """
+    properties = parameters.get("properties") or {}
+    converters = {
+        name: _CONVERTERS[prop["type"]]
+        for name, prop in properties.items()
+        if prop.get("type") in _CONVERTERS
+    }
+
+    def coerce(arguments: dict[str, Any]) -> dict[str, Any]:
+        coerced = dict(arguments)
+        for name, value in arguments.items():
+            converter = converters.get(name)
+            if converter is None:
+                continue
+            expected, convert = converter
+            # bool is an int subclass; never let True pass as an integer.
+            if isinstance(value, expected) and not (isinstance(value, bool) and bool not in expected):
+                continue
+            try:
+                coerced[name] = convert(value)
+            except ValueError:
+                pass
+        return coerced
+
+    return coerce
+
+
+__all__ = ["ArgumentCoercer", "build_argument_coercer"]
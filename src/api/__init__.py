@@ -0,0 +1,5 @@
+from .config import DEFAULT_API_CONFIG, ApiConfig
+from .jobs import Job, JobStatus
+from .server import ApiServer, serve_api
+
+__all__ = ["DEFAULT_API_CONFIG", "ApiConfig", "ApiServer", "Job", "JobStatus", "serve_api"]
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+from src.constants import (
+    DEFAULT_API_HOST,
+    DEFAULT_API_JOB_HISTORY,
+    DEFAULT_API_JOB_WORKERS,
+    DEFAULT_API_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_API_MAX_QUEUED_JOBS,
+    DEFAULT_API_MAX_QUEUED_REQUESTS,
+    DEFAULT_API_MAX_SESSIONS,
+    DEFAULT_API_PORT,
+    DEFAULT_API_SESSION_QUEUE_SIZE,
+    DEFAULT_API_SESSION_TTL_SECONDS,
+)
+
+
+@dataclass(frozen=True)
+class ApiConfig:
+    """
+    Address and limits of the HTTP API.
+
+    Every queue is bounded: once a queue is full, new requests are turned
+    away at once (429 for a session or the job queue, 503 when the server is
+    saturated) rather than piling up.
+    """
+
+    host: str = DEFAULT_API_HOST
+    port: int = DEFAULT_API_PORT
+    max_concurrent_requests: int = DEFAULT_API_MAX_CONCURRENT_REQUESTS
+    max_queued_requests: int = DEFAULT_API_MAX_QUEUED_REQUESTS
+    session_queue_size: int = DEFAULT_API_SESSION_QUEUE_SIZE
+    max_sessions: int = DEFAULT_API_MAX_SESSIONS
+    session_ttl: float = DEFAULT_API_SESSION_TTL_SECONDS
+    job_workers: int = DEFAULT_API_JOB_WORKERS
+    max_queued_jobs: int = DEFAULT_API_MAX_QUEUED_JOBS
+    job_history: int = DEFAULT_API_JOB_HISTORY
+
+
+DEFAULT_API_CONFIG = ApiConfig()
+
+
+__all__ = ["DEFAULT_API_CONFIG", "ApiConfig"]
@@ -0,0 +1,114 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any
+
+from src.constants import API_MAX_BODY_BYTES
+
+
+class HttpError(Exception):
+    """Answered with `status` and a JSON body {"error": message}."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class HttpRequest:
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+
+    @property
+    def keep_alive(self) -> bool:
+        return self.headers.get("connection", "").lower() != "close"
+
+    def json(self) -> dict[str, Any]:
+        if not self.body:
+            return {}
+        try:
+            payload = json.loads(self.body)
+        except ValueError as e:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"invalid JSON body: {e}") from e
+        if not isinstance(payload, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "the JSON body must be an object")
+        return payload
+
+
+async def read_request(reader: asyncio.StreamReader) -> HttpRequest | None:
+    """
+    Read one HTTP/1.1 request with a Content-Length body (or none).
+
+    Returns None once the client closes the connection between requests.
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if not e.partial.strip():
+            return None
+        raise HttpError(HTTPStatus.BAD_REQUEST, "incomplete request") from e
+    except asyncio.LimitOverrunError as e:
+        raise HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "headers too large") from e
+
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = request_line.split(" ", 2)
+    except ValueError as e:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "malformed request line") from e
+    headers = {}
+    for line in header_lines:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        raise HttpError(HTTPStatus.LENGTH_REQUIRED, "chunked request bodies are not supported")
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError as e:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "invalid Content-Length") from e
+    if length < 0:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+    if length > API_MAX_BODY_BYTES:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return HttpRequest(method.upper(), target.split("?", 1)[0], headers, body)
+
+
+def json_response(status: HTTPStatus, payload: Any, keep_alive: bool = True) -> bytes:
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode() + body
+
+
+def sse_headers() -> bytes:
+    """Start a server-sent event stream; it ends when the connection closes."""
+    return (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: text/event-stream\r\n"
+        b"Cache-Control: no-cache\r\n"
+        b"Connection: close\r\n\r\n"
+    )
+
+
+def sse_event(event: str, payload: Any) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n".encode()
+
+
+__all__ = [
+    "HttpError",
+    "HttpRequest",
+    "json_response",
+    "read_request",
+    "sse_event",
+    "sse_headers",
+]
@@ -0,0 +1,129 @@
+import asyncio
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from http import HTTPStatus
+from typing import Any
+
+from src.LLM import RequestPriority, request_priority
+from src.utility.console import Console, redirect_console
+
+from .config import ApiConfig
+from .http import HttpError
+
+# Runs the job and returns its result, or None if it failed (the reason is in its output).
+JobRunner = Callable[[], Awaitable[dict[str, Any] | None]]
+
+
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    status: JobStatus = JobStatus.QUEUED
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    # Everything the command printed, as it would appear in the terminal.
+    output: list[str] = field(default_factory=list)
+    created: float = field(default_factory=time.time)
+    started: float | None = None
+    finished: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status.value,
+            "result": self.result,
+            "error": self.error,
+            "output": "".join(self.output),
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+        }
+
+
+async def _no_input(prompt: str) -> str:
+    raise EOFError("jobs cannot read input")
+
+
+class JobQueue:
+    """
+    Image and animation jobs, run in the background by a fixed number of
+    workers at BATCH priority so they never hold up interactive chat calls.
+    """
+
+    def __init__(self, config: ApiConfig):
+        self.config = config
+        self._queue: asyncio.Queue[tuple[Job, JobRunner]] = asyncio.Queue(config.max_queued_jobs)
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._workers: list[asyncio.Task[None]] = []
+        self._closed = False
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.config.job_workers)]
+
+    async def stop(self) -> None:
+        self._closed = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, kind: str, runner: JobRunner) -> Job:
+        job = Job(id=secrets.token_urlsafe(12), kind=kind)
+        try:
+            self._queue.put_nowait((job, runner))
+        except asyncio.QueueFull as e:
+            raise HttpError(HTTPStatus.TOO_MANY_REQUESTS, "the job queue is full") from e
+        self._jobs[job.id] = job
+        self._forget_finished()
+        return job
+
+    def get(self, job_id: str) -> Job:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"no job {job_id!r}")
+        return job
+
+    def _forget_finished(self) -> None:
+        finished = [
+            job.id
+            for job in self._jobs.values()
+            if job.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+        ]
+        for job_id in finished[: max(0, len(finished) - self.config.job_history)]:
+            del self._jobs[job_id]
+
+    async def _work(self) -> None:
+        # Checked as well as cancelling, since a command may catch CancelledError to clean up.
+        while not self._closed:
+            job, runner = await self._queue.get()
+            job.status = JobStatus.RUNNING
+            job.started = time.time()
+            try:
+                with redirect_console(Console(job.output.append, _no_input)):
+                    with request_priority(RequestPriority.BATCH):
+                        job.result = await runner()
+            except Exception as e:
+                job.error = str(e) or type(e).__name__
+            if job.result is None and job.error is None:
+                job.error = "the command failed; see its output"
+            job.status = JobStatus.FAILED if job.error else JobStatus.SUCCEEDED
+            job.finished = time.time()
+
+
+__all__ = ["Job", "JobQueue", "JobRunner", "JobStatus"]
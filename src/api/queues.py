@@ -0,0 +1,41 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+
+from .http import HttpError
+
+
+class BoundedQueue:
+    """
+    Let `limit` requests run at once and up to `max_waiting` more wait for a
+    turn, in arrival order. Requests beyond that fail at once with `status`.
+    """
+
+    def __init__(self, limit: int, max_waiting: int, status: HTTPStatus, message: str):
+        self.limit = limit
+        self.max_waiting = max_waiting
+        self.status = status
+        self.message = message
+        self.running = 0
+        self.waiting = 0
+        self._slots = asyncio.Semaphore(limit)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self._slots.locked() and self.waiting >= self.max_waiting:
+            raise HttpError(self.status, self.message)
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        try:
+            yield
+        finally:
+            self.running -= 1
+            self._slots.release()
+
+
+__all__ = ["BoundedQueue"]
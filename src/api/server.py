@@ -0,0 +1,311 @@
+import asyncio
+import contextlib
+import dataclasses
+import signal
+from http import HTTPStatus
+from typing import Any, TypeVar
+
+from src.commands.chat import handle_chat
+from src.commands.image import handle_image_gen
+from src.commands.minigames import handle_animation_generator
+from src.constants import API_MAX_ANIMATION_FRAMES, API_MAX_STEPS
+from src.LLM import DEFAULT_MODEL, AssistantMessage, BaseMessage, HumanMessage, LLMConfig
+from src.minigames.animation_generator import AnimationConfig
+from src.utility.console import Console, console_stdout, redirect_console
+
+from .config import DEFAULT_API_CONFIG, ApiConfig
+from .http import HttpError, HttpRequest, json_response, read_request, sse_event, sse_headers
+from .jobs import JobQueue
+from .queues import BoundedQueue
+from .sessions import Session, SessionStore
+
+T = TypeVar("T")
+
+
+def _required(body: dict[str, Any], name: str, kind: type[T]) -> T:
+    value = body.get(name)
+    if value is None:
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"missing field {name!r}")
+    # JSON true/false are bools, which Python also counts as ints.
+    if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"{name!r} must be of type {kind.__name__}")
+    return value
+
+
+def _optional(body: dict[str, Any], name: str, kind: type[T], default: T) -> T:
+    return default if body.get(name) is None else _required(body, name, kind)
+
+
+def _count(body: dict[str, Any], name: str, default: int, maximum: int) -> int:
+    value = _optional(body, name, int, default)
+    if not 1 <= value <= maximum:
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"{name!r} must be between 1 and {maximum}")
+    return value
+
+
+def _llm_config(body: dict[str, Any]) -> LLMConfig | None:
+    return LLMConfig(think=True) if _optional(body, "think", bool, False) else None
+
+
+def _discard(text: str) -> None:
+    pass
+
+
+async def _no_input(prompt: str) -> str:
+    raise EOFError("API requests cannot read input")
+
+
+class ApiServer:
+    """
+    HTTP/1.1 API over the CLI commands, on one asyncio event loop.
+
+    POST /ask                    {"question", "model"?, "think"?} -> {"answer"}
+    POST /sessions               {"model"?, "system"?} -> a new chat session
+    GET, DELETE /sessions/<id>
+    POST /sessions/<id>/chat     {"message", "think"?} -> server-sent events:
+                                 "delta" {"text"} as printed, then "done" {"content"}
+                                 or "error" {"error"}
+    POST /jobs/image             {"prompt", "model"?, "steps"?, "negative_prompt"?}
+    POST /jobs/animation         AnimationConfig fields, all optional and type-checked
+    GET /jobs/<id>               status, result and printed output of a job
+    GET /health
+
+    ask and chat share one bounded request queue; image and animation jobs
+    run in the background on their own bounded queue.
+    """
+
+    def __init__(self, config: ApiConfig = DEFAULT_API_CONFIG):
+        self.config = config
+        self.port = config.port
+        self.sessions = SessionStore(config)
+        self.jobs = JobQueue(config)
+        self.requests = BoundedQueue(
+            config.max_concurrent_requests,
+            config.max_queued_requests,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            "the server is busy, retry later",
+        )
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.Task[None]] = set()
+        self._stdout = contextlib.ExitStack()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.config.host}:{self.port}"
+
+    async def start(self) -> str:
+        # Commands print their progress; each request captures its own share.
+        self._stdout.enter_context(console_stdout())
+        self.jobs.start()
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.config.host, self.config.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for task in list(self._connections):
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        await self.jobs.stop()
+        self._stdout.close()
+
+    async def __aenter__(self) -> "ApiServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.stop()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections.add(task)
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await read_request(reader)
+                except HttpError as e:
+                    writer.write(json_response(e.status, {"error": e.message}, keep_alive=False))
+                    break
+                if request is None:
+                    break
+                keep_alive = await self._respond(request, writer)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+            if task is not None:
+                self._connections.discard(task)
+
+    async def _respond(self, request: HttpRequest, writer: asyncio.StreamWriter) -> bool:
+        """Answer one request; returns whether the connection stays open."""
+        parts = request.path.strip("/").split("/")
+        try:
+            if request.method == "POST" and len(parts) == 3 and parts[::2] == ["sessions", "chat"]:
+                await self._chat(parts[1], request, writer)
+                return False
+            status, payload = await self._route(request, parts)
+        except HttpError as e:
+            status, payload = e.status, {"error": e.message}
+        except Exception as e:
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}
+        writer.write(json_response(status, payload, request.keep_alive))
+        return request.keep_alive
+
+    async def _route(self, request: HttpRequest, parts: list[str]) -> tuple[HTTPStatus, Any]:
+        method = request.method
+        if parts == ["health"] and method == "GET":
+            return HTTPStatus.OK, self._health()
+        if parts == ["ask"] and method == "POST":
+            return HTTPStatus.OK, await self._ask(request.json())
+        if parts == ["sessions"] and method == "POST":
+            body = request.json()
+            session = self.sessions.create(
+                _optional(body, "model", str, DEFAULT_MODEL.value),
+                _optional(body, "system", str, ""),
+            )
+            return HTTPStatus.CREATED, session.to_dict()
+        if len(parts) == 2 and parts[0] == "sessions" and method == "GET":
+            return HTTPStatus.OK, self.sessions.get(parts[1]).to_dict()
+        if len(parts) == 2 and parts[0] == "sessions" and method == "DELETE":
+            self.sessions.delete(parts[1])
+            return HTTPStatus.OK, {"session_id": parts[1], "deleted": True}
+        if parts == ["jobs", "image"] and method == "POST":
+            return HTTPStatus.ACCEPTED, self._submit_image(request.json())
+        if parts == ["jobs", "animation"] and method == "POST":
+            return HTTPStatus.ACCEPTED, self._submit_animation(request.json())
+        if len(parts) == 2 and parts[0] == "jobs" and method == "GET":
+            return HTTPStatus.OK, self.jobs.get(parts[1]).to_dict()
+        raise HttpError(HTTPStatus.NOT_FOUND, f"no route for {method} {request.path}")
+
+    def _health(self) -> dict[str, Any]:
+        return {
+            "status": "ok",
+            "requests_running": self.requests.running,
+            "requests_waiting": self.requests.waiting,
+            "sessions": len(self.sessions),
+            "jobs_queued": self.jobs.queued,
+        }
+
+    async def _ask(self, body: dict[str, Any]) -> dict[str, Any]:
+        question = _required(body, "question", str)
+        model = _optional(body, "model", str, DEFAULT_MODEL.value)
+        llm_config = _llm_config(body)
+        async with self.requests.slot():
+            with redirect_console(Console(_discard, _no_input)):
+                messages: list[BaseMessage] = [HumanMessage(content=question)]
+                answer = await handle_chat(model, messages, False, llm_config)
+        return {"model": model, "answer": answer}
+
+    async def _chat(
+        self, session_id: str, request: HttpRequest, writer: asyncio.StreamWriter
+    ) -> None:
+        session = self.sessions.get(session_id)
+        body = request.json()
+        message = _required(body, "message", str)
+        llm_config = _llm_config(body)
+        # Errors up to here, including full queues, are answered with a JSON status.
+        async with session.queue.slot(), self.requests.slot():
+            writer.write(sse_headers())
+            session.messages.append(HumanMessage(content=message))
+            try:
+                content = await self._stream_turn(session, llm_config, writer)
+            except ConnectionError:
+                session.messages.pop()
+                raise
+            except Exception as e:
+                session.messages.pop()
+                writer.write(sse_event("error", {"error": str(e) or type(e).__name__}))
+                return
+            session.messages.append(AssistantMessage(content=content))
+            writer.write(sse_event("done", {"content": content}))
+
+    async def _stream_turn(
+        self, session: Session, llm_config: LLMConfig | None, writer: asyncio.StreamWriter
+    ) -> str:
+        """Run one chat turn, sending everything it prints as "delta" events."""
+        printed: asyncio.Queue[str | None] = asyncio.Queue()
+        with redirect_console(Console(printed.put_nowait, _no_input)):
+            turn = asyncio.create_task(
+                handle_chat(session.model, list(session.messages), True, llm_config)
+            )
+        turn.add_done_callback(lambda _: printed.put_nowait(None))
+        try:
+            while (text := await printed.get()) is not None:
+                if not text:
+                    continue
+                writer.write(sse_event("delta", {"text": text}))
+                await writer.drain()
+            return await turn
+        finally:
+            # Stop generating if the client went away mid-stream.
+            turn.cancel()
+
+    def _submit_image(self, body: dict[str, Any]) -> dict[str, Any]:
+        prompt = _required(body, "prompt", str)
+        # Fields left out keep handle_image_gen's defaults.
+        options: dict[str, Any] = {}
+        if body.get("model") is not None:
+            options["model_name"] = _required(body, "model", str)
+        if body.get("steps") is not None:
+            options["steps"] = _count(body, "steps", 1, API_MAX_STEPS)
+        if body.get("negative_prompt") is not None:
+            options["negative_prompt"] = _required(body, "negative_prompt", str)
+
+        async def run() -> dict[str, Any] | None:
+            response = await handle_image_gen(prompt, **options)
+            if response is None:
+                return None
+            return {"image_path": response.image_path, "metadata": response.metadata}
+
+        return self.jobs.submit("image", run).to_dict()
+
+    def _submit_animation(self, body: dict[str, Any]) -> dict[str, Any]:
+        unknown = body.keys() - {field.name for field in dataclasses.fields(AnimationConfig)}
+        if unknown:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"unknown fields: {', '.join(sorted(unknown))}")
+        default = AnimationConfig()
+        negative_prompt = default.negative_prompt
+        if body.get("negative_prompt") is not None:
+            negative_prompt = _required(body, "negative_prompt", str)
+        config = AnimationConfig(
+            frame_count=_count(body, "frame_count", default.frame_count, API_MAX_ANIMATION_FRAMES),
+            main_prompt=_optional(body, "main_prompt", str, default.main_prompt),
+            negative_prompt=negative_prompt,
+            steps=_count(body, "steps", default.steps, API_MAX_STEPS),
+            image_model=_optional(body, "image_model", str, default.image_model),
+            planner_model=_optional(body, "planner_model", str, default.planner_model),
+            use_continuity_refiner=_optional(
+                body, "use_continuity_refiner", bool, default.use_continuity_refiner
+            ),
+            pipeline_planning=_optional(body, "pipeline_planning", bool, default.pipeline_planning),
+            continuity_model=_optional(body, "continuity_model", str, default.continuity_model),
+        )
+
+        async def run() -> dict[str, Any] | None:
+            output_dir = await handle_animation_generator(config)
+            return None if output_dir is None else {"output_dir": output_dir}
+
+        return self.jobs.submit("animation", run).to_dict()
+
+
+async def serve_api(config: ApiConfig = DEFAULT_API_CONFIG) -> None:
+    """Run an ApiServer until interrupted (Ctrl+C or SIGTERM)."""
+    stop = asyncio.Event()
+    with contextlib.suppress(NotImplementedError):
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    async with ApiServer(config) as server:
+        print(f"API listening on {server.base_url} (Ctrl+C to stop)", flush=True)
+        await stop.wait()
+
+
+__all__ = ["ApiServer", "serve_api"]
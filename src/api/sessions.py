@@ -0,0 +1,99 @@
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http import HTTPStatus
+
+from src.LLM import BaseMessage, SystemMessage
+
+from .config import ApiConfig
+from .http import HttpError
+from .queues import BoundedQueue
+
+
+@dataclass
+class Session:
+    """One chat conversation. Its turns run one at a time, in order."""
+
+    id: str
+    model: str
+    queue: BoundedQueue
+    messages: list[BaseMessage] = field(default_factory=list)
+    last_used: float = field(default_factory=time.monotonic)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "session_id": self.id,
+            "model": self.model,
+            "messages": [
+                {"role": message.role, "content": message.content} for message in self.messages
+            ],
+        }
+
+
+class SessionStore:
+    """
+    Chat sessions by id. Each holds its own history and turn queue, so
+    sessions never see or wait on each other. Sessions idle for longer than
+    the TTL are dropped, and the least recently used idle one makes room once
+    `max_sessions` is reached.
+    """
+
+    def __init__(self, config: ApiConfig):
+        self.config = config
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self, model: str, system_prompt: str | None = None) -> Session:
+        self._expire()
+        while len(self._sessions) >= self.config.max_sessions:
+            self._evict()
+        session = Session(
+            id=secrets.token_urlsafe(12),
+            model=model,
+            queue=BoundedQueue(
+                1,
+                self.config.session_queue_size,
+                HTTPStatus.TOO_MANY_REQUESTS,
+                "too many chat turns queued in this session",
+            ),
+        )
+        if system_prompt:
+            session.messages.append(SystemMessage(content=system_prompt))
+        self._sessions[session.id] = session
+        return session
+
+    def get(self, session_id: str) -> Session:
+        self._expire()
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"no session {session_id!r}")
+        session.last_used = time.monotonic()
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def delete(self, session_id: str) -> None:
+        if self._sessions.pop(session_id, None) is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"no session {session_id!r}")
+
+    def _evict(self) -> None:
+        """Drop the least recently used session that has no turn in progress."""
+        for session_id, session in self._sessions.items():
+            if not session.queue.running:
+                del self._sessions[session_id]
+                return
+        raise HttpError(HTTPStatus.SERVICE_UNAVAILABLE, "every chat session is busy")
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.config.session_ttl
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            # A session with a turn in progress is never dropped from under it.
+            if session.last_used >= cutoff or session.queue.running:
+                break
+            self._sessions.popitem(last=False)
+
+
+__all__ = ["Session", "SessionStore"]
@@ -0,0 +1,44 @@
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .chat import ask, handle_chat
+    from .dispatch import run_command
+    from .image import handle_image_gen
+    from .interactive import chat_cli
+    from .minigames import handle_animation_generator, handle_company_logo
+
+
+# Lazy imports so a subcommand only loads the subsystems it uses
+def __getattr__(name: str) -> Any:
+    if name in ("ask", "handle_chat"):
+        from . import chat
+
+        return getattr(chat, name)
+    elif name == "run_command":
+        from .dispatch import run_command
+
+        return run_command
+    elif name == "chat_cli":
+        from .interactive import chat_cli
+
+        return chat_cli
+    elif name == "handle_image_gen":
+        from .image import handle_image_gen
+
+        return handle_image_gen
+    elif name in ("handle_animation_generator", "handle_company_logo"):
+        from . import minigames
+
+        return getattr(minigames, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "ask",
+    "chat_cli",
+    "handle_animation_generator",
+    "handle_chat",
+    "handle_company_logo",
+    "handle_image_gen",
+    "run_command",
+]
@@ -0,0 +1,64 @@
+from src.LLM import (
+    DEFAULT_MODEL,
+    AssistantMessage,
+    AssistantMessageDelta,
+    BaseMessage,
+    HumanMessage,
+    LLMConfig,
+    build_ollama_provider,
+    chat_non_stream_no_tool,
+    chat_stream,
+    get_model,
+    with_semantic_cache,
+)
+
+
+async def handle_chat(
+    model_name: str,
+    messages: list[BaseMessage],
+    stream: bool = False,
+    llm_config: LLMConfig | None = None,
+) -> str:
+    model = get_model(model_name)
+    provider = with_semantic_cache(build_ollama_provider(model))
+    accumulated_content = ""
+
+    if stream:
+        in_thinking = False
+        async for response in chat_stream(
+            provider=provider, messages=messages, llm_config=llm_config
+        ):
+            if not isinstance(response, AssistantMessageDelta):
+                if isinstance(response, AssistantMessage):
+                    accumulated_content = response.content
+                continue
+            if response.thinking:
+                if not in_thinking:
+                    in_thinking = True
+                    print("\n[Thinking...]\n", end="", flush=True)
+                print(response.thinking, end="", flush=True)
+            if response.content:
+                if in_thinking:
+                    print("\n\n[Response]\n", end="", flush=True)
+                    in_thinking = False
+                print(response.content, end="", flush=True)
+            if response.done:
+                print("\n")
+    else:
+        response = await chat_non_stream_no_tool(
+            provider=provider, messages=messages, llm_config=llm_config
+        )
+        print(response.content)
+        accumulated_content = response.content
+
+    return accumulated_content
+
+
+async def ask(
+    question: str,
+    model_name: str = DEFAULT_MODEL.value,
+    stream: bool = False,
+    llm_config: LLMConfig | None = None,
+) -> None:
+    messages: list[BaseMessage] = [HumanMessage(content=question)]
+    await handle_chat(model_name, messages, stream, llm_config)
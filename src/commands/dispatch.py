@@ -0,0 +1,53 @@
+from typing import TYPE_CHECKING, Any
+
+from src.constants import ANIMATION_COMMAND, COMPANY_LOGO_COMMAND
+
+if TYPE_CHECKING:
+    from src.LLM import LLMConfig
+
+
+def _llm_config(args: dict[str, Any]) -> "LLMConfig | None":
+    from src.LLM import LLMConfig
+
+    return LLMConfig(think=args["think"]) if args["think"] else None
+
+
+async def run_command(command: str, args: dict[str, Any]) -> None:
+    """
+    Run a main.py subcommand with its parsed arguments (argparse dest -> value).
+
+    Each branch imports only its own subsystem, so startup stays fast. The
+    daemon calls this too, so both run a command the same way.
+    """
+    if command == "ask":
+        from .chat import ask
+
+        await ask(args["question"], args["model"], args["stream"], _llm_config(args))
+    elif command == "chat":
+        from src.LLM import CompactionConfig
+
+        from .interactive import chat_cli
+
+        compaction = CompactionConfig() if args["compact"] else None
+        await chat_cli(args["model"], args["system"], args["stream"], _llm_config(args), compaction)
+    elif command == "img":
+        from .image import handle_image_gen
+
+        await handle_image_gen(
+            args["prompt"], args["model"], args["steps"], args["negative_prompt"]
+        )
+    elif command in {ANIMATION_COMMAND, "anim"}:
+        from .minigames import handle_animation_generator
+
+        await handle_animation_generator()
+    elif command == COMPANY_LOGO_COMMAND:
+        from .minigames import handle_company_logo
+
+        await handle_company_logo(
+            args["chat_model"], args["prompt_model"], args["image_model"], args["hedge_model"]
+        )
+    else:
+        print(f"Unknown command: {command}")
+
+
+__all__ = ["run_command"]
@@ -0,0 +1,39 @@
+import time
+
+from src.ImageGen import DEFAULT_IMAGE_MODEL, ImageRequest, ImageResponse, generate_image
+from src.ImageGen.models import get_model as get_image_model
+
+
+async def handle_image_gen(
+    prompt: str,
+    model_name: str = DEFAULT_IMAGE_MODEL.value,
+    steps: int = 4,
+    negative_prompt: str | None = None,
+) -> ImageResponse | None:
+    """Generate one image and report progress; returns None if generation failed."""
+    print(f"Generating image with model: {model_name}")
+    print(f"Prompt: {prompt}")
+    if negative_prompt:
+        print(f"Negative prompt: {negative_prompt}")
+
+    model = get_image_model(model_name)
+
+    request = ImageRequest(
+        prompt=prompt,
+        negative_prompt=negative_prompt,
+        num_inference_steps=steps,
+    )
+
+    try:
+        start_time = time.time()
+        print("Starting generation... (this may take a while)")
+        response = await generate_image(model, request)
+        duration = time.time() - start_time
+
+        print(f"\nSuccess! ({duration:.1f}s)")
+        print(f"Image saved to: {response.image_path}")
+        return response
+
+    except Exception as e:
+        print(f"\nError generating image: {e}")
+        return None
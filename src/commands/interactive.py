@@ -0,0 +1,68 @@
+import time
+
+from src.LLM import (
+    DEFAULT_MODEL,
+    AssistantMessage,
+    BaseMessage,
+    CompactionConfig,
+    ContextWindowManager,
+    ConversationCompactor,
+    HumanMessage,
+    LLMConfig,
+    SystemMessage,
+)
+from src.utility.async_input import async_input
+
+from .chat import handle_chat
+
+
+async def chat_cli(
+    model_name: str = DEFAULT_MODEL.value,
+    system_prompt: str | None = None,
+    stream: bool = False,
+    llm_config: LLMConfig | None = None,
+    compaction: CompactionConfig | None = None,
+) -> None:
+    conversation: list[BaseMessage] = []
+    context_window = ContextWindowManager()
+    compactor = ConversationCompactor(compaction) if compaction else None
+
+    if system_prompt:
+        conversation.append(SystemMessage(content=system_prompt))
+
+    print("Chat started. Type 'exit', 'quit', or 'e' to end the session.\n")
+
+    try:
+        while True:
+            user_input = (await async_input("You: ")).strip()
+
+            if user_input.lower() in ("exit", "quit", "e", "q"):
+                print("Ending chat. Goodbye!")
+                break
+
+            if not user_input:
+                continue
+
+            conversation.append(HumanMessage(content=user_input))
+            if compactor:
+                conversation[:] = compactor.apply(conversation)
+
+            try:
+                conversation[:] = context_window.fit(conversation, model_name)
+                start = time.perf_counter()
+                response_content = await handle_chat(model_name, conversation, stream, llm_config)
+                if compactor:
+                    compactor.record_request(conversation, time.perf_counter() - start)
+                conversation.append(AssistantMessage(content=response_content))
+            except Exception as e:
+                print(f"Error: {e}\n")
+                conversation.pop()
+                continue
+
+            if compactor:
+                # Summarize older turns while the user types the next message.
+                compactor.maybe_start(conversation)
+    finally:
+        if compactor:
+            await compactor.aclose()
+            print(compactor.stats.format_report())
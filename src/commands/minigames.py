@@ -0,0 +1,25 @@
+from src.minigames.animation_generator import (
+    AnimationConfig,
+    generate_animation,
+    run_animation_generator,
+)
+from src.minigames.company_logo import run_logo_minigame
+
+
+async def handle_company_logo(
+    chat_model: str,
+    prompt_model: str,
+    image_model: str,
+    hedge_model: str | None = None,
+) -> None:
+    await run_logo_minigame(chat_model, prompt_model, image_model, hedge_model)
+
+
+async def handle_animation_generator(config: AnimationConfig | None = None) -> str | None:
+    """
+    Run the animation generator, asking for its settings unless `config` is
+    given. Returns the output directory, or None if the run failed.
+    """
+    if config is None:
+        return await run_animation_generator()
+    return await generate_animation(config)
@@ -1,2 +1,33 @@
 ANIMATION_COMMAND = "animation"
 COMPANY_LOGO_COMMAND = "comp"
+SERVE_COMMAND = "serve"
+
+# Unix socket of the `serve` daemon; defaults to DAEMON_SOCKET_NAME in the temp directory.
+DAEMON_SOCKET_ENV = "AI_FUN_DAEMON_SOCKET"
+DAEMON_SOCKET_NAME = "ai-fun-{user}.sock"
+# Commands that run on the daemon when one is listening.
+DAEMON_COMMANDS = ("ask", "chat", "img")
+# Settings a forwarded command must share with the daemon, which cannot change them per request:
+# every AI_FUN_* variable (except the socket itself), these variables and the working directory.
+DAEMON_ENV_PREFIX = "AI_FUN_"
+DAEMON_ENV_VARS = ("OLLAMA_HOST",)
+
+API_COMMAND = "api"
+DEFAULT_API_HOST = "127.0.0.1"
+DEFAULT_API_PORT = 8765
+# ask and chat requests served at once; more wait in line up to the queue size, then get a 503.
+DEFAULT_API_MAX_CONCURRENT_REQUESTS = 8
+DEFAULT_API_MAX_QUEUED_REQUESTS = 64
+# Chat turns waiting behind the running one in a session before new ones get a 429.
+DEFAULT_API_SESSION_QUEUE_SIZE = 4
+DEFAULT_API_MAX_SESSIONS = 256
+DEFAULT_API_SESSION_TTL_SECONDS = 30 * 60
+# Image and animation jobs run one at a time by default; they compete for the same GPU.
+DEFAULT_API_JOB_WORKERS = 1
+DEFAULT_API_MAX_QUEUED_JOBS = 16
+# Finished jobs kept for GET /jobs/<id>.
+DEFAULT_API_JOB_HISTORY = 256
+API_MAX_BODY_BYTES = 1024 * 1024
+# Upper bounds on job sizes, so one request cannot hold the GPU indefinitely.
+API_MAX_ANIMATION_FRAMES = 120
+API_MAX_STEPS = 100
@@ -0,0 +1,14 @@
+from .client import daemon_running, forward_command
+from .protocol import daemon_socket_path
+
+
+# Lazy import: clients only need the standard library, the server loads every command
+def __getattr__(name):
+    if name == "serve":
+        from .server import serve
+
+        return serve
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["daemon_running", "daemon_socket_path", "forward_command", "serve"]
@@ -0,0 +1,74 @@
+import socket
+import sys
+from typing import Any
+
+from .protocol import FrameType, daemon_socket_path, decode_frame, encode_frame, process_settings
+
+
+def _connect(path: str) -> socket.socket | None:
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        # No socket file, or a stale one left by a daemon that died.
+        sock.close()
+        return None
+    return sock
+
+
+def daemon_running(path: str | None = None) -> bool:
+    sock = _connect(path or daemon_socket_path())
+    if sock is None:
+        return False
+    sock.close()
+    return True
+
+
+def forward_command(command: str, args: dict[str, Any], path: str | None = None) -> bool:
+    """
+    Run a subcommand on the daemon, printing its output as it arrives and
+    answering its prompts from stdin.
+
+    This only needs the standard library, so a forwarded command skips the
+    ollama and pydantic imports as well as the client and cache setup.
+
+    Returns:
+        False if no daemon is listening or it declined the command because it
+        runs with a different working directory or environment (nothing was
+        run), True otherwise.
+    """
+    sock = _connect(path or daemon_socket_path())
+    if sock is None:
+        return False
+    with sock, sock.makefile("rb") as frames:
+        request = encode_frame(
+            FrameType.REQUEST, command=command, args=args, settings=process_settings()
+        )
+        sock.sendall(request)
+        for line in frames:
+            frame_type, fields = decode_frame(line)
+            if frame_type is FrameType.OUTPUT:
+                sys.stdout.write(fields["text"])
+                sys.stdout.flush()
+            elif frame_type is FrameType.INPUT:
+                try:
+                    text = input(fields["prompt"])
+                except EOFError:
+                    # Closing the socket ends the session on the daemon.
+                    return True
+                sock.sendall(encode_frame(FrameType.LINE, text=text))
+            elif frame_type is FrameType.ERROR:
+                print(f"Daemon error: {fields['message']}", file=sys.stderr)
+                return True
+            elif frame_type is FrameType.DONE:
+                return True
+            elif frame_type is FrameType.DECLINED:
+                print(f"{fields['message']}; running locally.", file=sys.stderr)
+                return False
+    print("The daemon closed the connection.", file=sys.stderr)
+    return True
+
+
+__all__ = ["daemon_running", "forward_command"]
@@ -0,0 +1,71 @@
+import getpass
+import json
+import os
+import tempfile
+from enum import Enum
+from typing import Any
+
+from src.constants import DAEMON_ENV_PREFIX, DAEMON_ENV_VARS, DAEMON_SOCKET_ENV, DAEMON_SOCKET_NAME
+
+
+class FrameType(Enum):
+    """
+    Messages on the daemon socket, one JSON object per line.
+
+    The client sends REQUEST (command, args, settings). The daemon replies
+    with OUTPUT (text) and INPUT (prompt) frames, each INPUT answered by a
+    LINE (text), and ends with DONE or ERROR (message). It answers DECLINED
+    (message) without running anything if the client's settings differ from
+    its own, and the client then runs the command itself.
+    """
+
+    REQUEST = "request"
+    OUTPUT = "output"
+    INPUT = "input"
+    LINE = "line"
+    DONE = "done"
+    ERROR = "error"
+    DECLINED = "declined"
+
+
+def daemon_socket_path() -> str:
+    """AI_FUN_DAEMON_SOCKET, or a per-user socket in the temp directory."""
+    default = os.path.join(tempfile.gettempdir(), DAEMON_SOCKET_NAME.format(user=getpass.getuser()))
+    return os.getenv(DAEMON_SOCKET_ENV) or default
+
+
+def process_settings() -> dict[str, str | None]:
+    """The working directory and environment variables that change what a command does."""
+    names = {name for name in os.environ if name.startswith(DAEMON_ENV_PREFIX)}
+    names.update(DAEMON_ENV_VARS)
+    names.discard(DAEMON_SOCKET_ENV)
+    settings = {name: os.environ.get(name) for name in sorted(names)}
+    settings["working directory"] = os.getcwd()
+    return settings
+
+
+def settings_mismatch(client: dict[str, str | None]) -> list[str]:
+    """Names of the settings in which `client` differs from this process."""
+    local = process_settings()
+    return sorted(
+        name for name in local.keys() | client.keys() if local.get(name) != client.get(name)
+    )
+
+
+def encode_frame(frame_type: FrameType, **fields: Any) -> bytes:
+    return (json.dumps({"type": frame_type.value, **fields}) + "\n").encode()
+
+
+def decode_frame(line: bytes) -> tuple[FrameType, dict[str, Any]]:
+    fields = json.loads(line)
+    return FrameType(fields.pop("type")), fields
+
+
+__all__ = [
+    "FrameType",
+    "daemon_socket_path",
+    "decode_frame",
+    "encode_frame",
+    "process_settings",
+    "settings_mismatch",
+]
@@ -0,0 +1,112 @@
+import asyncio
+import contextlib
+import importlib
+import os
+import signal
+
+from src.commands.dispatch import run_command
+from src.constants import DAEMON_COMMANDS
+from src.LLM.telemetry import export_telemetry_from_env
+from src.utility.console import Console, console_stdout, redirect_console
+
+from .client import daemon_running
+from .protocol import (
+    FrameType,
+    daemon_socket_path,
+    decode_frame,
+    encode_frame,
+    settings_mismatch,
+)
+
+
+def _remote_console(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Console:
+    def write(text: str) -> None:
+        if writer.is_closing():
+            # Stop the command once nobody is reading its output.
+            raise ConnectionResetError("the client disconnected")
+        writer.write(encode_frame(FrameType.OUTPUT, text=text))
+
+    async def readline(prompt: str) -> str:
+        writer.write(encode_frame(FrameType.INPUT, prompt=prompt))
+        line = await reader.readline()
+        if not line:
+            raise EOFError
+        _, fields = decode_frame(line)
+        return str(fields["text"])
+
+    return Console(write, readline)
+
+
+async def _handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        _, request = decode_frame(await reader.readline())
+        command = request["command"]
+        if command not in DAEMON_COMMANDS:
+            raise ValueError(f"'{command}' cannot run on the daemon")
+        # Requests share this process, so settings cannot be swapped in per request.
+        mismatch = settings_mismatch(request.get("settings") or {})
+        if mismatch:
+            message = f"The daemon runs with a different {', '.join(mismatch)}"
+            writer.write(encode_frame(FrameType.DECLINED, message=message))
+            await writer.drain()
+            return
+        with redirect_console(_remote_console(reader, writer)):
+            await run_command(command, request["args"])
+        writer.write(encode_frame(FrameType.DONE))
+        await writer.drain()
+    except (ConnectionError, EOFError):
+        pass
+    except Exception as e:
+        if not writer.is_closing():
+            writer.write(encode_frame(FrameType.ERROR, message=str(e) or type(e).__name__))
+    finally:
+        export_telemetry_from_env()
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def serve(path: str | None = None) -> None:
+    """
+    Run main.py subcommands for other processes until interrupted.
+
+    The daemon listens on a Unix socket and runs each request in its own task,
+    with print() output and prompts sent back over that connection. Imports,
+    pooled clients, schedulers and the response, embedding and semantic
+    caches stay warm between requests instead of being rebuilt per process.
+
+    Args:
+        path: Socket to listen on; defaults to daemon_socket_path().
+    """
+    path = path or daemon_socket_path()
+    if daemon_running(path):
+        print(f"A daemon is already listening on {path}")
+        return
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+
+    # Load every command up front so the first request is as fast as the rest.
+    for module in ("chat", "interactive", "image"):
+        importlib.import_module(f"src.commands.{module}")
+
+    # Only the current user may connect.
+    umask = os.umask(0o077)
+    try:
+        server = await asyncio.start_unix_server(_handle_connection, path=path)
+    finally:
+        os.umask(umask)
+
+    stop = asyncio.Event()
+    with contextlib.suppress(NotImplementedError):
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    print(f"Daemon listening on {path} (Ctrl+C to stop)")
+    try:
+        with console_stdout():
+            async with server:
+                await stop.wait()
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
+
+__all__ = ["serve"]
@@ -1,4 +1,14 @@
-from .animation_generator import run_animation_generator
-from .company_logo import run_logo_minigame
+# Lazy imports so importing a minigame's constants does not load every minigame
+def __getattr__(name):
+    if name == "run_animation_generator":
+        from .animation_generator import run_animation_generator
+
+        return run_animation_generator
+    elif name == "run_logo_minigame":
+        from .company_logo import run_logo_minigame
+
+        return run_logo_minigame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["run_animation_generator", "run_logo_minigame"]
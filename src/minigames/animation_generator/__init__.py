@@ -1,3 +1,18 @@
-from .main import run_animation_generator
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["run_animation_generator"]
+from .config import AnimationConfig
+
+if TYPE_CHECKING:
+    from .main import generate_animation, run_animation_generator
+
+
+# Lazy import so the CLI can read this package's constants without loading the game
+def __getattr__(name: str) -> Any:
+    if name in ("generate_animation", "run_animation_generator"):
+        from . import main
+
+        return getattr(main, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["AnimationConfig", "generate_animation", "run_animation_generator"]
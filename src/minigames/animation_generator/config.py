@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+from .constants import (
+    DEFAULT_CONTINUITY_VISION_MODEL,
+    DEFAULT_FRAME_COUNT,
+    DEFAULT_IMAGE_MODEL,
+    DEFAULT_MAIN_PROMPT,
+    DEFAULT_NEGATIVE_PROMPT,
+    DEFAULT_PIPELINE_PLANNING,
+    DEFAULT_PLANNER_MODEL,
+    DEFAULT_STEPS,
+    DEFAULT_USE_CONTINUITY_REFINER,
+)
+
+
+@dataclass
+class AnimationConfig:
+    """Everything the generator asks for interactively, so a run can also be configured in code."""
+
+    frame_count: int = DEFAULT_FRAME_COUNT
+    main_prompt: str = DEFAULT_MAIN_PROMPT
+    negative_prompt: str | None = DEFAULT_NEGATIVE_PROMPT
+    steps: int = DEFAULT_STEPS
+    image_model: str = DEFAULT_IMAGE_MODEL
+    planner_model: str = DEFAULT_PLANNER_MODEL
+    use_continuity_refiner: bool = DEFAULT_USE_CONTINUITY_REFINER
+    # Start generating frames while the planner is still writing the plan.
+    pipeline_planning: bool = DEFAULT_PIPELINE_PLANNING
+    continuity_model: str = DEFAULT_CONTINUITY_VISION_MODEL
+
+
+__all__ = ["AnimationConfig"]
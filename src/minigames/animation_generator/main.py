@@ -9,9 +9,11 @@ from pathlib import Path
 from src.ImageGen import generate_image
 from src.ImageGen.models import get_model as get_image_model
 from src.ImageGen.types import ImageRequest
+from src.LLM import AUTO_MODEL, OllamaModels
 from src.LLM import get_model as get_llm_model
 from src.utility.path import get_project_root
 
+from .config import AnimationConfig
 from .constants import (
     ANIMATION_RESULTS_DIR,
     DEFAULT_CONTINUITY_VISION_MODEL,
@@ -19,20 +21,30 @@ from .constants import (
     DEFAULT_IMAGE_MODEL,
     DEFAULT_MAIN_PROMPT,
     DEFAULT_NEGATIVE_PROMPT,
+    DEFAULT_PIPELINE_PLANNING,
     DEFAULT_PLANNER_MODEL,
     DEFAULT_STEPS,
     DEFAULT_USE_CONTINUITY_REFINER,
     FRAME_FILENAME_TEMPLATE,
     PLAN_FILENAME,
 )
+from .plan_stream import StreamingPlan
 from .prompt_builder import (
     AnimationFramePlan,
     AnimationPlanResponse,
     build_animation_plan,
     refine_frame_prompt_from_previous_frame,
+    stream_animation_plan,
 )
 
 
+def _resolve_llm_model(model_name: str) -> OllamaModels | None:
+    """None for "auto", which lets the model router pick per call."""
+    if model_name.strip().lower() == AUTO_MODEL:
+        return None
+    return get_llm_model(model_name)
+
+
 def _prompt_text(question: str, default: str) -> str:
     response = input(f"{question} [{default}]: ").strip()
     return response or default
@@ -181,14 +193,7 @@ def _save_plan_manifest(
     plan_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
 
-async def run_animation_generator(
-    planner_model: str = DEFAULT_PLANNER_MODEL,
-) -> str | None:
-    print("=" * 50)
-    print("  ANIMATION FRAME GENERATOR")
-    print("=" * 50)
-    print("\nPress Enter to accept the default for any prompt.\n")
-
+def _prompt_config(planner_model: str) -> AnimationConfig:
     frame_count = _prompt_int("How many frames do you want?", DEFAULT_FRAME_COUNT)
     main_prompt = _prompt_text("What is the main prompt for the object?", DEFAULT_MAIN_PROMPT)
     negative_prompt = _prompt_optional_text(
@@ -204,16 +209,60 @@ async def run_animation_generator(
         "Use the continuity override checker between frames?",
         DEFAULT_USE_CONTINUITY_REFINER,
     )
-    continuity_model_name: str | None = None
+    pipeline_planning = _prompt_bool(
+        "Start generating frames while the planner is still writing the plan?",
+        DEFAULT_PIPELINE_PLANNING,
+    )
+    continuity_model_name = DEFAULT_CONTINUITY_VISION_MODEL
     if use_continuity_refiner:
         continuity_model_name = _prompt_text(
             "Which continuity model should be used?",
             DEFAULT_CONTINUITY_VISION_MODEL,
         )
+    return AnimationConfig(
+        frame_count=frame_count,
+        main_prompt=main_prompt,
+        negative_prompt=negative_prompt,
+        steps=steps,
+        image_model=image_model_name,
+        planner_model=planner_model_name,
+        use_continuity_refiner=use_continuity_refiner,
+        pipeline_planning=pipeline_planning,
+        continuity_model=continuity_model_name,
+    )
+
+
+async def run_animation_generator(
+    planner_model: str = DEFAULT_PLANNER_MODEL,
+) -> str | None:
+    print("=" * 50)
+    print("  ANIMATION FRAME GENERATOR")
+    print("=" * 50)
+    print("\nPress Enter to accept the default for any prompt.\n")
+
+    return await generate_animation(_prompt_config(planner_model))
+
+
+async def generate_animation(config: AnimationConfig) -> str | None:
+    """
+    Plan and render the frames of one animation without asking anything.
+
+    Returns:
+        The run's output directory, or None if planning failed or the run was cancelled.
+    """
+    frame_count = config.frame_count
+    main_prompt = config.main_prompt
+    negative_prompt = config.negative_prompt
+    steps = config.steps
+    image_model_name = config.image_model
+    planner_model_name = config.planner_model
+    use_continuity_refiner = config.use_continuity_refiner
+    pipeline_planning = config.pipeline_planning
+    continuity_model_name = config.continuity_model if use_continuity_refiner else None
 
-    llm_model = get_llm_model(planner_model_name)
+    llm_model = _resolve_llm_model(planner_model_name)
     continuity_model = (
-        get_llm_model(continuity_model_name or DEFAULT_CONTINUITY_VISION_MODEL)
+        _resolve_llm_model(continuity_model_name or DEFAULT_CONTINUITY_VISION_MODEL)
         if use_continuity_refiner
         else None
     )
@@ -234,29 +283,48 @@ async def run_animation_generator(
     print("Seed strategy: locked seed across all frames for continuity")
     print("Planner enabled: Yes")
     print(f"Planner model: {planner_model_name}")
+    print(f"Pipelined planning: {'Yes' if pipeline_planning else 'No'}")
     print(f"Continuity override checker enabled: {'Yes' if use_continuity_refiner else 'No'}")
     print(f"Continuity model: {continuity_model_name or 'Disabled'}")
     print(f"Output directory: {output_dir}")
 
+    planner_task: asyncio.Task[None] | None = None
     try:
         print("\n[1/2] Planning frames with LLM...")
         try:
-            plan = await build_animation_plan(
-                main_prompt=main_prompt,
-                negative_prompt=negative_prompt,
-                frame_count=frame_count,
-                model=llm_model,
-            )
+            if pipeline_planning:
+                streaming_plan = StreamingPlan(frame_count)
+                planner_task = asyncio.create_task(
+                    streaming_plan.consume(
+                        stream_animation_plan(
+                            main_prompt=main_prompt,
+                            negative_prompt=negative_prompt,
+                            frame_count=frame_count,
+                            model=llm_model,
+                        )
+                    )
+                )
+                await streaming_plan.wait_for_combined_prompt()
+            else:
+                plan = await build_animation_plan(
+                    main_prompt=main_prompt,
+                    negative_prompt=negative_prompt,
+                    frame_count=frame_count,
+                    model=llm_model,
+                )
+                streaming_plan = StreamingPlan.completed(plan)
         except Exception as exc:
             print(f"\n[ERROR] Planner failed: {exc}")
             print("Stopping because the frame plan is required for this workflow.")
             return None
 
-        print("\nPlanned frame beats:")
-        for frame in plan.frames:
-            print(f"- Frame {frame.frame_number}: {frame.motion_beat}")
-
-        print("\n[2/2] Generating frames...")
+        if pipeline_planning:
+            print("\n[2/2] Generating frames as the planner writes them...")
+        else:
+            print("\nPlanned frame beats:")
+            for frame in streaming_plan.frames:
+                print(f"- Frame {frame.frame_number}: {frame.motion_beat}")
+            print("\n[2/2] Generating frames...")
 
         generated_frames: list[dict[str, object]] = []
         used_combined_prompts: dict[int, str] = {}
@@ -266,7 +334,7 @@ async def run_animation_generator(
         continuity_decisions: dict[int, dict[str, object]] = {}
         _save_plan_manifest(
             plan_path=plan_path,
-            plan=plan,
+            plan=streaming_plan.snapshot(),
             main_prompt=main_prompt,
             negative_prompt=negative_prompt,
             steps=steps,
@@ -285,13 +353,15 @@ async def run_animation_generator(
 
         previous_frame_path: Path | None = None
         anchor_frame_path: Path | None = None
-        active_combined_prompt = plan.combined_prompt
-        for frame in plan.frames:
+        active_combined_prompt = await streaming_plan.wait_for_combined_prompt()
+        planned_frames: list[AnimationFramePlan] = []
+        async for frame in streaming_plan.frames_as_ready():
+            planned_frames.append(frame)
             print(f"\nFrame {frame.frame_number}/{frame_count}: {frame.motion_beat}")
             print(frame.frame_prompt)
 
             continuity_decision: dict[str, object] | None = None
-            if use_continuity_refiner and previous_frame_path is not None and continuity_model is not None:
+            if use_continuity_refiner and previous_frame_path is not None:
                 try:
                     anchor_reference_path = (
                         str(anchor_frame_path)
@@ -371,7 +441,7 @@ async def run_animation_generator(
             )
             _save_plan_manifest(
                 plan_path=plan_path,
-                plan=plan,
+                plan=streaming_plan.snapshot(),
                 main_prompt=main_prompt,
                 negative_prompt=negative_prompt,
                 steps=steps,
@@ -388,6 +458,40 @@ async def run_animation_generator(
                 continuity_decisions=continuity_decisions,
             )
             print(f"Saved {final_path.name} ({duration:.1f}s)")
+
+        if planner_task is not None:
+            await planner_task
+            _save_plan_manifest(
+                plan_path=plan_path,
+                plan=streaming_plan.snapshot(),
+                main_prompt=main_prompt,
+                negative_prompt=negative_prompt,
+                steps=steps,
+                image_model=image_model.to_ollama_name(),
+                base_seed=base_seed,
+                planner_model=planner_model_name,
+                continuity_refiner_enabled=use_continuity_refiner,
+                continuity_refiner_model=continuity_model_name,
+                generated_frames=generated_frames,
+                used_combined_prompts=used_combined_prompts,
+                used_frame_prompts=used_frame_prompts,
+                used_generation_prompts=used_generation_prompts,
+                used_frame_seeds=used_frame_seeds,
+                continuity_decisions=continuity_decisions,
+            )
+            if streaming_plan.error is not None:
+                # The frames stop wherever the planner did, so the run is incomplete.
+                print(f"\n[ERROR] Planner failed: {streaming_plan.error}")
+                print(f"Partial results kept in: {output_dir}")
+                print(f"Partial plan saved to: {plan_path}")
+                return None
+            problems = streaming_plan.consistency_problems(planned_frames)
+            if problems:
+                print("\n[WARNING] Final plan check found problems:")
+                for problem in problems:
+                    print(f"- {problem}")
+            else:
+                print("\nFinal plan check passed: every frame matches the complete plan.")
     except asyncio.CancelledError:
         print("\nAnimation generation cancelled.")
         if plan_path.exists():
@@ -396,6 +500,9 @@ async def run_animation_generator(
         else:
             print(f"Run directory kept in: {output_dir}")
         return None
+    finally:
+        if planner_task is not None and not planner_task.done():
+            planner_task.cancel()
 
     print("\nAnimation frame generation complete!")
     print(f"Frames saved to: {output_dir}")
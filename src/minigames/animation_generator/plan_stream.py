@@ -0,0 +1,135 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+
+from src.LLM import StructuredUpdate
+
+from .prompt_builder import AnimationFramePlan, AnimationPlanResponse
+
+
+class StreamingPlan:
+    """
+    An animation plan that fills in while the planner is still writing it.
+
+    consume() reads stream_animation_plan() in the background; the frame loop
+    waits for the combined prompt, then takes frames from frames_as_ready() as each one
+    closes. `final` is the complete, validated plan once the planner is done,
+    and `error` is set instead if it failed.
+    """
+
+    def __init__(self, frame_count: int):
+        self.frame_count = frame_count
+        self.animation_summary = ""
+        self.combined_prompt: str | None = None
+        self.continuity_rules: list[str] = []
+        self.frames: list[AnimationFramePlan] = []
+        self.final: AnimationPlanResponse | None = None
+        self.error: Exception | None = None
+        self._changed = asyncio.Condition()
+
+    @classmethod
+    def completed(cls, plan: AnimationPlanResponse) -> "StreamingPlan":
+        """A plan that was built in one piece; every frame is ready at once."""
+        streaming = cls(len(plan.frames))
+        streaming.animation_summary = plan.animation_summary
+        streaming.combined_prompt = plan.combined_prompt
+        streaming.continuity_rules = list(plan.continuity_rules)
+        streaming.frames = list(plan.frames)
+        streaming.final = plan
+        return streaming
+
+    @property
+    def finished(self) -> bool:
+        return self.final is not None or self.error is not None
+
+    async def consume(
+        self, updates: AsyncGenerator[StructuredUpdate | AnimationPlanResponse, None]
+    ) -> None:
+        try:
+            async for update in updates:
+                if isinstance(update, AnimationPlanResponse):
+                    self.final = update
+                else:
+                    self._apply(update)
+                await self._notify()
+        except Exception as exc:
+            self.error = exc
+        finally:
+            if not self.finished:
+                self.error = RuntimeError("Planner stopped before the plan was complete.")
+            await self._notify()
+
+    def _apply(self, update: StructuredUpdate) -> None:
+        if update.field == "frames" and update.index is not None:
+            if update.index == len(self.frames) and len(self.frames) < self.frame_count:
+                self.frames.append(update.value)
+        elif update.field == "animation_summary":
+            self.animation_summary = update.value
+        elif update.field == "combined_prompt":
+            self.combined_prompt = update.value
+        elif update.field == "continuity_rules" and update.index is None:
+            self.continuity_rules = update.value
+
+    async def _notify(self) -> None:
+        async with self._changed:
+            self._changed.notify_all()
+
+    async def wait_for_combined_prompt(self) -> str:
+        """The shared prompt every frame builds on; raises if the planner failed first."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.combined_prompt is not None or self.finished)
+        if self.final is not None:
+            return self.final.combined_prompt
+        if self.combined_prompt is None:
+            raise self.error or RuntimeError("Planner returned no combined prompt.")
+        return self.combined_prompt
+
+    async def frames_as_ready(self) -> AsyncIterator[AnimationFramePlan]:
+        """
+        Yield frames in order as they close. Once the planner finishes, frames
+        the stream did not report (e.g. a cached plan) come from the final plan.
+        """
+        index = 0
+        while index < self.frame_count:
+            async with self._changed:
+                await self._changed.wait_for(lambda: index < len(self.frames) or self.finished)
+            if index < len(self.frames):
+                frame = self.frames[index]
+            elif self.final is not None and index < len(self.final.frames):
+                frame = self.final.frames[index]
+            else:
+                return
+            index += 1
+            yield frame
+
+    def snapshot(self) -> AnimationPlanResponse:
+        """The final plan, or what has been planned so far (unvalidated) for the manifest."""
+        if self.final is not None:
+            return self.final
+        return AnimationPlanResponse.model_construct(
+            animation_summary=self.animation_summary,
+            combined_prompt=self.combined_prompt or "",
+            continuity_rules=list(self.continuity_rules),
+            frames=list(self.frames),
+        )
+
+    def consistency_problems(self, generated: list[AnimationFramePlan]) -> list[str]:
+        """Differences between what frames were generated from and the final plan."""
+        if self.final is None:
+            return [f"No complete plan to check against: {self.error}"]
+        problems = []
+        if self.combined_prompt is not None and self.combined_prompt != self.final.combined_prompt:
+            problems.append("The combined prompt changed after frames were started.")
+        final_frames = {frame.frame_number: frame for frame in self.final.frames}
+        for frame in generated:
+            planned = final_frames.get(frame.frame_number)
+            if planned is None:
+                problems.append(f"Frame {frame.frame_number} is not in the final plan.")
+            elif (planned.motion_beat, planned.frame_prompt) != (
+                frame.motion_beat,
+                frame.frame_prompt,
+            ):
+                problems.append(f"Frame {frame.frame_number} differs from the final plan.")
+        return problems
+
+
+__all__ = ["StreamingPlan"]
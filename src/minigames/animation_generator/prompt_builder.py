@@ -1,14 +1,22 @@
+from collections.abc import AsyncGenerator
 from typing import Literal
 
 from pydantic import BaseModel, Field
 
 from src.LLM import (
+    BaseMessage,
+    CallType,
     HumanMessage,
     LLMConfig,
     OllamaModels,
-    OllamaProvider,
+    RequestPriority,
+    StructuredUpdate,
     SystemMessage,
     chat_non_stream_no_tool,
+    chat_stream_structured,
+    request_priority,
+    routed_or_fixed,
+    with_response_cache,
 )
 
 
@@ -93,88 +101,132 @@ Rules:
 """
 
 
+def _plan_messages(
+    main_prompt: str, negative_prompt: str | None, frame_count: int
+) -> list[BaseMessage]:
+    negative_prompt_context = negative_prompt or "No negative prompt provided."
+    return [
+        SystemMessage(
+            content=SYSTEM_PROMPT.format(
+                frame_count=frame_count,
+                negative_prompt_context=negative_prompt_context,
+            )
+        ),
+        HumanMessage(content=f"Main animation request: {main_prompt}"),
+    ]
+
+
+def _normalize_plan(parsed: AnimationPlanResponse, frame_count: int) -> AnimationPlanResponse:
+    if len(parsed.frames) != frame_count:
+        raise ValueError(
+            f"Expected {frame_count} frames from planner, received {len(parsed.frames)}."
+        )
+    normalized_frames = [
+        AnimationFramePlan(
+            frame_number=index + 1,
+            motion_beat=frame.motion_beat,
+            frame_prompt=frame.frame_prompt,
+        )
+        for index, frame in enumerate(parsed.frames)
+    ]
+    normalized_rules = list(dict.fromkeys([*parsed.continuity_rules, *REQUIRED_CONTINUITY_RULES]))
+    return AnimationPlanResponse(
+        animation_summary=parsed.animation_summary,
+        combined_prompt=parsed.combined_prompt,
+        continuity_rules=normalized_rules,
+        frames=normalized_frames,
+    )
+
+
 async def build_animation_plan(
     main_prompt: str,
     negative_prompt: str | None,
     frame_count: int,
-    model: OllamaModels,
+    model: OllamaModels | None,
 ) -> AnimationPlanResponse:
-    provider = OllamaProvider(model)
-    negative_prompt_context = negative_prompt or "No negative prompt provided."
+    provider = with_response_cache(routed_or_fixed(model, CallType.PLANNING))
 
-    response = await chat_non_stream_no_tool(
-        provider=provider,
-        messages=[
-            SystemMessage(
-                content=SYSTEM_PROMPT.format(
-                    frame_count=frame_count,
-                    negative_prompt_context=negative_prompt_context,
-                )
-            ),
-            HumanMessage(content=f"Main animation request: {main_prompt}"),
-        ],
-        llm_config=LLMConfig(format=AnimationPlanResponse, think=True),
-    )
+    with request_priority(RequestPriority.BATCH):
+        response = await chat_non_stream_no_tool(
+            provider=provider,
+            messages=_plan_messages(main_prompt, negative_prompt, frame_count),
+            llm_config=LLMConfig(format=AnimationPlanResponse, think=True),
+        )
 
     if hasattr(response, "parsed") and response.parsed:
-        parsed: AnimationPlanResponse = response.parsed
-        if len(parsed.frames) != frame_count:
-            raise ValueError(
-                f"Expected {frame_count} frames from planner, received {len(parsed.frames)}."
-            )
-        normalized_frames = [
-            AnimationFramePlan(
-                frame_number=index + 1,
-                motion_beat=frame.motion_beat,
-                frame_prompt=frame.frame_prompt,
-            )
-            for index, frame in enumerate(parsed.frames)
-        ]
-        normalized_rules = list(dict.fromkeys([*parsed.continuity_rules, *REQUIRED_CONTINUITY_RULES]))
-        return AnimationPlanResponse(
-            animation_summary=parsed.animation_summary,
-            combined_prompt=parsed.combined_prompt,
-            continuity_rules=normalized_rules,
-            frames=normalized_frames,
-        )
+        return _normalize_plan(response.parsed, frame_count)
 
     raise ValueError(f"Failed to parse animation plan response: {response.content}")
 
 
+async def stream_animation_plan(
+    main_prompt: str,
+    negative_prompt: str | None,
+    frame_count: int,
+    model: OllamaModels | None,
+) -> AsyncGenerator[StructuredUpdate | AnimationPlanResponse, None]:
+    """
+    Like build_animation_plan, but yields each top-level field and each frame
+    (numbered from 1) as soon as the planner has written it, then the complete
+    normalized plan.
+    """
+    provider = with_response_cache(routed_or_fixed(model, CallType.PLANNING))
+
+    with request_priority(RequestPriority.BATCH):
+        async for update in chat_stream_structured(
+            provider=provider,
+            messages=_plan_messages(main_prompt, negative_prompt, frame_count),
+            llm_config=LLMConfig(format=AnimationPlanResponse, think=True),
+        ):
+            if isinstance(update, StructuredUpdate):
+                if update.field == "frames" and update.index is not None:
+                    update = StructuredUpdate(
+                        update.field,
+                        update.value.model_copy(update={"frame_number": update.index + 1}),
+                        update.index,
+                    )
+                yield update
+            elif update.parsed:
+                yield _normalize_plan(update.parsed, frame_count)
+            else:
+                raise ValueError(f"Failed to parse animation plan response: {update.content}")
+
+
 async def refine_frame_prompt_from_previous_frame(
     combined_prompt: str,
     frame_prompt: str,
     motion_beat: str,
     previous_frame_path: str,
     anchor_frame_path: str | None,
-    model: OllamaModels,
+    model: OllamaModels | None,
 ) -> FrameContinuityDecisionResponse:
-    provider = OllamaProvider(model)
+    provider = routed_or_fixed(model, CallType.VISION)
     reference_images = (
         [anchor_frame_path, previous_frame_path]
         if anchor_frame_path is not None
         else [previous_frame_path]
     )
 
-    response = await chat_non_stream_no_tool(
-        provider=provider,
-        messages=[
-            SystemMessage(content=CONTINUITY_REWRITE_SYSTEM_PROMPT),
-            HumanMessage(
-                content=(
-                    "Reference usage:\n"
-                    "- If two images are attached, image 1 is the canonical anchor frame.\n"
-                    "- If two images are attached, image 2 is the immediately previous frame.\n"
-                    f"Base combined prompt: {combined_prompt}\n"
-                    f"Base frame prompt: {frame_prompt}\n"
-                    f"Target motion beat: {motion_beat}\n"
-                    "Decide whether the prompts should stay as-is or be fully replaced."
+    with request_priority(RequestPriority.BATCH):
+        response = await chat_non_stream_no_tool(
+            provider=provider,
+            messages=[
+                SystemMessage(content=CONTINUITY_REWRITE_SYSTEM_PROMPT),
+                HumanMessage(
+                    content=(
+                        "Reference usage:\n"
+                        "- If two images are attached, image 1 is the canonical anchor frame.\n"
+                        "- If two images are attached, image 2 is the immediately previous frame.\n"
+                        f"Base combined prompt: {combined_prompt}\n"
+                        f"Base frame prompt: {frame_prompt}\n"
+                        f"Target motion beat: {motion_beat}\n"
+                        "Decide whether the prompts should stay as-is or be fully replaced."
+                    ),
+                    images=reference_images,
                 ),
-                images=reference_images,
-            ),
-        ],
-        llm_config=LLMConfig(format=FrameContinuityDecisionResponse, think=True),
-    )
+            ],
+            llm_config=LLMConfig(format=FrameContinuityDecisionResponse, think=True),
+        )
 
     if hasattr(response, "parsed") and response.parsed:
         parsed: FrameContinuityDecisionResponse = response.parsed
@@ -1,3 +1,16 @@
-from .main import run_logo_minigame
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .main import run_logo_minigame
+
+
+# Lazy import so the CLI can read this package's constants without loading the game
+def __getattr__(name: str) -> Any:
+    if name == "run_logo_minigame":
+        from .main import run_logo_minigame
+
+        return run_logo_minigame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["run_logo_minigame"]
@@ -6,10 +6,10 @@ from src.ImageGen import generate_image
 from src.ImageGen.models import get_model as get_image_model
 from src.ImageGen.types import ImageRequest
 from src.InfoGather import gather_conversation
-from src.LLM import AssistantMessage
+from src.LLM import AssistantMessage, BaseProvider, HedgedProvider, build_ollama_provider
 from src.LLM import get_model as get_llm_model
-from src.LLM.providers.base.conversation_logger import log_conversation
 from src.LLM.models.messages import BaseMessage
+from src.LLM.providers.base.conversation_logger import log_conversation
 from src.utility.info_book_logger import log_info_book
 
 from .constants import (
@@ -36,6 +36,7 @@ async def run_logo_minigame(
     chat_model: str = DEFAULT_CHAT_MODEL,
     prompt_model: str = DEFAULT_PROMPT_MODEL,
     image_model: str = DEFAULT_IMAGE_MODEL,
+    hedge_model: str | None = None,
 ) -> str | None:
     llm_model = get_llm_model(chat_model)
     prompt_llm_model = get_llm_model(prompt_model)
@@ -57,11 +58,22 @@ async def run_logo_minigame(
         )
         info_book = create_logo_info_book()
 
+        # Opt-in: duplicate slow chat turns to a second model and keep the faster answer.
+        chat_provider: BaseProvider | None = None
+        if hedge_model:
+            chat_provider = HedgedProvider(
+                build_ollama_provider(llm_model),
+                build_ollama_provider(get_llm_model(hedge_model)),
+            )
+
         info_book, conversation = await gather_conversation(
             info_book=info_book,
             model=llm_model,
             input_handler=input_handler,
+            provider=chat_provider,
         )
+        if isinstance(chat_provider, HedgedProvider):
+            print(chat_provider.stats.format_report())
 
         log_info_book(LOG_NAME, info_book)
         log_conversation(LOG_NAME, conversation)
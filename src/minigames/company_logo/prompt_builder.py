@@ -4,9 +4,13 @@ from src.InfoGather.info_book import InfoBook
 from src.LLM import (
     LLMConfig,
     OllamaModels,
-    OllamaProvider,
+    RequestPriority,
     SystemMessage,
+    build_ollama_provider,
     chat_non_stream_no_tool,
+    request_priority,
+    with_response_cache,
+    with_semantic_cache,
 )
 
 
@@ -48,15 +52,16 @@ async def build_enhanced_prompt_with_llm(
 
     system_prompt = SYSTEM_PROMPT.format(info_book_content=info_book_content)
 
-    provider = OllamaProvider(model)
+    provider = with_response_cache(with_semantic_cache(build_ollama_provider(model)))
 
-    response = await chat_non_stream_no_tool(
-        provider=provider,
-        messages=[
-            SystemMessage(content=system_prompt),
-        ],
-        llm_config=LLMConfig(format=LogoPromptResponse),
-    )
+    with request_priority(RequestPriority.BATCH):
+        response = await chat_non_stream_no_tool(
+            provider=provider,
+            messages=[
+                SystemMessage(content=system_prompt),
+            ],
+            llm_config=LLMConfig(format=LogoPromptResponse),
+        )
 
     if hasattr(response, "parsed") and response.parsed:
         parsed: LogoPromptResponse = response.parsed
@@ -0,0 +1,47 @@
+import asyncio
+import threading
+
+from .console import current_console
+
+
+async def async_input(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    The read runs on a daemon thread rather than asyncio.to_thread, so a
+    pending prompt never keeps the process alive after Ctrl+C. Inside
+    redirect_console() the line comes from that console instead.
+
+    Args:
+        prompt: The prompt to show, as with input().
+    """
+    console = current_console()
+    if console is not None:
+        return await console.readline(prompt)
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def deliver(result: str | None, error: BaseException | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result or "")
+
+    def read() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            outcome: tuple[str | None, BaseException | None] = (None, e)
+        else:
+            outcome = (line, None)
+        try:
+            loop.call_soon_threadsafe(deliver, *outcome)
+        except RuntimeError:
+            # The loop already closed (e.g. the session ended while waiting).
+            pass
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
@@ -0,0 +1,78 @@
+import io
+import sys
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TextIO
+
+
+@dataclass
+class Console:
+    """Where print() output and async_input() prompts go for the current task."""
+
+    write: Callable[[str], None]
+    readline: Callable[[str], Awaitable[str]]
+
+
+_current_console: ContextVar[Console | None] = ContextVar("console", default=None)
+
+
+def current_console() -> Console | None:
+    return _current_console.get()
+
+
+@contextmanager
+def redirect_console(console: Console) -> Iterator[None]:
+    """
+    Send print() output and async_input() prompts made inside the block to
+    `console`. The value lives in a context variable, so tasks created inside
+    the block inherit it while other tasks keep the real terminal. Output is
+    only redirected while a ConsoleStdout is installed as sys.stdout.
+    """
+    token = _current_console.set(console)
+    try:
+        yield
+    finally:
+        _current_console.reset(token)
+
+
+class ConsoleStdout(io.TextIOBase):
+    """A sys.stdout replacement that writes to the current task's console, if any."""
+
+    def __init__(self, fallback: TextIO):
+        self.fallback = fallback
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        console = current_console()
+        if console is None:
+            return self.fallback.write(text)
+        console.write(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if current_console() is None:
+            self.fallback.flush()
+
+
+@contextmanager
+def console_stdout() -> Iterator[None]:
+    """Install a ConsoleStdout as sys.stdout for the duration of the block."""
+    stdout = sys.stdout
+    sys.stdout = ConsoleStdout(stdout)
+    try:
+        yield
+    finally:
+        sys.stdout = stdout
+
+
+__all__ = [
+    "Console",
+    "ConsoleStdout",
+    "console_stdout",
+    "current_console",
+    "redirect_console",
+]